@@ -1,5 +1,7 @@
+from src.currency import CurrencyConverter
 from src.hh_api import FromHHru
 from src.parser_vacancy import ParserVacancy
+from src.query import parse_order_by
 from src.saver import JSONSaver
 import src.utils as utils
 
@@ -57,17 +59,26 @@ def interface() -> None:
 
                 # Инициализация компонентов
                 hh = FromHHru()
-                vacancies_data = hh.get_vacancies(keyword=user_vacancy, max_pages=None)
-                hh.close_session()
-
-                pv = ParserVacancy(data=vacancies_data)
+                try:
+                    vacancies_data = hh.get_vacancies(keyword=user_vacancy, max_pages=None)
+                    try:
+                        converter = CurrencyConverter.cached('data/currency_rates.json', hh.get_currency_rates)
+                    except Exception as e:
+                        # Без курсов валют поиск продолжается, зарплаты не пересчитываются
+                        print(f'Не удалось получить курсы валют: {e}')
+                        converter = None
+                finally:
+                    hh.close_session()
+
+                pv = ParserVacancy(data=vacancies_data, converter=converter)
                 parse_vacancies = pv.parse_vacancies()
 
                 saver = JSONSaver(path='data/vacancies.json')
                 res = {"items": [vacancy.to_dict() for vacancy in parse_vacancies]}
-                saver.save(res)
+                result = saver.upsert(res['items'])
 
                 print(f'Найдено: {len(parse_vacancies)} вакансий по запросу "{user_vacancy}" и сохранено в файл вакансий в {saver.get_path()}')
+                print(f'Новых: {result.inserted}, обновлено: {result.updated}, без изменений: {result.unchanged}')
 
                 # Запрос на добавление фильтров
                 add_filters = input('Требуется ли добавить фильтры к вакансиям? (да/нет): ').strip().lower()
@@ -131,6 +142,51 @@ def interface() -> None:
                             else:
                                 print('Топ N вакансий должно быть положительным числом.')
 
+                        elif sub_cmd in ['text', '14']:
+                            text_query = input('Введите слова для поиска по названию и требованиям: ').strip()
+                            if text_query:
+                                params['text'] = text_query
+                                print(f'Добавлен фильтр: {utils.PARAMS_ADDED["text"]} = {text_query}')
+                            else:
+                                print('Запрос для поиска не может быть пустым.')
+
+                        elif sub_cmd in ['fuzzy_name', '15']:
+                            fuzzy_name = input('Введите название вакансии (допускаются опечатки): ').strip()
+                            if fuzzy_name:
+                                params['fuzzy_name'] = fuzzy_name
+                                print(f'Добавлен фильтр: {utils.PARAMS_ADDED["fuzzy_name"]} = {fuzzy_name}')
+                            else:
+                                print('Название вакансии не может быть пустым.')
+
+                        elif sub_cmd in ['order_by', '16']:
+                            order_text = input('Введите поля сортировки через запятую (поле asc|desc [nulls first|last]): ').strip()
+                            try:
+                                order_by = parse_order_by(order_text)
+                            except ValueError as e:
+                                print(e)
+                                continue
+                            if order_by:
+                                params['order_by'] = order_by
+                                print(f'Добавлен фильтр: {utils.PARAMS_ADDED["order_by"]} = {order_text}')
+                            else:
+                                print('Порядок сортировки не может быть пустым.')
+
+                        elif sub_cmd in ['salary_overlap', '17']:
+                            bounds = input('Введите диапазон зарплаты через пробел (- вместо открытой границы): ').split()
+                            if len(bounds) == 2 and all(bound == '-' or bound.isdigit() for bound in bounds):
+                                low, high = (None if bound == '-' else int(bound) for bound in bounds)
+                                if low is not None and high is not None and low > high:
+                                    print('Нижняя граница диапазона не может быть больше верхней.')
+                                    continue
+                                params['salary_overlap'] = (low, high)
+                                print(f'Добавлен фильтр: {utils.PARAMS_ADDED["salary_overlap"]} = {bounds[0]} - {bounds[1]}')
+                            else:
+                                print('Диапазон должен состоять из двух неотрицательных чисел или -.')
+
+                        elif sub_cmd in ['collapse_duplicates', '18']:
+                            params['collapse_duplicates'] = True
+                            print(f'Добавлен фильтр: {utils.PARAMS_ADDED["collapse_duplicates"]}')
+
                         elif sub_cmd in ['add', '10']:
                             if not params:
                                 print('Нет добавленных фильтров для применения.')
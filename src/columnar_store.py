@@ -0,0 +1,620 @@
+from .abstract_class import Saver
+from .fingerprint import FingerprintIndex, record_fingerprint
+from .parallel_filter import NAN, evaluate_filter
+from .records import record_salary, select_records
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+import json
+import mmap
+import os
+import shutil
+
+
+# Числовые столбцы (float64, NaN — значение не указано). Столбцы нормализованной зарплаты
+# заполнены для каждой строки зарплатой в базовой валюте (см. records.record_salary)
+NUMERIC_COLUMNS = ('salary_from', 'salary_to', 'norm_salary_from', 'norm_salary_to')
+
+# Столбцы с небольшим числом различных значений: коды int32 и словарь значений в манифесте
+# (код -1 — значение None)
+CATEGORICAL_COLUMNS = ('name', 'desc', 'currency', 'employer', 'experience', 'schedule')
+
+# Строковые столбцы: концы значений int64 и куча байтов UTF-8. Столбец 'extra' хранит
+# в формате JSON поля записи, для которых нет столбца или значение не подходит по типу
+STRING_COLUMNS = ('id', 'url', 'requirement', 'published_at', 'alternate_url', 'fingerprint', 'extra')
+
+# Поля, которые Vacancy.to_dict сохраняет всегда (остальные — только если они заданы)
+CORE_FIELDS = ('name', 'desc', 'salary_from', 'salary_to', 'currency', 'url', 'requirement')
+
+# Порядок полей восстановленной записи совпадает с порядком Vacancy.to_dict
+RECORD_FIELDS = CORE_FIELDS + ('id', 'employer', 'published_at', 'experience', 'schedule', 'alternate_url',
+                               'fingerprint')
+
+# Флаги строки (uint8): бит i — значение строкового столбца i равно None,
+# старший бит — в записи есть нормализованная зарплата
+NORM_FLAG = 1 << 7
+
+MANIFEST_VERSION = 1
+
+
+def _number(value: Any) -> Optional[float]:
+    """
+    Приводит значение поля зарплаты к значению числового столбца.
+
+    Args:
+        value (Any): Значение поля.
+
+    Returns:
+        Optional[float]: Число, NaN для None или None, если значение не число.
+    """
+    if value is None:
+        return NAN
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _restore_number(value: float) -> Optional[float]:
+    """
+    Восстанавливает значение поля зарплаты из числового столбца.
+
+    Args:
+        value (float): Значение столбца.
+
+    Returns:
+        Optional[float]: None для NaN, целое число для целых значений, иначе float.
+    """
+    if value != value:
+        return None
+    return int(value) if value.is_integer() else value
+
+
+class ColumnarSaver(Saver):
+    """
+    Реализация абстрактного класса Saver с хранением вакансий по столбцам в бинарных файлах.
+
+    Хранилище оптимизировано для чтения: зарплата хранится столбцами float64 фиксированной
+    ширины, повторяющиеся строки (название, регион, валюта и т. п.) — кодами словаря, прочие
+    строки — в кучах байтов с массивом смещений. Файлы отображаются в память (mmap), поэтому
+    открытие хранилища не зависит от его размера, а фильтр по названию и зарплате читает
+    только свои столбцы; записи собираются только для подходящих строк.
+
+    Новые вакансии дописываются в конец столбцов. Манифест с количеством строк и словарями
+    записывается последним через атомарную замену файла, поэтому прерванная запись не видна
+    при чтении и обрезается при следующем сохранении.
+    """
+
+    def __init__(self, path: str = 'data/vacancies.columns'):
+        """
+        Инициализирует экземпляр ColumnarSaver.
+
+        Args:
+            path (str, optional): Путь к директории хранилища. По умолчанию 'data/vacancies.columns'.
+
+        Raises:
+            IOError: Если не удалось прочитать манифест хранилища.
+        """
+        self.__path = path
+        self.__backup_path = path.rstrip(os.sep) + '.old'
+        self.__recover()
+        os.makedirs(path, exist_ok=True)
+        self.__fingerprint_path = os.path.join(path, 'fingerprints')
+        self.__fingerprints: Optional[FingerprintIndex] = None
+        self.__rows: Optional[Dict[Any, int]] = None
+        self.__maps: Dict[str, mmap.mmap] = {}
+        self.__manifest = self.__load_manifest()
+
+    def __enter__(self) -> 'ColumnarSaver':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__manifest['count']
+
+    def close(self) -> None:
+        """
+        Закрывает отображенные в память файлы.
+        """
+        for mapped in self.__maps.values():
+            try:
+                mapped.close()
+            except BufferError:
+                # Файл еще читается незавершенным итератором; он будет закрыт сборщиком мусора
+                pass
+        self.__maps.clear()
+
+    def get_path(self) -> str:
+        """
+        Возвращает путь к директории хранилища.
+
+        Returns:
+            str: Путь к директории.
+        """
+        return self.__path
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """
+        Дописывает новые вакансии в конец столбцов. Не добавляет дубликаты вакансий
+        (по отпечатку содержимого, см. fingerprint.record_fingerprint).
+
+        Вакансия с уже сохраненным идентификатором заменяет прежнюю версию на ее месте; столбцы
+        фиксированной ширины не изменяются на месте, поэтому хранилище перестраивается (как при
+        удалении вакансии), если в данных есть хотя бы одна измененная вакансия.
+
+        Args:
+            data (Dict[str, Any]): Данные для сохранения: вакансии в списке 'items'.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файлы хранилища.
+        """
+        try:
+            fingerprints = self.__get_fingerprints()
+            rows = self.__get_rows()
+            new_items = []
+            added: Dict[Any, int] = {}
+            replaced: Dict[int, Dict[str, Any]] = {}
+            for item in data.get('items', []):
+                record_id = item.get('id')
+                if not fingerprints.add(record_fingerprint(item)):
+                    continue
+                if record_id is not None and record_id in rows:
+                    replaced[rows[record_id]] = item
+                elif record_id is not None and record_id in added:
+                    # Из нескольких версий новой вакансии сохраняется последняя
+                    fingerprints.discard(record_fingerprint(new_items[added[record_id]]))
+                    new_items[added[record_id]] = item
+                else:
+                    if record_id is not None:
+                        added[record_id] = len(new_items)
+                    new_items.append(item)
+            if replaced:
+                records = (replaced.get(row, record) for row, record in enumerate(self.iter_vacancies()))
+                self.__rebuild(list(records) + new_items)
+            elif new_items:
+                self.__append(new_items)
+                fingerprints.save(self.__fingerprint_path)
+                rows.update((record_id, len(self) - len(new_items) + index) for record_id, index in added.items())
+        except IOError as e:
+            # Индексы перечитываются с диска, чтобы не содержать несохраненных вакансий
+            self.__fingerprints = None
+            self.__rows = None
+            raise IOError(f'Ошибка при записи в {self.__path}: {e}')
+
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """
+        Возвращает поток записей вакансий в порядке добавления.
+
+        Yields:
+            Dict[str, Any]: Очередная запись вакансии.
+        """
+        return self.__records(range(len(self)))
+
+    def get_vacancies(self, criteria: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии по заданным критериям.
+
+        Критерии 'name', 'salary_from' и 'salary_to' вычисляются по столбцам кодов названий
+        и зарплаты в базовой валюте; критерии 'collapse_duplicates', 'order_by' и 'top_n'
+        (см. JSONSaver.get_vacancies) применяются к отобранным записям.
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Словарь с критериями фильтрации.
+                                                         По умолчанию None.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий, соответствующих критериям.
+        """
+        if not criteria:
+            return list(self.iter_vacancies())
+        filtered = select_records(self.__records(self.__filter(criteria)), criteria)
+        print(f'Найдено {len(filtered)} вакансий, соответствующих критериям.')
+        return filtered
+
+    def scan(self, columns: Iterable[str]) -> Dict[str, List[Any]]:
+        """
+        Читает значения указанных столбцов для всех строк, не собирая записи целиком.
+
+        Args:
+            columns (Iterable[str]): Имена столбцов. Столбцы 'norm_salary_from' и 'norm_salary_to'
+                                     содержат зарплату в базовой валюте для каждой строки.
+
+        Returns:
+            Dict[str, List[Any]]: Значения каждого столбца по строкам (None — значение не указано).
+
+        Raises:
+            KeyError: Если столбца нет в хранилище.
+        """
+        count = len(self)
+        result = {}
+        for column in columns:
+            if column in NUMERIC_COLUMNS:
+                view = self.__view(f'{column}.f64', count * 8, 'd')
+                result[column] = [None if value != value else value for value in view.tolist()]
+            elif column in CATEGORICAL_COLUMNS:
+                view = self.__view(f'{column}.i32', count * 4, 'i')
+                values = self.__manifest['dictionaries'][column] + [None]
+                result[column] = [values[code] for code in view.tolist()]
+            elif column in STRING_COLUMNS:
+                result[column] = self.__strings(column, range(count))
+                continue
+            else:
+                raise KeyError(f'Столбец {column} отсутствует в хранилище')
+            view.release()
+        return result
+
+    def delete(self, record_id: Optional[str] = None) -> None:
+        """
+        Удаляет все вакансии или конкретную вакансию по идентификатору.
+
+        Удаление конкретной вакансии перестраивает хранилище во временной директории,
+        которая затем заменяет исходную.
+
+        Args:
+            record_id (Optional[str], optional): Идентификатор вакансии для удаления.
+                                                Если не указан, удаляются все вакансии.
+                                                По умолчанию None.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении данных.
+        """
+        try:
+            if record_id:
+                rows = [row for row, value in enumerate(self.scan(['id'])['id']) if value == record_id]
+                if not rows:
+                    print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
+                    return
+                removed = set(rows)
+                self.__rebuild(self.__records(row for row in range(len(self)) if row not in removed))
+                print(f'Вакансия с id {record_id} удалена из {self.__path}.')
+            else:
+                self.close()
+                shutil.rmtree(self.__path)
+                os.makedirs(self.__path)
+                self.__manifest = self.__empty_manifest()
+                self.__fingerprints = None
+                self.__rows = None
+                print(f'Все вакансии удалены из {self.__path}.')
+        except (IOError, OSError) as e:
+            raise IOError(f'Ошибка при удалении данных из {self.__path}: {e}')
+
+    def __file(self, name: str) -> str:
+        return os.path.join(self.__path, name)
+
+    def __recover(self) -> None:
+        """
+        Завершает прерванную замену директории хранилища (см. __rebuild).
+        """
+        if os.path.isdir(self.__backup_path):
+            if os.path.isdir(self.__path):
+                shutil.rmtree(self.__backup_path)
+            else:
+                os.replace(self.__backup_path, self.__path)
+
+    @staticmethod
+    def __empty_manifest() -> Dict[str, Any]:
+        return {
+            'version': MANIFEST_VERSION,
+            'count': 0,
+            'dictionaries': {column: [] for column in CATEGORICAL_COLUMNS},
+            'heaps': {column: 0 for column in STRING_COLUMNS},
+        }
+
+    def __load_manifest(self) -> Dict[str, Any]:
+        """
+        Загружает манифест хранилища.
+
+        Returns:
+            Dict[str, Any]: Манифест или пустой манифест, если хранилище новое.
+
+        Raises:
+            IOError: Если манифест поврежден или имеет неизвестную версию.
+        """
+        path = self.__file('manifest.json')
+        if not os.path.exists(path):
+            return self.__empty_manifest()
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (IOError, ValueError) as e:
+            raise IOError(f'Ошибка при чтении манифеста {path}: {e}')
+        if manifest.get('version') != MANIFEST_VERSION:
+            raise IOError(f'Неизвестная версия хранилища в {path}: {manifest.get("version")}')
+        return manifest
+
+    def __sizes(self) -> Dict[str, int]:
+        """
+        Возвращает размеры файлов столбцов, подтвержденные манифестом.
+
+        Returns:
+            Dict[str, int]: Размер каждого файла в байтах.
+        """
+        count = self.__manifest['count']
+        sizes = {'flags.u8': count}
+        sizes.update((f'{column}.f64', count * 8) for column in NUMERIC_COLUMNS)
+        sizes.update((f'{column}.i32', count * 4) for column in CATEGORICAL_COLUMNS)
+        for column in STRING_COLUMNS:
+            sizes[f'{column}.end'] = count * 8
+            sizes[f'{column}.heap'] = self.__manifest['heaps'][column]
+        return sizes
+
+    def __append(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Дописывает записи в конец столбцов и фиксирует их записью манифеста.
+
+        Перед дописыванием файлы обрезаются до размеров из манифеста: так отбрасываются
+        данные прерванной записи.
+
+        Args:
+            items (List[Dict[str, Any]]): Новые записи.
+
+        Raises:
+            IOError: Если произошла ошибка при записи или файлы столбцов короче манифеста.
+        """
+        manifest = self.__manifest
+        dictionaries = {column: list(values) for column, values in manifest['dictionaries'].items()}
+        codes = {column: {value: code for code, value in enumerate(values)}
+                 for column, values in dictionaries.items()}
+        heaps = dict(manifest['heaps'])
+        numeric = {column: array('d') for column in NUMERIC_COLUMNS}
+        categorical = {column: array('i') for column in CATEGORICAL_COLUMNS}
+        ends = {column: array('q') for column in STRING_COLUMNS}
+        chunks: Dict[str, List[bytes]] = {column: [] for column in STRING_COLUMNS}
+        flags = array('B')
+        known = set(RECORD_FIELDS) | {'norm_salary_from', 'norm_salary_to'}
+
+        for item in items:
+            extra = {key: value for key, value in item.items() if key not in known}
+            row_flags = 0
+
+            for key in ('salary_from', 'salary_to'):
+                value = _number(item.get(key))
+                if value is None:
+                    extra[key] = item[key]
+                    value = NAN
+                numeric[key].append(value)
+            norm = [_number(item.get('norm_salary_from')), _number(item.get('norm_salary_to'))]
+            if 'norm_salary_from' in item and 'norm_salary_to' in item and None not in norm:
+                row_flags |= NORM_FLAG
+            else:
+                for key in ('norm_salary_from', 'norm_salary_to'):
+                    if key in item:
+                        extra[key] = item[key]
+                norm = [numeric['salary_from'][-1], numeric['salary_to'][-1]]
+            numeric['norm_salary_from'].append(norm[0])
+            numeric['norm_salary_to'].append(norm[1])
+
+            for column in CATEGORICAL_COLUMNS:
+                value = item.get(column)
+                if value is None:
+                    categorical[column].append(-1)
+                    continue
+                if type(value) is not str:
+                    extra[column] = value
+                    categorical[column].append(-1)
+                    continue
+                code = codes[column].get(value)
+                if code is None:
+                    code = codes[column][value] = len(dictionaries[column])
+                    dictionaries[column].append(value)
+                categorical[column].append(code)
+
+            for bit, column in enumerate(STRING_COLUMNS):
+                if column == 'extra':
+                    value = json.dumps(extra, ensure_ascii=False) if extra else None
+                else:
+                    value = item.get(column)
+                    if value is not None and type(value) is not str:
+                        extra[column] = value
+                        value = None
+                if value is None:
+                    row_flags |= 1 << bit
+                else:
+                    encoded = value.encode('utf-8')
+                    chunks[column].append(encoded)
+                    heaps[column] += len(encoded)
+                ends[column].append(heaps[column])
+            flags.append(row_flags)
+
+        self.close()
+        sizes = self.__sizes()
+        contents = {'flags.u8': flags.tobytes()}
+        contents.update((f'{column}.f64', values.tobytes()) for column, values in numeric.items())
+        contents.update((f'{column}.i32', values.tobytes()) for column, values in categorical.items())
+        for column in STRING_COLUMNS:
+            contents[f'{column}.end'] = ends[column].tobytes()
+            contents[f'{column}.heap'] = b''.join(chunks[column])
+        for name, content in contents.items():
+            with open(self.__file(name), 'ab') as file:
+                if file.tell() < sizes[name]:
+                    raise IOError(f'Файл столбца {name} поврежден')
+                file.truncate(sizes[name])
+                file.write(content)
+
+        updated = {
+            'version': MANIFEST_VERSION,
+            'count': manifest['count'] + len(items),
+            'dictionaries': dictionaries,
+            'heaps': heaps,
+        }
+        path = self.__file('manifest.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump(updated, file, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+        self.__manifest = updated
+
+    def __rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Перестраивает хранилище из указанных записей во временной директории и заменяет им исходное.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): Записи нового хранилища по порядку.
+        """
+        tmp_path = self.__path.rstrip(os.sep) + '.tmp'
+        if os.path.isdir(tmp_path):
+            shutil.rmtree(tmp_path)
+        with ColumnarSaver(tmp_path) as rebuilt:
+            rebuilt.save({'items': list(records)})
+        self.close()
+        os.replace(self.__path, self.__backup_path)
+        os.replace(tmp_path, self.__path)
+        shutil.rmtree(self.__backup_path)
+        self.__manifest = self.__load_manifest()
+        self.__fingerprints = None
+        self.__rows = None
+
+    def __get_fingerprints(self) -> FingerprintIndex:
+        """
+        Возвращает индекс отпечатков, загружая его с диска при первом обращении.
+
+        Если индекс не соответствует количеству строк (например, запись прервалась после
+        фиксации манифеста), он строится заново по хранилищу.
+
+        Returns:
+            FingerprintIndex: Индекс отпечатков.
+        """
+        if self.__fingerprints is None:
+            self.__fingerprints = FingerprintIndex.load(self.__fingerprint_path)
+            if len(self.__fingerprints) != len(self):
+                self.__fingerprints = FingerprintIndex(record_fingerprint(item) for item in self.iter_vacancies())
+        return self.__fingerprints
+
+    def __get_rows(self) -> Dict[Any, int]:
+        """
+        Возвращает строки вакансий по идентификатору, читая столбец идентификаторов при первом обращении.
+
+        Returns:
+            Dict[Any, int]: Индекс строки для каждого сохраненного идентификатора.
+        """
+        if self.__rows is None:
+            self.__rows = {record_id: row for row, record_id in enumerate(self.scan(['id'])['id'])
+                           if record_id is not None}
+        return self.__rows
+
+    def __view(self, name: str, size: int, fmt: str) -> memoryview:
+        """
+        Возвращает представление подтвержденной части файла столбца.
+
+        Args:
+            name (str): Имя файла столбца.
+            size (int): Подтвержденный размер в байтах.
+            fmt (str): Формат элементов (см. memoryview.cast).
+
+        Returns:
+            memoryview: Представление файла, отображенного в память.
+        """
+        if size == 0:
+            return memoryview(b'').cast(fmt)
+        mapped = self.__maps.get(name)
+        if mapped is None:
+            with open(self.__file(name), 'rb') as file:
+                mapped = self.__maps[name] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapped)[:size].cast(fmt)
+
+    def __filter(self, criteria: Dict[str, Any]) -> Sequence[int]:
+        """
+        Вычисляет критерии 'name', 'salary_from' и 'salary_to' по столбцам.
+
+        Args:
+            criteria (Dict[str, Any]): Критерии фильтрации.
+
+        Returns:
+            Sequence[int]: Индексы подходящих строк по возрастанию.
+        """
+        count = len(self)
+        if not any(key in criteria for key in ('name', 'salary_from', 'salary_to')):
+            return range(count)
+        name_mask = None
+        if 'name' in criteria:
+            # Подстрока проверяется один раз для каждого различного названия; последний
+            # байт маски соответствует коду -1 (название не указано)
+            needle = criteria['name'].lower()
+            names = self.__manifest['dictionaries']['name']
+            name_mask = bytes(needle in value.lower() for value in names) + bytes([needle == ''])
+        buffers = [self.__view('norm_salary_from.f64', count * 8, 'B'),
+                   self.__view('norm_salary_to.f64', count * 8, 'B'),
+                   self.__view('name.i32', count * 4, 'B')]
+        try:
+            return evaluate_filter(buffers, count, 0, count, name_mask,
+                                   criteria.get('salary_from'), criteria.get('salary_to'), False)
+        finally:
+            for buffer in buffers:
+                buffer.release()
+
+    def __strings(self, column: str, rows: Iterable[int]) -> List[Optional[str]]:
+        """
+        Читает значения строкового столбца для указанных строк.
+
+        Args:
+            column (str): Имя строкового столбца.
+            rows (Iterable[int]): Индексы строк.
+
+        Returns:
+            List[Optional[str]]: Значения столбца.
+        """
+        count = len(self)
+        bit = 1 << STRING_COLUMNS.index(column)
+        flags = self.__view('flags.u8', count, 'B')
+        ends = self.__view(f'{column}.end', count * 8, 'q')
+        heap = self.__view(f'{column}.heap', self.__manifest['heaps'][column], 'B')
+        try:
+            values = []
+            for row in rows:
+                if flags[row] & bit:
+                    values.append(None)
+                else:
+                    values.append(str(heap[ends[row - 1] if row else 0:ends[row]], 'utf-8'))
+            return values
+        finally:
+            for view in (flags, ends, heap):
+                view.release()
+
+    def __records(self, rows: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        """
+        Собирает записи вакансий для указанных строк в формате Vacancy.to_dict.
+
+        Обязательные поля (см. CORE_FIELDS) есть в каждой записи, остальные — только если
+        они заданы. Целые значения зарплаты восстанавливаются как int.
+
+        Args:
+            rows (Iterable[int]): Индексы строк.
+
+        Yields:
+            Dict[str, Any]: Очередная запись вакансии.
+        """
+        count = len(self)
+        dictionaries = {column: values + [None] for column, values in self.__manifest['dictionaries'].items()}
+        numeric = {column: self.__view(f'{column}.f64', count * 8, 'd') for column in NUMERIC_COLUMNS}
+        categorical = {column: self.__view(f'{column}.i32', count * 4, 'i') for column in CATEGORICAL_COLUMNS}
+        flags = self.__view('flags.u8', count, 'B')
+        ends = {column: self.__view(f'{column}.end', count * 8, 'q') for column in STRING_COLUMNS}
+        heaps = {column: self.__view(f'{column}.heap', self.__manifest['heaps'][column], 'B')
+                 for column in STRING_COLUMNS}
+        try:
+            for row in rows:
+                row_flags = flags[row]
+                values: Dict[str, Any] = {}
+                for column in CATEGORICAL_COLUMNS:
+                    values[column] = dictionaries[column][categorical[column][row]]
+                for bit, column in enumerate(STRING_COLUMNS):
+                    if row_flags & (1 << bit):
+                        values[column] = None
+                    else:
+                        column_ends = ends[column]
+                        start = column_ends[row - 1] if row else 0
+                        values[column] = str(heaps[column][start:column_ends[row]], 'utf-8')
+                values['salary_from'] = _restore_number(numeric['salary_from'][row])
+                values['salary_to'] = _restore_number(numeric['salary_to'][row])
+
+                record = {field: values[field] for field in CORE_FIELDS}
+                record.update((field, values[field]) for field in RECORD_FIELDS[len(CORE_FIELDS):]
+                              if values[field] is not None)
+                if row_flags & NORM_FLAG:
+                    record['norm_salary_from'] = _restore_number(numeric['norm_salary_from'][row])
+                    record['norm_salary_to'] = _restore_number(numeric['norm_salary_to'][row])
+                if values['extra'] is not None:
+                    record.update(json.loads(values['extra']))
+                yield record
+        finally:
+            for view in (*numeric.values(), *categorical.values(), flags, *ends.values(), *heaps.values()):
+                view.release()
@@ -0,0 +1,218 @@
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, TextIO
+
+try:
+    import zstandard
+except ImportError:
+    # Кодек zstd доступен, только если установлен пакет zstandard
+    zstandard = None
+
+
+# Кодеки по расширению файла
+CODEC_EXTENSIONS = {'.gz': 'gzip', '.xz': 'lzma', '.zst': 'zstd'}
+
+# Уровни сжатия по умолчанию: баланс степени сжатия и скорости записи
+DEFAULT_LEVELS = {'gzip': 6, 'lzma': 6, 'zstd': 3}
+
+# Размер блока при потоковом сжатии и распаковке
+BLOCK_SIZE = 1 << 16
+
+
+def available_codecs() -> List[str]:
+    """
+    Возвращает кодеки, доступные в текущем окружении.
+
+    Returns:
+        List[str]: Имена кодеков ('zstd' — только если установлен пакет zstandard).
+    """
+    codecs = ['gzip', 'lzma']
+    if zstandard is not None:
+        codecs.append('zstd')
+    return codecs
+
+
+def codec_for_path(path: str) -> Optional[str]:
+    """
+    Определяет кодек по расширению файла.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        Optional[str]: Имя кодека или None для несжатого файла.
+    """
+    return CODEC_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+def open_binary(path: str, mode: str = 'r', codec: Optional[str] = None, level: Optional[int] = None) -> io.IOBase:
+    """
+    Открывает файл для потокового сжатия при записи или распаковки при чтении.
+
+    Данные сжимаются и распаковываются блоками по мере записи и чтения, поэтому файл
+    целиком в распакованном виде в памяти не находится.
+
+    Args:
+        path (str): Путь к файлу.
+        mode (str, optional): 'r' — чтение, 'w' — запись. По умолчанию 'r'.
+        codec (Optional[str], optional): Кодек: 'gzip', 'lzma' или 'zstd'. По умолчанию
+                                         определяется по расширению файла (см. CODEC_EXTENSIONS).
+        level (Optional[int], optional): Уровень сжатия. По умолчанию DEFAULT_LEVELS.
+
+    Returns:
+        io.IOBase: Двоичный файловый объект.
+
+    Raises:
+        ValueError: Если режим или кодек неизвестен либо кодек недоступен.
+    """
+    if mode not in ('r', 'w'):
+        raise ValueError("Режим должен быть 'r' или 'w'.")
+    codec = codec or codec_for_path(path)
+    if codec is None:
+        return open(path, mode + 'b')
+    if codec not in DEFAULT_LEVELS:
+        raise ValueError(f'Неизвестный кодек: {codec}')
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    if codec == 'gzip':
+        return gzip.open(path, mode + 'b', compresslevel=level)
+    if codec == 'lzma':
+        return lzma.open(path, mode + 'b', preset=level if mode == 'w' else None)
+    if zstandard is None:
+        raise ValueError('Кодек zstd недоступен: установите пакет zstandard.')
+    file = open(path, mode + 'b')
+    if mode == 'w':
+        return zstandard.ZstdCompressor(level=level).stream_writer(file, closefd=True)
+    return zstandard.ZstdDecompressor().stream_reader(file, closefd=True)
+
+
+def open_text(path: str, mode: str = 'r', codec: Optional[str] = None, level: Optional[int] = None) -> TextIO:
+    """
+    Открывает текстовый файл в кодировке UTF-8, сжатый кодеком или несжатый.
+
+    Args:
+        path (str): Путь к файлу.
+        mode (str, optional): 'r' — чтение, 'w' — запись. По умолчанию 'r'.
+        codec (Optional[str], optional): Кодек (см. open_binary). По умолчанию определяется
+                                         по расширению файла.
+        level (Optional[int], optional): Уровень сжатия. По умолчанию DEFAULT_LEVELS.
+
+    Returns:
+        TextIO: Текстовый файловый объект.
+
+    Raises:
+        ValueError: Если режим или кодек неизвестен либо кодек недоступен.
+    """
+    if (codec or codec_for_path(path)) is None:
+        if mode not in ('r', 'w'):
+            raise ValueError("Режим должен быть 'r' или 'w'.")
+        return open(path, mode, encoding='utf-8')
+    return io.TextIOWrapper(open_binary(path, mode, codec, level), encoding='utf-8')
+
+
+@dataclass
+class CodecStats:
+    """
+    Результат измерения кодека на файле.
+
+    Attributes:
+        codec (str): Имя кодека.
+        raw_size (int): Размер исходных данных в байтах.
+        compressed_size (int): Размер сжатых данных в байтах.
+        compress_seconds (float): Время сжатия.
+        decompress_seconds (float): Время распаковки.
+    """
+    codec: str
+    raw_size: int
+    compressed_size: int
+    compress_seconds: float
+    decompress_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """
+        Степень сжатия: отношение исходного размера к сжатому.
+        """
+        return self.raw_size / self.compressed_size if self.compressed_size else 0.0
+
+    @property
+    def compress_speed(self) -> float:
+        """
+        Скорость сжатия в МБ исходных данных в секунду.
+        """
+        return self.raw_size / 1e6 / self.compress_seconds if self.compress_seconds else 0.0
+
+    @property
+    def decompress_speed(self) -> float:
+        """
+        Скорость распаковки в МБ исходных данных в секунду.
+        """
+        return self.raw_size / 1e6 / self.decompress_seconds if self.decompress_seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f'{self.codec}: {self.raw_size} -> {self.compressed_size} байт (сжатие в {self.ratio:.1f} раза), '
+                f'сжатие {self.compress_speed:.1f} МБ/с, распаковка {self.decompress_speed:.1f} МБ/с')
+
+
+def measure_codec(path: str, codec: str, level: Optional[int] = None, tmp_dir: Optional[str] = None) -> CodecStats:
+    """
+    Измеряет степень сжатия и скорость кодека на файле.
+
+    Файл сжимается блоками во временный файл, который затем распаковывается блоками.
+
+    Args:
+        path (str): Путь к исходному несжатому файлу.
+        codec (str): Имя кодека.
+        level (Optional[int], optional): Уровень сжатия. По умолчанию DEFAULT_LEVELS.
+        tmp_dir (Optional[str], optional): Каталог временного файла. По умолчанию системный.
+
+    Returns:
+        CodecStats: Результат измерения.
+
+    Raises:
+        IOError: Если произошла ошибка при чтении или записи файлов.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        raw_size = 0
+        with open(path, 'rb') as source, open_binary(tmp_path, 'w', codec, level) as target:
+            for block in iter(lambda: source.read(BLOCK_SIZE), b''):
+                target.write(block)
+                raw_size += len(block)
+        compress_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open_binary(tmp_path, 'r', codec) as source:
+            for _ in iter(lambda: source.read(BLOCK_SIZE), b''):
+                pass
+        decompress_seconds = time.perf_counter() - start
+        return CodecStats(codec, raw_size, os.path.getsize(tmp_path), compress_seconds, decompress_seconds)
+    except IOError as e:
+        raise IOError(f'Ошибка при измерении кодека {codec} на {path}: {e}')
+    finally:
+        os.remove(tmp_path)
+
+
+def compare_codecs(path: str, codecs: Optional[Iterable[str]] = None,
+                   tmp_dir: Optional[str] = None) -> List[CodecStats]:
+    """
+    Измеряет доступные кодеки на файле и выводит степень сжатия и скорость каждого.
+
+    Args:
+        path (str): Путь к исходному несжатому файлу (например, data/vacancies.json).
+        codecs (Optional[Iterable[str]], optional): Кодеки. По умолчанию все доступные.
+        tmp_dir (Optional[str], optional): Каталог временных файлов. По умолчанию системный.
+
+    Returns:
+        List[CodecStats]: Результаты измерений.
+    """
+    results = [measure_codec(path, codec, tmp_dir=tmp_dir) for codec in (codecs or available_codecs())]
+    for stats in results:
+        print(stats)
+    return results
@@ -0,0 +1,162 @@
+import json
+import os
+import time
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar, Union
+from .vacancy import LazyVacancy, Vacancy
+
+
+BASE_CURRENCY = 'RUR'
+
+V = TypeVar('V', bound=Union[Vacancy, LazyVacancy])
+
+# Коды, которые в данных встречаются вместо кодов справочника hh.ru
+CURRENCY_ALIASES = {
+    'RUB': 'RUR',
+    'BYN': 'BYR',
+}
+
+
+class CurrencyConverter:
+    """
+    Приводит зарплаты вакансий к базовой валюте по таблице курсов из справочника hh.ru.
+
+    Курс в справочнике hh.ru — количество единиц валюты за 1 единицу базовой валюты (рубль),
+    поэтому сумма в базовой валюте равна сумме, деленной на курс.
+
+    Attributes:
+        rates (Dict[str, float]): Курсы валют по кодам справочника hh.ru.
+        base (str): Код базовой валюты.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, base: str = BASE_CURRENCY):
+        """
+        Инициализирует экземпляр CurrencyConverter.
+
+        Args:
+            rates (Optional[Dict[str, float]], optional): Курсы валют по кодам. По умолчанию None
+                                                          (известна только базовая валюта).
+            base (str, optional): Код базовой валюты. По умолчанию 'RUR'.
+        """
+        self.rates = dict(rates or {})
+        self.base = base
+        self.__factors = self.__build_factors()
+
+    def __build_factors(self) -> Dict[str, float]:
+        """
+        Строит таблицу множителей пересчета в базовую валюту, включая синонимы кодов.
+
+        Returns:
+            Dict[str, float]: Множители по кодам валют.
+        """
+        factors = {code: 1 / rate for code, rate in self.rates.items() if rate}
+        factors[self.base] = 1.0
+        for alias, code in CURRENCY_ALIASES.items():
+            if code in factors:
+                factors.setdefault(alias, factors[code])
+        return factors
+
+    def factor(self, currency: str) -> Optional[float]:
+        """
+        Возвращает множитель пересчета валюты в базовую.
+
+        Args:
+            currency (str): Код валюты.
+
+        Returns:
+            Optional[float]: Множитель или None, если курс валюты неизвестен.
+        """
+        return self.__factors.get(currency)
+
+    def normalize(self, vacancies: Iterable[V]) -> Iterator[V]:
+        """
+        Пересчитывает зарплаты вакансий в базовую валюту за один проход.
+
+        Множитель записывается в salary_rate; при присваивании нормализованная зарплата
+        (norm_salary_from, norm_salary_to) и ключ сортировки пересчитываются один раз.
+        Для валют с неизвестным курсом сохраняются исходные значения.
+
+        Args:
+            vacancies (Iterable[V]): Вакансии или их ленивые представления (список или поток).
+
+        Yields:
+            V: Та же вакансия с нормализованной зарплатой.
+        """
+        factors = self.__factors
+        for vac in vacancies:
+            rate = factors.get(vac.currency)
+            if rate is not None and rate != vac.salary_rate:
+                vac.salary_rate = rate
+            yield vac
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет таблицу курсов в JSON файл.
+
+        Args:
+            path (str): Путь к файлу таблицы курсов.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({"base": self.base, "rates": self.rates}, file, ensure_ascii=False, indent=4)
+        except IOError as e:
+            raise IOError(f'Ошибка при записи курсов валют в {path}: {e}')
+
+    @classmethod
+    def load(cls, path: str) -> 'CurrencyConverter':
+        """
+        Загружает таблицу курсов из JSON файла.
+
+        Args:
+            path (str): Путь к файлу таблицы курсов.
+
+        Returns:
+            CurrencyConverter: Конвертер с загруженными курсами или пустой, если файла нет.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла.
+        """
+        try:
+            if not os.path.exists(path):
+                return cls()
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            return cls(rates=data.get('rates'), base=data.get('base', BASE_CURRENCY))
+        except IOError as e:
+            raise IOError(f'Ошибка при чтении курсов валют из {path}: {e}')
+
+    @classmethod
+    def cached(cls, path: str, fetch_rates: Callable[[], Dict[str, float]],
+               max_age: float = 24 * 60 * 60) -> 'CurrencyConverter':
+        """
+        Возвращает конвертер из локального кэша курсов, обновляя кэш, если он устарел.
+
+        Args:
+            path (str): Путь к файлу кэша курсов.
+            fetch_rates (Callable[[], Dict[str, float]]): Функция получения актуальных курсов
+                                                          (например, FromHHru.get_currency_rates).
+            max_age (float, optional): Максимальный возраст кэша в секундах. По умолчанию сутки.
+
+        Returns:
+            CurrencyConverter: Конвертер с актуальной таблицей курсов.
+        """
+        if os.path.exists(path) and time.time() - os.path.getmtime(path) < max_age:
+            converter = cls.load(path)
+            if converter.rates:
+                return converter
+        try:
+            rates = fetch_rates()
+        except Exception:
+            # При недоступности API используем устаревший кэш, если он есть
+            converter = cls.load(path)
+            if converter.rates:
+                return converter
+            raise
+        converter = cls(rates=rates)
+        converter.save(path)
+        return converter
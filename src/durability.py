@@ -0,0 +1,221 @@
+import json
+import os
+import zlib
+from typing import Any, List
+
+
+# Политики синхронизации журнала с диском:
+# 'always' — каждая запись синхронизируется сразу;
+# 'batch' — записи синхронизируются группой одним вызовом fsync;
+# 'never' — синхронизацию выполняет операционная система.
+FSYNC_ALWAYS = 'always'
+FSYNC_BATCH = 'batch'
+FSYNC_NEVER = 'never'
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_BATCH, FSYNC_NEVER)
+
+# Количество записей журнала в группе по умолчанию
+DEFAULT_GROUP_SIZE = 32
+
+
+def fsync_path(path: str) -> None:
+    """
+    Синхронизирует с диском содержимое файла или каталога по пути.
+
+    Каталог синхронизируется, чтобы переименование или создание файла в нем пережило сбой
+    питания. На платформах, где каталог нельзя открыть (Windows), синхронизация каталога
+    пропускается.
+
+    Args:
+        path (str): Путь к файлу или каталогу.
+    """
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except (IsADirectoryError, PermissionError):
+        return
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def atomic_replace(tmp_path: str, path: str, fsync: bool = True) -> None:
+    """
+    Атомарно заменяет файл полностью записанным временным файлом.
+
+    Временный файл синхронизируется до переименования, поэтому после сбоя по пути path
+    находится либо прежняя, либо новая версия файла целиком, но не частично записанная.
+
+    Args:
+        tmp_path (str): Путь к записанному временному файлу в том же каталоге.
+        path (str): Путь к заменяемому файлу.
+        fsync (bool, optional): Синхронизировать файл и каталог с диском. По умолчанию True.
+    """
+    if fsync:
+        fsync_path(tmp_path)
+    os.replace(tmp_path, path)
+    if fsync:
+        fsync_path(os.path.dirname(os.path.abspath(path)))
+
+
+def _encode(entry: Any) -> bytes:
+    """
+    Кодирует запись журнала строкой '<crc32> <json>\\n'.
+
+    Args:
+        entry (Any): Запись, сериализуемая в JSON.
+
+    Returns:
+        bytes: Строка журнала.
+    """
+    payload = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return b'%08x %s\n' % (zlib.crc32(payload), payload)
+
+
+class WriteAheadLog:
+    """
+    Журнал упреждающей записи: изменения дописываются в конец файла, а полное состояние
+    периодически записывается контрольной точкой, после которой журнал очищается.
+
+    Каждая строка журнала содержит контрольную сумму CRC32 и запись в формате JSON.
+    Оборванная или поврежденная строка (запись, прерванная сбоем) пропускается при чтении,
+    а следующая запись начинается с новой строки.
+
+    Каждая запись сразу дописывается в файл одним вызовом write, поэтому переживает
+    аварийное завершение процесса и видна другим процессам. Синхронизация с диском
+    выполняется группой (group commit): одним вызовом fsync на group_size записей или при
+    вызове commit; при политике 'always' — после каждой записи. При сбое питания теряются
+    только не синхронизированные записи группы, но не ранее синхронизированные данные.
+    """
+
+    def __init__(self, path: str, fsync: str = FSYNC_BATCH, group_size: int = DEFAULT_GROUP_SIZE):
+        """
+        Инициализирует журнал.
+
+        Args:
+            path (str): Путь к файлу журнала.
+            fsync (str, optional): Политика синхронизации: 'always', 'batch' или 'never'.
+                                   По умолчанию 'batch'.
+            group_size (int, optional): Количество записей, синхронизируемых одним вызовом fsync.
+                                        По умолчанию DEFAULT_GROUP_SIZE.
+
+        Raises:
+            ValueError: Если политика синхронизации неизвестна или размер группы меньше 1.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'Неизвестная политика синхронизации: {fsync}')
+        if group_size < 1:
+            raise ValueError('Размер группы должен быть положительным')
+        self.__path = path
+        self.__fsync = fsync
+        self.__group_size = group_size
+        # Количество записей, дописанных в файл после последней синхронизации
+        self.__unsynced = 0
+
+    @property
+    def path(self) -> str:
+        """
+        Путь к файлу журнала.
+        """
+        return self.__path
+
+    @property
+    def size(self) -> int:
+        """
+        Объем журнала в байтах.
+        """
+        try:
+            return os.path.getsize(self.__path)
+        except FileNotFoundError:
+            return 0
+
+    def append(self, entry: Any) -> None:
+        """
+        Дописывает запись в журнал. Журнал синхронизируется с диском, когда без синхронизации
+        накопилось group_size записей, при политике 'always' — сразу.
+
+        Args:
+            entry (Any): Запись, сериализуемая в JSON.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        line = _encode(entry)
+        try:
+            with open(self.__path, 'ab+') as file:
+                end = file.seek(0, os.SEEK_END)
+                if end:
+                    # Оборванная строка после сбоя завершается, чтобы не испортить новую запись
+                    file.seek(end - 1)
+                    if file.read(1) != b'\n':
+                        line = b'\n' + line
+                file.write(line)
+                self.__unsynced += 1
+                if self.__fsync == FSYNC_ALWAYS or (self.__fsync == FSYNC_BATCH
+                                                    and self.__unsynced >= self.__group_size):
+                    file.flush()
+                    os.fsync(file.fileno())
+                    self.__unsynced = 0
+        except IOError as e:
+            raise IOError(f'Ошибка при записи журнала {self.__path}: {e}')
+
+    def commit(self) -> None:
+        """
+        Синхронизирует с диском записи, дописанные после последней синхронизации, не дожидаясь
+        заполнения группы. При политике 'never' ничего не делает.
+
+        Raises:
+            IOError: Если произошла ошибка при синхронизации файла.
+        """
+        if not self.__unsynced or self.__fsync == FSYNC_NEVER:
+            return
+        try:
+            fsync_path(self.__path)
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            raise IOError(f'Ошибка при записи журнала {self.__path}: {e}')
+        self.__unsynced = 0
+
+    def replay(self) -> List[Any]:
+        """
+        Читает записи журнала по порядку, пропуская оборванные и поврежденные строки.
+        Файл не изменяется, поэтому журнал можно читать во время записи другим процессом.
+
+        Returns:
+            List[Any]: Записи журнала.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла.
+        """
+        entries = []
+        try:
+            with open(self.__path, 'rb') as file:
+                for line in file:
+                    checksum, _, payload = line.rstrip(b'\n').partition(b' ')
+                    if line.endswith(b'\n') and checksum == b'%08x' % zlib.crc32(payload):
+                        entries.append(json.loads(payload))
+        except FileNotFoundError:
+            return []
+        except (IOError, ValueError) as e:
+            raise IOError(f'Ошибка при чтении журнала {self.__path}: {e}')
+        return entries
+
+    def reset(self) -> None:
+        """
+        Очищает журнал после записи контрольной точки: его записи вошли в контрольную точку.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении файла.
+        """
+        self.__unsynced = 0
+        try:
+            if os.path.exists(self.__path):
+                os.remove(self.__path)
+        except IOError as e:
+            raise IOError(f'Ошибка при очистке журнала {self.__path}: {e}')
+
+    def close(self) -> None:
+        """
+        Синхронизирует с диском записи, дописанные после последней синхронизации.
+        """
+        self.commit()
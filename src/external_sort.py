@@ -0,0 +1,144 @@
+import heapq
+import json
+import os
+import tempfile
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+# Объем одной отсортированной серии в памяти по умолчанию, байт (по длине строк JSON)
+DEFAULT_RUN_BYTES = 64 * 1024 * 1024
+
+# Максимальное количество серий, сливаемых за один проход (ограничивает число открытых файлов)
+DEFAULT_FAN_IN = 64
+
+# Один кодировщик на все записи: json.dumps с параметрами создает кодировщик при каждом вызове
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _fill_run(iterator: Iterator[Any], run_bytes: int) -> List[Tuple[Any, str]]:
+    """
+    Читает из потока записи очередной серии, пока их суммарный объем не превысит бюджет.
+
+    Объем записи оценивается длиной ее строки JSON; строка сохраняется вместе с записью и
+    затем пишется в файл серии без повторной сериализации.
+
+    Args:
+        iterator (Iterator[Any]): Поток записей.
+        run_bytes (int): Бюджет серии, байт. Серия содержит хотя бы одну запись.
+
+    Returns:
+        List[Tuple[Any, str]]: Пары (запись, строка JSON); пустой список, если поток исчерпан.
+    """
+    run: List[Tuple[Any, str]] = []
+    size = 0
+    encode = _ENCODER.encode
+    for record in iterator:
+        line = encode(record)
+        run.append((record, line))
+        size += len(line) + 1
+        if size >= run_bytes:
+            break
+    return run
+
+
+def _write_run(lines: Iterable[str], directory: str) -> str:
+    """
+    Записывает отсортированную серию во временный файл JSON Lines.
+
+    Args:
+        lines (Iterable[str]): Строки JSON записей серии в порядке сортировки.
+        directory (str): Каталог временных файлов.
+
+    Returns:
+        str: Путь к файлу серии.
+    """
+    descriptor, path = tempfile.mkstemp(suffix='.jsonl', dir=directory)
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+        file.writelines(line + '\n' for line in lines)
+    return path
+
+
+def _read_run(path: str) -> Iterator[Any]:
+    """
+    Последовательно читает записи серии и удаляет файл после чтения.
+
+    Args:
+        path (str): Путь к файлу серии.
+
+    Yields:
+        Any: Очередная запись.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield json.loads(line)
+    finally:
+        # Если чтение прервано, файл может быть уже удален вместе с каталогом серий
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def external_sort(records: Iterable[Any], key: Optional[Callable[[Any], Any]] = None,
+                  run_bytes: int = DEFAULT_RUN_BYTES, fan_in: int = DEFAULT_FAN_IN,
+                  tmp_dir: Optional[str] = None) -> Iterator[Any]:
+    """
+    Сортирует поток записей, не помещающийся в память, внешней сортировкой слиянием.
+
+    Поток делится на серии объемом около run_bytes байт (по длине строк JSON записей);
+    каждая серия сортируется в памяти и записывается во временный файл JSON Lines, затем
+    серии сливаются k-путевым слиянием (heapq.merge) и возвращаются потоком. Если серий
+    больше fan_in, слияние выполняется в несколько проходов. В памяти одновременно находится
+    одна серия при ее создании и по одной записи из каждой сливаемой серии при слиянии.
+    Бюджет ограничивает объем, а не количество записей, поэтому крупные записи не
+    увеличивают потребление памяти. Если поток помещается в одну серию, временные файлы
+    не создаются.
+
+    Сортировка устойчива: равные записи возвращаются в порядке потока.
+
+    Args:
+        records (Iterable[Any]): Поток записей, сериализуемых в JSON (например, словарей).
+        key (Optional[Callable[[Any], Any]], optional): Функция ключа сортировки
+                                                      (например, из query.compile_order_by).
+        run_bytes (int, optional): Приблизительный объем серии в памяти, байт. Серия содержит
+                                   хотя бы одну запись. По умолчанию 64 МБ.
+        fan_in (int, optional): Максимальное количество серий в одном слиянии.
+        tmp_dir (Optional[str], optional): Каталог временных файлов. По умолчанию системный.
+
+    Yields:
+        Any: Записи в порядке сортировки.
+
+    Raises:
+        ValueError: Если run_bytes меньше 1 или fan_in меньше 2.
+    """
+    if run_bytes < 1 or fan_in < 2:
+        raise ValueError('run_bytes должен быть не меньше 1, а fan_in — не меньше 2')
+
+    record_of = itemgetter(0)
+    run_key = (lambda pair: key(pair[0])) if key is not None else record_of
+    iterator = iter(records)
+    first = _fill_run(iterator, run_bytes)
+    first.sort(key=run_key)
+    run = _fill_run(iterator, run_bytes)
+    if not run:
+        # Поток поместился в одну серию
+        yield from map(record_of, first)
+        return
+
+    line_of = itemgetter(1)
+    with tempfile.TemporaryDirectory(prefix='vacancies-sort-', dir=tmp_dir) as directory:
+        runs: List[str] = [_write_run(map(line_of, first), directory)]
+        del first
+        while run:
+            run.sort(key=run_key)
+            runs.append(_write_run(map(line_of, run), directory))
+            run = _fill_run(iterator, run_bytes)
+
+        # Промежуточные проходы, пока серий больше fan_in
+        encode = _ENCODER.encode
+        while len(runs) > fan_in:
+            runs = [_write_run(map(encode, heapq.merge(*map(_read_run, runs[start:start + fan_in]), key=key)),
+                               directory)
+                    for start in range(0, len(runs), fan_in)]
+
+        yield from heapq.merge(*map(_read_run, runs), key=key)
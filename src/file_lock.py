@@ -0,0 +1,78 @@
+from typing import BinaryIO, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # На Windows блокировка выполняется через msvcrt
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Межпроцессная исключительная блокировка средствами операционной системы (flock на POSIX,
+    LockFileEx через msvcrt на Windows).
+
+    Блокируется отдельный файл-замок, а не файл данных: файл данных может быть атомарно
+    заменен (например, при сжатии), и блокировка прежнего файла перестала бы защищать новый.
+    Блокировка освобождается операционной системой при завершении процесса, в том числе
+    аварийном. Повторный захват в том же экземпляре не блокирует.
+    """
+
+    def __init__(self, path: str):
+        """
+        Инициализирует блокировку.
+
+        Args:
+            path (str): Путь к файлу-замку; создается при первом захвате.
+        """
+        self.__path = path
+        self.__file: Optional[BinaryIO] = None
+        self.__depth = 0
+
+    def acquire(self) -> None:
+        """
+        Захватывает блокировку, ожидая ее освобождения другими процессами.
+
+        Raises:
+            IOError: Если не удалось открыть или заблокировать файл-замок.
+        """
+        if self.__depth == 0:
+            try:
+                file = open(self.__path, 'a+b')
+            except IOError as e:
+                raise IOError(f'Ошибка при открытии файла блокировки {self.__path}: {e}')
+            try:
+                if fcntl is not None:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+                else:
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            except IOError as e:
+                file.close()
+                raise IOError(f'Ошибка при блокировке {self.__path}: {e}')
+            self.__file = file
+        self.__depth += 1
+
+    def release(self) -> None:
+        """
+        Освобождает блокировку.
+        """
+        self.__depth -= 1
+        if self.__depth == 0:
+            file, self.__file = self.__file, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+                else:
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                file.close()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
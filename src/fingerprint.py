@@ -0,0 +1,248 @@
+from .durability import atomic_replace
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# Поля записи вакансии, по содержимому которых вычисляется отпечаток
+FINGERPRINT_FIELDS: Tuple[str, ...] = ('name', 'desc', 'salary_from', 'salary_to', 'currency', 'url', 'requirement')
+
+# Разделитель значений полей: не встречается в тексте вакансий
+_SEPARATOR = '\x1f'
+
+# Префикс строки файла индекса отпечатков с удаленным отпечатком. Отпечаток начинается с
+# идентификатора вакансии HH.ru (цифры) или с ':' (вакансия без идентификатора)
+REMOVED_PREFIX = '-'
+
+# Префикс первой строки файла индекса отпечатков с версией данных в формате JSON
+VERSION_PREFIX = '#'
+
+
+def _normalize(value: Any) -> str:
+    """
+    Приводит значение поля к каноническому виду для вычисления отпечатка.
+
+    Строки приводятся к нижнему регистру с единичными пробелами, числа — к float, чтобы
+    100000 и 100000.0 давали одинаковый отпечаток.
+
+    Args:
+        value (Any): Значение поля.
+
+    Returns:
+        str: Каноническое представление значения.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return ' '.join(value.split()).casefold()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return repr(float(value))
+    return str(value)
+
+
+def content_fingerprint(record_id: Optional[Any], values: Iterable[Any]) -> str:
+    """
+    Вычисляет отпечаток вакансии: идентификатор и хэш нормализованных значений полей.
+
+    Args:
+        record_id (Optional[Any]): Идентификатор вакансии на HH.ru или None.
+        values (Iterable[Any]): Значения полей FINGERPRINT_FIELDS в том же порядке.
+
+    Returns:
+        str: Отпечаток вида '<id>:<хэш>' (идентификатор пустой, если он не известен).
+    """
+    content = _SEPARATOR.join(_normalize(value) for value in values)
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+    return f'{record_id if record_id is not None else ""}:{digest}'
+
+
+def record_fingerprint(record: Mapping[str, Any]) -> str:
+    """
+    Вычисляет отпечаток записи вакансии по ее содержимому.
+
+    Сохраненный в записи ключ 'fingerprint' не используется: запись могла быть изменена
+    после сохранения, и прежний отпечаток указал бы на неизменную вакансию.
+
+    Args:
+        record (Mapping[str, Any]): Запись вакансии (например, результат Vacancy.to_dict).
+
+    Returns:
+        str: Отпечаток записи.
+    """
+    return content_fingerprint(record.get('id'), (record.get(name) for name in FINGERPRINT_FIELDS))
+
+
+def stamp_fingerprint(record: Mapping[str, Any], fingerprint: str) -> Dict[str, Any]:
+    """
+    Возвращает копию записи, в которой сохраненный отпечаток заменен вычисленным.
+
+    Запись без ключа 'fingerprint' копируется без изменений.
+
+    Args:
+        record (Mapping[str, Any]): Запись вакансии.
+        fingerprint (str): Отпечаток содержимого записи (см. record_fingerprint).
+
+    Returns:
+        Dict[str, Any]: Копия записи.
+    """
+    copy = dict(record)
+    if 'fingerprint' in copy:
+        copy['fingerprint'] = fingerprint
+    return copy
+
+
+class FingerprintIndex:
+    """
+    Множество отпечатков сохраненных вакансий с хранением в текстовом файле.
+
+    Файл содержит по одному отпечатку в строке. Новые отпечатки дописываются в конец
+    файла, поэтому сохранение после добавления m вакансий занимает O(m). Удаленный отпечаток
+    дописывается строкой с префиксом '-'; когда таких строк становится больше, чем отпечатков,
+    файл записывается целиком. Прерванное дописывание оставляет неполную последнюю строку,
+    которая пропускается при загрузке.
+
+    Attributes:
+        version (Optional[Any]): Версия данных, которым соответствует индекс (первая строка
+                                 файла с префиксом '#'). При изменении версии файл записывается
+                                 целиком через атомарную замену.
+    """
+
+    def __init__(self, fingerprints: Iterable[str] = ()):
+        """
+        Инициализирует индекс.
+
+        Args:
+            fingerprints (Iterable[str], optional): Начальные отпечатки. По умолчанию пусто.
+        """
+        self.__fingerprints = set(fingerprints)
+        self.version: Optional[Any] = None
+        # Версия, записанная в файл индекса
+        self.__saved_version: Optional[Any] = None
+        # Строки, еще не записанные в файл: добавленные и удаленные ('-' + отпечаток) отпечатки
+        self.__pending: List[str] = []
+        # Файл записывается целиком, если индекс создан не из него
+        self.__rewrite = True
+        # Количество строк удаления в файле и в очереди записи
+        self.__removals = 0
+
+    def __len__(self) -> int:
+        return len(self.__fingerprints)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.__fingerprints
+
+    def add(self, fingerprint: str) -> bool:
+        """
+        Добавляет отпечаток в индекс.
+
+        Args:
+            fingerprint (str): Отпечаток вакансии.
+
+        Returns:
+            bool: True, если отпечаток новый; False, если вакансия уже есть в индексе.
+        """
+        if fingerprint in self.__fingerprints:
+            return False
+        self.__fingerprints.add(fingerprint)
+        self.__pending.append(fingerprint)
+        return True
+
+    def discard(self, fingerprint: str) -> None:
+        """
+        Удаляет отпечаток из индекса, например прежней версии замененной вакансии.
+
+        Args:
+            fingerprint (str): Отпечаток вакансии. Отсутствующий отпечаток пропускается.
+        """
+        if fingerprint not in self.__fingerprints:
+            return
+        self.__fingerprints.remove(fingerprint)
+        self.__pending.append(REMOVED_PREFIX + fingerprint)
+        self.__removals += 1
+
+    def merge(self, fingerprints: Iterable[str]) -> None:
+        """
+        Добавляет отпечатки, уже записанные в файл индекса другим экземпляром: при сохранении
+        они не дописываются повторно.
+
+        Args:
+            fingerprints (Iterable[str]): Отпечатки вакансий.
+        """
+        self.__fingerprints.update(fingerprints)
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет индекс в файл, дописывая только новые и удаленные отпечатки.
+
+        Файл записывается целиком во временный файл, который атомарно заменяет прежний (см.
+        durability.atomic_replace), если индекс создан не из файла, изменилась версия или
+        строк удаления больше, чем отпечатков.
+
+        Args:
+            path (str): Путь к файлу индекса.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        try:
+            if self.__rewrite or self.version != self.__saved_version or self.__removals > len(self.__fingerprints):
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as file:
+                    if self.version is not None:
+                        file.write(f'{VERSION_PREFIX}{json.dumps(self.version, separators=(",", ":"))}\n')
+                    file.writelines(f'{fingerprint}\n' for fingerprint in self.__fingerprints)
+                atomic_replace(tmp_path, path)
+                self.__rewrite = False
+                self.__saved_version = self.version
+                self.__removals = 0
+            elif self.__pending:
+                with open(path, 'a', encoding='utf-8') as file:
+                    file.write(''.join(f'{fingerprint}\n' for fingerprint in self.__pending))
+            self.__pending = []
+        except IOError as e:
+            raise IOError(f'Ошибка при записи индекса отпечатков в {path}: {e}')
+
+    @classmethod
+    def load(cls, path: str) -> 'FingerprintIndex':
+        """
+        Загружает индекс из файла.
+
+        Args:
+            path (str): Путь к файлу индекса.
+
+        Returns:
+            FingerprintIndex: Загруженный индекс или пустой, если файла нет.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла.
+        """
+        try:
+            if not os.path.exists(path):
+                return cls()
+            index = cls()
+            fingerprints = index.__fingerprints
+            # Неполная последняя строка может обрываться внутри символа UTF-8
+            with open(path, 'r', encoding='utf-8', errors='replace') as file:
+                for number, line in enumerate(file):
+                    if not line.endswith('\n'):
+                        # Неполная строка прерванного дописывания
+                        break
+                    fingerprint = line.rstrip('\n')
+                    if not fingerprint:
+                        continue
+                    if number == 0 and fingerprint.startswith(VERSION_PREFIX):
+                        try:
+                            index.version = json.loads(fingerprint[len(VERSION_PREFIX):])
+                        except ValueError:
+                            index.version = None
+                    elif fingerprint.startswith(REMOVED_PREFIX):
+                        fingerprints.discard(fingerprint[len(REMOVED_PREFIX):])
+                        index.__removals += 1
+                    else:
+                        fingerprints.add(fingerprint)
+            index.__saved_version = index.version
+            index.__rewrite = False
+            return index
+        except IOError as e:
+            raise IOError(f'Ошибка при чтении индекса отпечатков из {path}: {e}')
@@ -5,6 +5,7 @@ from typing import List, Dict, Any, Optional
 
 
 BASE_API_HH_URL = 'https://api.hh.ru/vacancies'
+DICTIONARIES_API_HH_URL = 'https://api.hh.ru/dictionaries'
 
 
 class FromHHru(AbstractHH):
@@ -97,6 +98,22 @@ class FromHHru(AbstractHH):
         print(f'Всего вакансий получено: {len(vacancies)}')
         return vacancies
 
+    def get_currency_rates(self) -> Dict[str, float]:
+        """
+        Получает курсы валют из справочника HH.ru.
+
+        Returns:
+            Dict[str, float]: Курсы валют по кодам (количество единиц валюты за 1 рубль).
+
+        Raises:
+            requests.HTTPError: Если запрос к API завершился неудачно.
+            requests.RequestException: Для других ошибок, связанных с запросом.
+        """
+        response: Response = self.__session.get(DICTIONARIES_API_HH_URL, timeout=10)
+        response.raise_for_status()
+        currencies = response.json().get('currency', [])
+        return {item['code']: item['rate'] for item in currencies if item.get('code') and item.get('rate')}
+
     def close_session(self) -> None:
         """
         Закрывает сессию для HTTP-запросов.
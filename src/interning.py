@@ -0,0 +1,62 @@
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# Поля записей вакансий с небольшим числом различных значений: каждое значение
+# повторяется в тысячах записей, поэтому его достаточно хранить в памяти один раз
+INTERNED_FIELDS: Tuple[str, ...] = ('name', 'desc', 'currency')
+
+
+def intern_value(value: Any) -> Any:
+    """
+    Возвращает единственный экземпляр строки из пула интернированных строк.
+
+    Args:
+        value (Any): Значение поля.
+
+    Returns:
+        Any: Интернированная строка или исходное значение, если это не строка.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def intern_record(record: Dict[str, Any], fields: Iterable[str] = INTERNED_FIELDS) -> Dict[str, Any]:
+    """
+    Заменяет значения повторяющихся полей записи интернированными строками (на месте).
+
+    Args:
+        record (Dict[str, Any]): Запись вакансии.
+        fields (Iterable[str], optional): Интернируемые поля. По умолчанию INTERNED_FIELDS.
+
+    Returns:
+        Dict[str, Any]: Та же запись.
+    """
+    for field in fields:
+        value = record.get(field)
+        if type(value) is str:
+            record[field] = sys.intern(value)
+    return record
+
+
+def intern_records(records: List[Dict[str, Any]],
+                   fields: Iterable[str] = INTERNED_FIELDS) -> List[Dict[str, Any]]:
+    """
+    Интернирует повторяющиеся поля всех записей списка (на месте).
+
+    Дубликаты строк, созданные json.load для каждой записи, освобождаются сразу,
+    как только записи начинают ссылаться на общий экземпляр.
+
+    Args:
+        records (List[Dict[str, Any]]): Записи вакансий.
+        fields (Iterable[str], optional): Интернируемые поля. По умолчанию INTERNED_FIELDS.
+
+    Returns:
+        List[Dict[str, Any]]: Тот же список.
+    """
+    fields = tuple(fields)
+    for record in records:
+        if isinstance(record, dict):
+            intern_record(record, fields)
+    return records
@@ -0,0 +1,120 @@
+import math
+from bisect import bisect_right
+from typing import Hashable, List, Optional, Tuple
+
+
+# Размер отрезка, который проверяется простым перебором вместо спуска по дереву
+LEAF_BLOCK = 32
+
+
+class IntervalIndex:
+    """
+    Индекс интервалов зарплаты для запросов пересечения с диапазоном.
+
+    Интервалы упорядочены по нижней границе; поверх верхних границ построено дерево отрезков
+    с максимумом. Запрос пересечения с [low, high] отбирает бинарным поиском интервалы с
+    нижней границей не больше high, а в дереве спускается только в поддеревья, где
+    максимальная верхняя граница не меньше low. Время запроса O((m + 1) log n), где m —
+    количество найденных интервалов.
+
+    Отсутствующая нижняя граница означает открытый снизу интервал, верхняя — открытый
+    сверху. Интервалы без обеих границ не индексируются.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой индекс.
+        """
+        self.__pending: List[Tuple[float, float, Hashable]] = []
+        self.__lows: List[float] = []
+        self.__highs: List[float] = []
+        self.__ids: List[Hashable] = []
+        self.__tree: List[float] = []
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return len(self.__ids) + len(self.__pending)
+
+    def add(self, doc_id: Hashable, low: Optional[float], high: Optional[float]) -> bool:
+        """
+        Добавляет интервал в индекс. Индекс перестраивается при следующем запросе.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа (например, позиция записи).
+            low (Optional[float]): Нижняя граница или None, если она не указана.
+            high (Optional[float]): Верхняя граница или None, если она не указана.
+
+        Returns:
+            bool: False, если не указана ни одна граница и интервал не добавлен.
+
+        Raises:
+            ValueError: Если нижняя граница больше верхней.
+        """
+        if low is None and high is None:
+            return False
+        low = -math.inf if low is None else low
+        high = math.inf if high is None else high
+        if low > high:
+            raise ValueError(f'Нижняя граница {low} больше верхней {high}')
+        self.__pending.append((low, high, doc_id))
+        return True
+
+    def __build(self) -> None:
+        """
+        Упорядочивает интервалы по нижней границе и строит дерево максимумов верхних границ.
+        """
+        intervals = sorted(list(zip(self.__lows, self.__highs, self.__ids)) + self.__pending,
+                           key=lambda interval: interval[0])
+        self.__pending = []
+        self.__lows = [interval[0] for interval in intervals]
+        self.__highs = [interval[1] for interval in intervals]
+        self.__ids = [interval[2] for interval in intervals]
+
+        size = LEAF_BLOCK
+        while size < len(intervals):
+            size *= 2
+        tree = [-math.inf] * (2 * size)
+        tree[size:size + len(intervals)] = self.__highs
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.__tree = tree
+        self.__size = size
+
+    def search(self, low: Optional[float] = None, high: Optional[float] = None) -> List[Hashable]:
+        """
+        Находит интервалы, пересекающиеся с диапазоном [low, high].
+
+        Args:
+            low (Optional[float], optional): Нижняя граница диапазона. По умолчанию None
+                                             (не ограничена).
+            high (Optional[float], optional): Верхняя граница диапазона. По умолчанию None
+                                              (не ограничена).
+
+        Returns:
+            List[Hashable]: Идентификаторы документов в порядке возрастания нижней границы.
+        """
+        if self.__pending:
+            self.__build()
+        low = -math.inf if low is None else low
+        high = math.inf if high is None else high
+        # Кандидаты — интервалы с нижней границей не больше high
+        limit = bisect_right(self.__lows, high)
+        if not limit or low > high:
+            return []
+
+        tree, size, highs = self.__tree, self.__size, self.__highs
+        found: List[int] = []
+        # Обход дерева слева направо: (вершина, начало ее отрезка, длина отрезка)
+        stack = [(1, 0, size)]
+        while stack:
+            node, start, length = stack.pop()
+            if start >= limit or tree[node] < low:
+                continue
+            if length <= LEAF_BLOCK:
+                stop = min(start + length, limit)
+                found.extend(position for position in range(start, stop) if highs[position] >= low)
+                continue
+            half = length // 2
+            stack.append((2 * node + 1, start + half, half))
+            stack.append((2 * node, start, half))
+        return [self.__ids[position] for position in found]
@@ -0,0 +1,140 @@
+import json
+import re
+from typing import Any, Dict, Iterator, Optional, TextIO
+from .compression import open_text
+
+
+# Символы, которые могут следовать за значением JSON
+_DELIMITERS = frozenset(',:]} \t\n\r')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JSONStream:
+    """
+    Последовательное чтение значений JSON из файла фрагментами ограниченного размера.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.__file = file
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ''
+        self.__pos = 0
+        self.__eof = False
+
+    def __fill(self, size: int) -> bool:
+        """
+        Дочитывает файл в буфер, отбрасывая прочитанную часть.
+
+        Returns:
+            bool: False, если файл закончился.
+        """
+        if self.__eof:
+            return False
+        chunk = self.__file.read(max(size, self.__chunk_size))
+        if not chunk:
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__pos:] + chunk
+        self.__pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Возвращает следующий значимый символ, пропуская пробельные символы.
+
+        Returns:
+            str: Символ или пустая строка в конце файла.
+        """
+        while True:
+            self.__pos = _WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self.__fill(self.__chunk_size):
+                return ''
+
+    def expect(self, char: str) -> None:
+        """
+        Пропускает ожидаемый символ.
+
+        Raises:
+            ValueError: Если следующий символ другой.
+        """
+        if self.peek() != char:
+            raise ValueError(f'Ожидался символ {char!r} в позиции {self.__pos}')
+        self.__pos += 1
+
+    def decode(self) -> Any:
+        """
+        Читает очередное значение JSON, дочитывая файл, пока значение не поместится в буфер.
+
+        Returns:
+            Any: Значение.
+
+        Raises:
+            ValueError: Если данные не являются корректным JSON.
+        """
+        self.peek()
+        size = self.__chunk_size
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                if not self.__fill(size):
+                    raise
+                size *= 2
+                continue
+            # Число на границе фрагмента может быть прочитано не полностью ('3.' вместо '3.5'):
+            # за значением должен следовать разделитель
+            if (end == len(self.__buffer) or self.__buffer[end] not in _DELIMITERS) and self.__fill(size):
+                continue
+            self.__pos = end
+            return value
+
+
+def iter_json_items(path: str, field: str = 'items', chunk_size: int = 1 << 16,
+                    other_fields: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """
+    Последовательно читает элементы массива из JSON файла вида {"items": [...]}
+    без загрузки файла целиком.
+
+    В памяти одновременно находятся только текущий фрагмент файла и очередной элемент.
+    Сжатые файлы (см. compression.CODEC_EXTENSIONS) распаковываются по мере чтения.
+
+    Args:
+        path (str): Путь к JSON файлу, в том числе сжатому.
+        field (str, optional): Ключ массива в корневом объекте. По умолчанию 'items'.
+        chunk_size (int, optional): Размер читаемого фрагмента в символах. По умолчанию 64 КиБ.
+        other_fields (Optional[Dict[str, Any]], optional): Словарь, в который записываются
+                                                           значения остальных ключей корневого
+                                                           объекта по мере чтения. По умолчанию
+                                                           None (значения пропускаются).
+
+    Yields:
+        Any: Очередной элемент массива.
+
+    Raises:
+        ValueError: Если файл не является корректным JSON указанного вида.
+    """
+    with open_text(path) as file:
+        stream = _JSONStream(file, chunk_size)
+        stream.expect('{')
+        while stream.peek() != '}':
+            key = stream.decode()
+            stream.expect(':')
+            if key != field or stream.peek() != '[':
+                value = stream.decode()
+                if other_fields is not None:
+                    other_fields[key] = value
+            else:
+                stream.expect('[')
+                while stream.peek() != ']':
+                    yield stream.decode()
+                    if stream.peek() == ',':
+                        stream.expect(',')
+                stream.expect(']')
+            if stream.peek() == ',':
+                stream.expect(',')
+            elif stream.peek() != '}':
+                raise ValueError('Некорректный JSON: ожидался символ \',\' или \'}\'')
@@ -0,0 +1,472 @@
+from .abstract_class import Saver
+from .file_lock import FileLock
+from .fingerprint import FingerprintIndex, record_fingerprint, stamp_fingerprint
+from .interning import intern_record
+from .key_index import KeyIndex
+from .records import UpsertResult, record_matches, select_records
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import json
+import os
+
+
+# Ключ строки-надгробия, которая отмечает удаление вакансии с указанным идентификатором
+TOMBSTONE_KEY = '$deleted'
+
+
+class JSONLSaver(Saver):
+    """
+    Реализация абстрактного класса Saver с хранением вакансий в формате JSON Lines.
+
+    Каждая вакансия хранится отдельной строкой; новые вакансии дописываются в конец файла,
+    поэтому сохранение k вакансий занимает O(k) независимо от размера хранилища.
+
+    Идентификатор вакансии на HH.ru — первичный ключ: сохраняемый индекс ключей (см.
+    key_index.KeyIndex) хранит смещение актуальной строки каждой вакансии, поэтому поиск,
+    замена и удаление по идентификатору занимают O(1). Новая версия вакансии дописывается
+    в конец файла и заменяет прежнюю; удаление дописывает строку-надгробие. Устаревшие
+    строки и надгробия пропускаются при чтении и удаляются сжатием (см. compact).
+    Вакансии без идентификатора отсеиваются как дубликаты по индексу отпечатков.
+
+    Несколько процессов могут сохранять вакансии в один файл одновременно: запись выполняется
+    под межпроцессной блокировкой (см. file_lock.FileLock), которая удерживается только на
+    время дописывания строк и индексов. Перед записью индексы дополняются строками, которые
+    дописали другие процессы, поэтому изменения не теряются. Чтение выполняется без
+    блокировки: строки дописываются целиком, а незавершенная последняя строка пропускается.
+    """
+
+    def __init__(self, path: str = 'data/vacancies.jsonl'):
+        """
+        Инициализирует экземпляр JSONLSaver.
+
+        Args:
+            path (str, optional): Путь к файлу JSON Lines. По умолчанию 'data/vacancies.jsonl'.
+        """
+        self.__path = path
+        # Имена файлов индексов включают расширение, чтобы не совпасть с индексами JSONSaver
+        self.__fingerprint_path = path + '.fingerprints'
+        self.__fingerprints: Optional[FingerprintIndex] = None
+        self.__key_path = path + '.ids'
+        self.__keys: Optional[KeyIndex] = None
+        # Индексный дескриптор файла, для которого построен индекс ключей
+        self.__keys_inode: Optional[int] = None
+        # Блокировка записи из нескольких процессов
+        self.__lock = FileLock(path + '.lock')
+        directory = os.path.dirname(self.__path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get_path(self) -> str:
+        """
+        Возвращает путь к файлу JSON Lines.
+
+        Returns:
+            str: Путь к файлу.
+        """
+        return self.__path
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """
+        Дописывает новые вакансии в конец файла. Не добавляет дубликаты вакансий.
+
+        Вакансия с уже сохраненным идентификатором и другим содержимым заменяет прежнюю версию
+        (см. upsert).
+
+        Args:
+            data (Dict[str, Any]): Данные для сохранения: вакансии в списке 'items'.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        self.upsert(data.get('items', []))
+
+    def upsert(self, items: Iterable[Dict[str, Any]]) -> UpsertResult:
+        """
+        Дописывает в конец файла новые и изменившиеся вакансии.
+
+        Вакансии сопоставляются по идентификатору через индекс ключей, изменение определяется
+        сравнением отпечатков содержимого (см. fingerprint.record_fingerprint), поэтому
+        неизменные вакансии пропускаются без чтения файла. Новая версия вакансии заменяет
+        прежнюю; прежняя строка удаляется сжатием (см. compact).
+
+        Строки сериализуются до захвата блокировки; под блокировкой выполняются только
+        сравнение с индексами и дописывание.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Записи вакансий.
+
+        Returns:
+            UpsertResult: Количество добавленных, обновленных и неизменных вакансий.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        result = UpsertResult()
+        prepared = []
+        for item in items:
+            fingerprint = record_fingerprint(item)
+            line = json.dumps(stamp_fingerprint(item, fingerprint), ensure_ascii=False) + '\n'
+            prepared.append((item.get('id'), fingerprint, line.encode('utf-8')))
+        try:
+            with self.__lock:
+                return self.__append(prepared, result)
+        except IOError as e:
+            # Индексы перечитываются с диска, чтобы не содержать несохраненных вакансий
+            self.__keys = None
+            self.__fingerprints = None
+            raise IOError(f'Ошибка при записи в {self.__path}: {e}')
+
+    def __append(self, prepared: List[Tuple[Any, str, bytes]], result: UpsertResult) -> UpsertResult:
+        """
+        Дописывает новые и изменившиеся вакансии и сохраняет индексы. Вызывается под блокировкой.
+
+        Args:
+            prepared (List[Tuple[Any, str, bytes]]): Идентификатор, отпечаток и строка файла
+                                                     каждой вакансии.
+            result (UpsertResult): Счетчики результата.
+
+        Returns:
+            UpsertResult: Количество добавленных, обновленных и неизменных вакансий.
+        """
+        self.__truncate_torn_tail()
+        keys = self.__get_keys()
+        fingerprints = self.__get_fingerprints()
+        lines = []
+        offset = self.__size()
+        for record_id, fingerprint, line in prepared:
+            if record_id is None:
+                if not fingerprints.add(fingerprint):
+                    result.unchanged += 1
+                    continue
+                result.inserted += 1
+            else:
+                entry = keys.get(record_id)
+                if entry is not None and entry[1] == fingerprint:
+                    result.unchanged += 1
+                    continue
+                if entry is None:
+                    result.inserted += 1
+                else:
+                    result.updated += 1
+                keys.set(record_id, offset, fingerprint)
+            lines.append(line)
+            offset += len(line)
+        if lines:
+            with open(self.__path, 'ab') as file:
+                file.write(b''.join(lines))
+            keys.end = offset
+            keys.save(self.__key_path)
+            fingerprints.save(self.__fingerprint_path)
+        return result
+
+    def get(self, record_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает вакансию по идентификатору, читая одну строку файла.
+
+        Args:
+            record_id (Any): Идентификатор вакансии.
+
+        Returns:
+            Optional[Dict[str, Any]]: Вакансия или None, если ее нет.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла.
+        """
+        entry = self.__get_keys().get(record_id)
+        if entry is None:
+            return None
+        try:
+            with open(self.__path, 'rb') as file:
+                file.seek(entry[0])
+                return intern_record(json.loads(file.readline()))
+        except (IOError, ValueError) as e:
+            raise IOError(f'Ошибка при чтении из {self.__path}: {e}')
+
+    def ids(self) -> List[Any]:
+        """
+        Возвращает идентификаторы сохраненных вакансий по индексу ключей, не читая записи.
+
+        Returns:
+            List[Any]: Идентификаторы вакансий.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении индекса или файла.
+        """
+        return list(self.__get_keys())
+
+    def iter_vacancies(self) -> Iterator[Dict[str, Any]]:
+        """
+        Возвращает поток актуальных вакансий из файла, не загружая его целиком.
+
+        Устаревшие версии вакансий, надгробия и незавершенная последняя строка (например,
+        после прерванной записи) пропускаются.
+
+        Yields:
+            Dict[str, Any]: Очередная вакансия.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла или строка файла повреждена.
+        """
+        keys = self.__get_keys()
+        for offset, _, record in self.__scan():
+            if TOMBSTONE_KEY in record:
+                continue
+            record_id = record.get('id')
+            if record_id is None:
+                yield intern_record(record)
+                continue
+            entry = keys.get(record_id)
+            if entry is not None and entry[0] == offset:
+                yield intern_record(record)
+
+    def get_vacancies(self, criteria: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии из файла по заданным критериям за один проход по файлу.
+
+        Поддерживаются критерии 'name', 'salary_from', 'salary_to', 'collapse_duplicates',
+        'order_by' и 'top_n' (см. JSONSaver.get_vacancies). С критерием top_n в памяти
+        хранятся только N лучших записей.
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Словарь с критериями фильтрации.
+                                                         По умолчанию None.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий, соответствующих критериям.
+        """
+        vacancies = self.iter_vacancies()
+        if not criteria:
+            return list(vacancies)
+        filtered = select_records((vacancy for vacancy in vacancies if record_matches(vacancy, criteria)), criteria)
+        print(f'Найдено {len(filtered)} вакансий, соответствующих критериям.')
+        return filtered
+
+    def delete(self, record_id: Optional[str] = None) -> None:
+        """
+        Удаляет все вакансии или конкретную вакансию по идентификатору.
+
+        Удаление конкретной вакансии дописывает в конец файла строку-надгробие.
+
+        Args:
+            record_id (Optional[str], optional): Идентификатор вакансии для удаления.
+                                                Если не указан, удаляются все вакансии.
+                                                По умолчанию None.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении данных.
+        """
+        try:
+            with self.__lock:
+                self.__delete(record_id)
+        except IOError as e:
+            self.__keys = None
+            raise IOError(f'Ошибка при удалении данных из {self.__path}: {e}')
+
+    def __delete(self, record_id: Optional[str]) -> None:
+        """
+        Удаляет все вакансии или вакансию по идентификатору. Вызывается под блокировкой.
+
+        Args:
+            record_id (Optional[str]): Идентификатор вакансии или None для удаления всех.
+        """
+        if not os.path.exists(self.__path):
+            return
+
+        if record_id:
+            keys = self.__get_keys()
+            if record_id not in keys:
+                print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
+                return
+            self.__truncate_torn_tail()
+            line = (json.dumps({TOMBSTONE_KEY: record_id}, ensure_ascii=False) + '\n').encode('utf-8')
+            with open(self.__path, 'ab') as file:
+                file.write(line)
+            keys.remove(record_id)
+            keys.end = self.__size()
+            keys.save(self.__key_path)
+            print(f'Вакансия с id {record_id} удалена из {self.__path}.')
+        else:
+            open(self.__path, 'w', encoding='utf-8').close()
+            self.__fingerprints = FingerprintIndex()
+            self.__fingerprints.save(self.__fingerprint_path)
+            self.__keys = KeyIndex()
+            self.__keys.save(self.__key_path)
+            print(f'Все вакансии удалены из {self.__path}.')
+
+    def compact(self) -> int:
+        """
+        Переписывает файл, удаляя устаревшие версии вакансий, надгробия, повторяющиеся
+        вакансии и оборванную последнюю строку, и перестраивает индексы.
+
+        Returns:
+            int: Количество удаленных строк.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении или записи файла.
+        """
+        with self.__lock:
+            if not os.path.exists(self.__path):
+                return 0
+            seen = FingerprintIndex()
+            return self.__rewrite(lambda item: seen.add(record_fingerprint(item)))
+
+    def __rewrite(self, keep: Callable[[Dict[str, Any]], bool]) -> int:
+        """
+        Переписывает файл, оставляя актуальные записи, для которых keep возвращает True.
+
+        Записи пишутся во временный файл, который затем атомарно заменяет исходный,
+        поэтому при сбое исходный файл остается целым.
+
+        Args:
+            keep (Callable[[Dict[str, Any]], bool]): Условие сохранения записи.
+
+        Returns:
+            int: Количество удаленных строк.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении или записи файла.
+        """
+        tmp_path = self.__path + '.tmp'
+        fingerprints = FingerprintIndex()
+        keys = KeyIndex()
+        lines = sum(1 for _ in self.__scan())
+        kept = 0
+        try:
+            with open(tmp_path, 'wb') as file:
+                for item in self.iter_vacancies():
+                    if not keep(item):
+                        continue
+                    kept += 1
+                    fingerprint = record_fingerprint(item)
+                    if item.get('id') is None:
+                        fingerprints.add(fingerprint)
+                    else:
+                        keys.set(item['id'], keys.end, fingerprint)
+                    keys.end += file.write((json.dumps(item, ensure_ascii=False) + '\n').encode('utf-8'))
+            os.replace(tmp_path, self.__path)
+        except IOError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise IOError(f'Ошибка при перезаписи {self.__path}: {e}')
+        self.__fingerprints = fingerprints
+        fingerprints.save(self.__fingerprint_path)
+        self.__keys, self.__keys_inode = keys, os.stat(self.__path).st_ino
+        keys.save(self.__key_path)
+        return lines - kept
+
+    def __scan(self, start: int = 0) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """
+        Читает все завершенные непустые строки файла, начиная со смещения start.
+
+        Args:
+            start (int, optional): Смещение начала чтения. По умолчанию 0.
+
+        Yields:
+            Tuple[int, int, Dict[str, Any]]: Смещения начала и конца строки и ее запись
+                                             (вакансия или надгробие).
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла или строка файла повреждена.
+        """
+        if not os.path.exists(self.__path):
+            return
+        try:
+            with open(self.__path, 'rb') as file:
+                file.seek(start)
+                offset = start
+                for line in file:
+                    line_offset, offset = offset, offset + len(line)
+                    if not line.endswith(b'\n'):
+                        # Оборванная запись в конце файла
+                        return
+                    if line.strip():
+                        yield line_offset, offset, json.loads(line)
+        except (IOError, ValueError) as e:
+            raise IOError(f'Ошибка при чтении из {self.__path}: {e}')
+
+    def __truncate_torn_tail(self) -> None:
+        """
+        Обрезает оборванную последнюю строку файла, чтобы новая запись начиналась с новой строки.
+        Читается только конец файла.
+        """
+        if not os.path.exists(self.__path):
+            return
+        with open(self.__path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(position - (1 << 16), 0)
+                file.seek(start)
+                chunk = file.read(position - start)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position != end:
+                file.truncate(position)
+
+    def __get_keys(self) -> KeyIndex:
+        """
+        Возвращает индекс ключей, загружая его с диска при первом обращении.
+
+        Строки, дописанные в файл после последнего сохранения индекса (другим экземпляром
+        или перед прерванной записью), учитываются чтением только конца файла; отпечатки
+        вакансий без идентификатора из этих строк добавляются в загруженный индекс отпечатков.
+        Если файл заменен (например, сжат другим экземпляром), индекс загружается заново; если
+        файл короче, чем учтено в индексе, индекс строится заново. Индекс отпечатков в этих
+        случаях перечитывается с диска.
+
+        Returns:
+            KeyIndex: Индекс ключей.
+        """
+        try:
+            stat = os.stat(self.__path)
+            inode, size = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            inode, size = None, 0
+        keys = self.__keys
+        if keys is None or self.__keys_inode != inode or keys.end > size:
+            if keys is not None:
+                self.__fingerprints = None
+            keys = KeyIndex.load(self.__key_path)
+            if keys.end > size:
+                keys = KeyIndex()
+        if keys.end < size:
+            merged = []
+            for offset, end, record in self.__scan(keys.end):
+                if TOMBSTONE_KEY in record:
+                    keys.remove(record[TOMBSTONE_KEY])
+                elif record.get('id') is not None:
+                    keys.set(record['id'], offset, record_fingerprint(record))
+                else:
+                    merged.append(record_fingerprint(record))
+                keys.end = end
+            if self.__fingerprints is not None:
+                self.__fingerprints.merge(merged)
+        self.__keys, self.__keys_inode = keys, inode
+        return keys
+
+    def __size(self) -> int:
+        """
+        Возвращает размер файла вакансий в байтах (0, если файла нет).
+        """
+        return os.path.getsize(self.__path) if os.path.exists(self.__path) else 0
+
+    def __get_fingerprints(self) -> FingerprintIndex:
+        """
+        Возвращает индекс отпечатков вакансий без идентификатора, загружая его с диска
+        при первом обращении.
+
+        Если файла индекса нет, а файл вакансий есть (например, он создан вручную),
+        индекс строится одним проходом по файлу.
+
+        Returns:
+            FingerprintIndex: Индекс отпечатков.
+        """
+        if self.__fingerprints is None:
+            if os.path.exists(self.__fingerprint_path) or not os.path.exists(self.__path):
+                self.__fingerprints = FingerprintIndex.load(self.__fingerprint_path)
+            else:
+                self.__fingerprints = FingerprintIndex(record_fingerprint(item) for item in self.iter_vacancies()
+                                                       if item.get('id') is None)
+        return self.__fingerprints
@@ -0,0 +1,142 @@
+import json
+import os
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class KeyIndex:
+    """
+    Первичный индекс хранилища: идентификатор вакансии -> смещение строки записи в файле
+    данных и отпечаток записи.
+
+    Индекс хранится журналом в формате JSON Lines: строка [ключ, смещение, отпечаток]
+    добавляет или заменяет запись, строка [ключ] удаляет ее, строка [null, конец] отмечает,
+    до какого смещения файла данных индекс актуален. Изменения дописываются в конец журнала,
+    поэтому сохранение после изменения m записей занимает O(m).
+
+    Attributes:
+        end (int): Смещение в файле данных, до которого учтены все записи.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой индекс.
+        """
+        self.end = 0
+        self.__entries: Dict[Hashable, Tuple[int, str]] = {}
+        # Строки журнала, еще не записанные в файл
+        self.__pending: List[str] = []
+        # Журнал записывается целиком, если индекс создан не из него
+        self.__rewrite = True
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.__entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[int, str]]:
+        """
+        Возвращает положение записи по ключу.
+
+        Args:
+            key (Hashable): Идентификатор вакансии.
+
+        Returns:
+            Optional[Tuple[int, str]]: Смещение строки записи и ее отпечаток или None,
+                                       если записи нет.
+        """
+        return self.__entries.get(key)
+
+    def set(self, key: Hashable, offset: int, fingerprint: str) -> None:
+        """
+        Добавляет запись или заменяет положение существующей.
+
+        Args:
+            key (Hashable): Идентификатор вакансии.
+            offset (int): Смещение строки записи в файле данных.
+            fingerprint (str): Отпечаток записи.
+        """
+        self.__entries[key] = (offset, fingerprint)
+        self.__pending.append(json.dumps([key, offset, fingerprint], ensure_ascii=False))
+
+    def remove(self, key: Hashable) -> Optional[Tuple[int, str]]:
+        """
+        Удаляет запись из индекса.
+
+        Args:
+            key (Hashable): Идентификатор вакансии.
+
+        Returns:
+            Optional[Tuple[int, str]]: Положение удаленной записи или None, если ее не было.
+        """
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__pending.append(json.dumps([key], ensure_ascii=False))
+        return entry
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет индекс в журнал, дописывая только изменения и отметку end.
+
+        Args:
+            path (str): Путь к файлу журнала.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        try:
+            if self.__rewrite:
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.writelines(json.dumps([key, offset, fingerprint], ensure_ascii=False) + '\n'
+                                    for key, (offset, fingerprint) in self.__entries.items())
+                    file.write(json.dumps([None, self.end]) + '\n')
+                self.__rewrite = False
+            else:
+                with open(path, 'a', encoding='utf-8') as file:
+                    file.writelines(line + '\n' for line in self.__pending)
+                    file.write(json.dumps([None, self.end]) + '\n')
+            self.__pending = []
+        except IOError as e:
+            raise IOError(f'Ошибка при записи первичного индекса в {path}: {e}')
+
+    @classmethod
+    def load(cls, path: str) -> 'KeyIndex':
+        """
+        Загружает индекс из журнала.
+
+        Изменения после последней отметки end не учитываются: они могли быть записаны
+        не полностью и восстанавливаются по файлу данных.
+
+        Args:
+            path (str): Путь к файлу журнала.
+
+        Returns:
+            KeyIndex: Загруженный индекс или пустой, если файла нет.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла или журнал поврежден.
+        """
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+            # Оборванная строка в конце журнала отбрасывается
+            journal: List[List[Any]] = [json.loads(line) for line in lines if line.endswith('\n')]
+            committed = max((number for number, entry in enumerate(journal) if entry[0] is None), default=-1)
+            for entry in journal[:committed + 1]:
+                if entry[0] is None:
+                    index.end = entry[1]
+                elif len(entry) == 1:
+                    index.__entries.pop(entry[0], None)
+                else:
+                    index.__entries[entry[0]] = (entry[1], entry[2])
+        except (IOError, ValueError, IndexError) as e:
+            raise IOError(f'Ошибка при чтении первичного индекса из {path}: {e}')
+        # Изменения после последней отметки и оборванная строка удаляются перезаписью журнала
+        index.__rewrite = committed + 1 != len(lines)
+        return index
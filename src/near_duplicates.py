@@ -0,0 +1,287 @@
+import zlib
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Tuple, TypeVar
+from .text_index import analyze, vacancy_text
+
+
+T = TypeVar('T')
+
+# Порог коэффициента Жаккара, начиная с которого вакансии считаются почти дубликатами
+DEFAULT_THRESHOLD = 0.7
+
+# Значение MinHash для пустой корзины до уплотнения
+_EMPTY = -1
+
+
+def shingles(text: str, size: int = 2) -> FrozenSet[str]:
+    """
+    Возвращает множество шинглов текста: последовательностей из size термов подряд.
+
+    Термы приводятся к основе (см. text_index.analyze), поэтому словоформы не влияют на
+    сходство. Текст короче size термов дает один шингл из всех термов.
+
+    Args:
+        text (str): Исходный текст.
+        size (int, optional): Количество термов в шингле. По умолчанию 2.
+
+    Returns:
+        FrozenSet[str]: Множество шинглов (пустое для текста без слов).
+    """
+    terms = analyze(text)
+    if len(terms) <= size:
+        return frozenset([' '.join(terms)]) if terms else frozenset()
+    return frozenset(' '.join(terms[i:i + size]) for i in range(len(terms) - size + 1))
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """
+    Вычисляет коэффициент Жаккара двух множеств шинглов.
+
+    Args:
+        first (FrozenSet[str]): Первое множество.
+        second (FrozenSet[str]): Второе множество.
+
+    Returns:
+        float: Отношение размера пересечения к размеру объединения (0, если оба пусты).
+    """
+    if not first or not second:
+        return 0.0
+    common = len(first & second)
+    return common / (len(first) + len(second) - common)
+
+
+def minhash(items: FrozenSet[str], size: int) -> List[int]:
+    """
+    Вычисляет сигнатуру MinHash из size значений одним хэшированием (one permutation hashing).
+
+    Хэш каждого шингла вычисляется один раз и попадает в одну из size корзин; значение
+    корзины — минимальный хэш в ней. Пустые корзины заполняются значением ближайшей
+    непустой корзины справа со сдвигом (уплотнение поворотом), поэтому сигнатура
+    вычисляется за O(len(items) + size), а не O(len(items) * size).
+
+    Args:
+        items (FrozenSet[str]): Непустое множество шинглов.
+        size (int): Длина сигнатуры.
+
+    Returns:
+        List[int]: Сигнатура MinHash.
+    """
+    signature = [_EMPTY] * size
+    for item in items:
+        hashed = zlib.crc32(item.encode('utf-8'))
+        slot, value = hashed % size, hashed // size
+        if signature[slot] == _EMPTY or value < signature[slot]:
+            signature[slot] = value
+    # Сдвиг превышает любое значение корзины, поэтому заимствованные значения
+    # не совпадают с собственными значениями других корзин
+    step = (1 << 32) // size + 1
+    for slot in range(size):
+        if signature[slot] != _EMPTY:
+            continue
+        offset = 1
+        while signature[(slot + offset) % size] == _EMPTY:
+            offset += 1
+        signature[slot] = signature[(slot + offset) % size] + offset * step
+    return signature
+
+
+class NearDuplicateIndex:
+    """
+    Индекс для поиска почти одинаковых текстов методом MinHash с LSH.
+
+    Сигнатура MinHash делится на bands полос по rows значений; документы с совпадающей
+    полосой становятся кандидатами, и только для них вычисляется точный коэффициент Жаккара.
+    Поэтому поиск дубликатов среди n документов не требует сравнения всех пар.
+    При параметрах по умолчанию пара со сходством 0.7 становится кандидатом с
+    вероятностью около 0.99, со сходством 0.3 — около 0.24.
+
+    Attributes:
+        threshold (float): Минимальный коэффициент Жаккара для почти дубликатов.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, bands: int = 10, rows: int = 3, shingle_size: int = 2):
+        """
+        Инициализирует пустой индекс.
+
+        Args:
+            threshold (float, optional): Минимальный коэффициент Жаккара. По умолчанию 0.7.
+            bands (int, optional): Количество полос LSH. По умолчанию 10.
+            rows (int, optional): Количество значений сигнатуры в полосе. По умолчанию 3.
+            shingle_size (int, optional): Количество термов в шингле. По умолчанию 2.
+
+        Raises:
+            ValueError: Если параметры вне допустимых пределов.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError('Порог сходства должен быть в интервале (0, 1].')
+        if bands < 1 or rows < 1 or shingle_size < 1:
+            raise ValueError('Параметры LSH и размер шингла должны быть положительными.')
+        self.threshold = threshold
+        self.__bands = bands
+        self.__rows = rows
+        self.__shingle_size = shingle_size
+        self.__shingles: Dict[Hashable, FrozenSet[str]] = {}
+        self.__buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.__shingles)
+
+    def __band_keys(self, items: FrozenSet[str]) -> List[Tuple[int, ...]]:
+        """
+        Вычисляет ключи полос LSH для множества шинглов.
+
+        Args:
+            items (FrozenSet[str]): Непустое множество шинглов.
+
+        Returns:
+            List[Tuple[int, ...]]: Ключ каждой полосы.
+        """
+        rows = self.__rows
+        signature = minhash(items, self.__bands * rows)
+        return [tuple(signature[start:start + rows]) for start in range(0, len(signature), rows)]
+
+    def __matches(self, items: FrozenSet[str], keys: List[Tuple[int, ...]]) -> List[Tuple[Hashable, float]]:
+        """
+        Проверяет кандидатов из совпадающих полос точным коэффициентом Жаккара.
+
+        Args:
+            items (FrozenSet[str]): Множество шинглов запроса.
+            keys (List[Tuple[int, ...]]): Ключи полос запроса.
+
+        Returns:
+            List[Tuple[Hashable, float]]: Пары (идентификатор, сходство) по убыванию сходства.
+        """
+        candidates = set()
+        for buckets, key in zip(self.__buckets, keys):
+            bucket = buckets.get(key)
+            if bucket:
+                candidates.update(bucket)
+        matches = []
+        for doc_id in candidates:
+            similarity = jaccard(items, self.__shingles[doc_id])
+            if similarity >= self.threshold:
+                matches.append((doc_id, similarity))
+        matches.sort(key=lambda pair: pair[1], reverse=True)
+        return matches
+
+    def add(self, doc_id: Hashable, text: str) -> List[Tuple[Hashable, float]]:
+        """
+        Добавляет документ в индекс и возвращает его почти дубликаты среди ранее добавленных.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+            text (str): Текст документа.
+
+        Returns:
+            List[Tuple[Hashable, float]]: Пары (идентификатор, сходство) по убыванию сходства.
+                                          Текст без слов не индексируется.
+        """
+        items = shingles(text, self.__shingle_size)
+        if not items or doc_id in self.__shingles:
+            return []
+        keys = self.__band_keys(items)
+        matches = self.__matches(items, keys)
+        self.__shingles[doc_id] = items
+        for buckets, key in zip(self.__buckets, keys):
+            buckets.setdefault(key, []).append(doc_id)
+        return matches
+
+    def add_unique(self, doc_id: Hashable, text: str) -> bool:
+        """
+        Добавляет документ в индекс, только если среди добавленных нет его почти дубликатов.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+            text (str): Текст документа.
+
+        Returns:
+            bool: False, если документ — почти дубликат ранее добавленного.
+        """
+        items = shingles(text, self.__shingle_size)
+        if not items:
+            return True
+        keys = self.__band_keys(items)
+        if self.__matches(items, keys):
+            return False
+        self.__shingles[doc_id] = items
+        for buckets, key in zip(self.__buckets, keys):
+            buckets.setdefault(key, []).append(doc_id)
+        return True
+
+    def search(self, text: str) -> List[Tuple[Hashable, float]]:
+        """
+        Находит почти дубликаты текста без добавления его в индекс.
+
+        Args:
+            text (str): Текст запроса.
+
+        Returns:
+            List[Tuple[Hashable, float]]: Пары (идентификатор, сходство) по убыванию сходства.
+        """
+        items = shingles(text, self.__shingle_size)
+        if not items:
+            return []
+        return self.__matches(items, self.__band_keys(items))
+
+
+def cluster_near_duplicates(documents: Iterable[Tuple[Hashable, str]],
+                            threshold: float = DEFAULT_THRESHOLD) -> List[List[Hashable]]:
+    """
+    Группирует документы в кластеры почти дубликатов (транзитивно).
+
+    Args:
+        documents (Iterable[Tuple[Hashable, str]]): Пары (идентификатор, текст).
+        threshold (float, optional): Минимальный коэффициент Жаккара. По умолчанию 0.7.
+
+    Returns:
+        List[List[Hashable]]: Кластеры из двух и более документов в порядке добавления.
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    parents: Dict[Hashable, Hashable] = {}
+
+    def find(doc_id: Hashable) -> Hashable:
+        root = doc_id
+        while parents[root] != root:
+            root = parents[root]
+        # Сжатие пути
+        while parents[doc_id] != root:
+            parents[doc_id], doc_id = root, parents[doc_id]
+        return root
+
+    order = []
+    for doc_id, text in documents:
+        if doc_id in parents:
+            continue
+        parents[doc_id] = doc_id
+        order.append(doc_id)
+        for other, _ in index.add(doc_id, text):
+            first, second = find(other), find(doc_id)
+            if first != second:
+                parents[second] = first
+
+    clusters: Dict[Hashable, List[Hashable]] = {}
+    for doc_id in order:
+        clusters.setdefault(find(doc_id), []).append(doc_id)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def collapse_near_duplicates(items: Iterable[T], threshold: float = DEFAULT_THRESHOLD,
+                             text: Callable[[T], str] = vacancy_text) -> Iterator[T]:
+    """
+    Пропускает почти дубликаты уже выданных элементов потока (по названию и требованиям).
+
+    Из каждой группы перепубликованных вакансий остается первая по порядку потока.
+    Поток обрабатывается лениво.
+
+    Args:
+        items (Iterable[T]): Вакансии, их представления или записи.
+        threshold (float, optional): Минимальный коэффициент Жаккара. По умолчанию 0.7.
+        text (Callable[[T], str], optional): Функция получения текста элемента.
+                                             По умолчанию text_index.vacancy_text.
+
+    Yields:
+        T: Элементы, не являющиеся почти дубликатами предыдущих.
+    """
+    index = NearDuplicateIndex(threshold=threshold)
+    for position, item in enumerate(items):
+        if index.add_unique(position, text(item)):
+            yield item
@@ -0,0 +1,215 @@
+import math
+import os
+import weakref
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import compress
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Минимальный размер части данных, обрабатываемой одним процессом: на меньших
+# частях передача задачи обходится дороже самой фильтрации
+MIN_SLICE_ROWS = 50_000
+
+NAN = float('nan')
+
+
+def _filter_slice(task: Tuple) -> bytes:
+    """
+    Вычисляет предикаты фильтра на части столбцов (выполняется в рабочем процессе).
+
+    Args:
+        task (Tuple): Имена сегментов столбцов, количество строк, границы части [start, stop),
+                      маска подходящих кодов названий, границы зарплаты и признак
+                      исключения нулевой зарплаты.
+
+    Returns:
+        bytes: Индексы подходящих строк (array('q')).
+    """
+    segments, length, start, stop, name_mask, salary_from, salary_to, nonzero = task
+    # Рабочие процессы используют общий с родителем трекер ресурсов, поэтому повторная
+    # регистрация сегмента при подключении не приводит к его удалению при выходе процесса
+    attached = [shared_memory.SharedMemory(name=name) for name in segments]
+    try:
+        return evaluate_filter([segment.buf for segment in attached], length, start, stop,
+                               name_mask, salary_from, salary_to, nonzero).tobytes()
+    finally:
+        for segment in attached:
+            segment.close()
+
+
+def evaluate_filter(buffers: Sequence[memoryview], length: int, start: int, stop: int,
+                    name_mask: Optional[bytes], salary_from: Optional[float], salary_to: Optional[float],
+                    nonzero: bool) -> array:
+    """
+    Вычисляет предикаты фильтра на части столбцов.
+
+    Буферы могут находиться в разделяемой памяти или в отображенных в память файлах
+    (см. columnar_store). Предикаты применяются последовательно, каждый — только
+    к строкам, прошедшим предыдущие. Отсутствующая зарплата хранится как NaN, и любое сравнение с ней ложно.
+
+    Args:
+        buffers (Sequence[memoryview]): Буферы столбцов: зарплата от, зарплата до, коды названий.
+        length (int): Количество строк.
+        start (int): Начало части.
+        stop (int): Конец части (не включается).
+        name_mask (Optional[bytes]): Маска подходящих кодов названий.
+        salary_from (Optional[float]): Минимальная зарплата от.
+        salary_to (Optional[float]): Максимальная зарплата до.
+        nonzero (bool): Исключать нулевую зарплату.
+
+    Returns:
+        array: Индексы подходящих строк по возрастанию.
+    """
+    views = [buffers[0][:length * 8].cast('d'), buffers[1][:length * 8].cast('d'),
+             buffers[2][:length * 4].cast('i')]
+    try:
+        # Индексы кандидатов отсчитываются от начала части
+        candidates: Iterable[int] = range(stop - start)
+        if name_mask is not None:
+            # Маска кодов проверяется встроенными функциями, без цикла на Python
+            candidates = compress(candidates, map(name_mask.__getitem__, views[2][start:stop]))
+        if salary_from is not None:
+            values = views[0][start:stop].tolist()
+            candidates = [index for index in candidates if values[index] >= salary_from]
+            if nonzero and salary_from <= 0:
+                candidates = [index for index in candidates if values[index]]
+        if salary_to is not None:
+            values = views[1][start:stop].tolist()
+            candidates = [index for index in candidates if values[index] <= salary_to]
+            if nonzero:
+                candidates = [index for index in candidates if values[index]]
+        return array('q', map(start.__add__, candidates))
+    finally:
+        for view in views:
+            view.release()
+
+
+def _release(segments: List[shared_memory.SharedMemory], pools: List[Executor]) -> None:
+    """
+    Освобождает сегменты разделяемой памяти и останавливает пул процессов.
+    """
+    for pool in pools:
+        pool.shutdown(wait=True)
+    pools.clear()
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+    segments.clear()
+
+
+class SharedColumns:
+    """
+    Столбцы вакансий в разделяемой памяти для параллельной фильтрации.
+
+    Зарплата от и до (в базовой валюте) хранится столбцами float64, название — столбцом
+    кодов int32 со словарем различных значений. Рабочие процессы подключаются к сегментам
+    по имени и вычисляют предикаты на непересекающихся частях строк без передачи самих
+    записей; результаты объединяются как массивы индексов.
+
+    Сегменты освобождаются методом close() или при удалении объекта.
+    """
+
+    def __init__(self, salary_from: Iterable[Optional[float]], salary_to: Iterable[Optional[float]],
+                 names: Iterable[Optional[str]], workers: Optional[int] = None):
+        """
+        Инициализирует экземпляр SharedColumns.
+
+        Args:
+            salary_from (Iterable[Optional[float]]): Зарплата от по строкам (None, если не указана).
+            salary_to (Iterable[Optional[float]]): Зарплата до по строкам (None, если не указана).
+            names (Iterable[Optional[str]]): Названия вакансий по строкам.
+            workers (Optional[int], optional): Количество рабочих процессов. По умолчанию
+                                               None (по количеству процессоров).
+        """
+        from_column = array('d', (NAN if value is None else value for value in salary_from))
+        to_column = array('d', (NAN if value is None else value for value in salary_to))
+        codes: Dict[str, int] = {}
+        name_column = array('i', (codes.setdefault(name or '', len(codes)) for name in names))
+        if not len(from_column) == len(to_column) == len(name_column):
+            raise ValueError('Столбцы должны иметь одинаковую длину')
+
+        self.__length = len(name_column)
+        self.__names = list(codes)
+        self.__workers = workers
+        self.__segments: List[shared_memory.SharedMemory] = []
+        self.__pools: List[Executor] = []
+        for column in (from_column, to_column, name_column):
+            data = memoryview(column).cast('B')
+            segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            segment.buf[:len(data)] = data
+            self.__segments.append(segment)
+        self.__finalizer = weakref.finalize(self, _release, self.__segments, self.__pools)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __enter__(self) -> 'SharedColumns':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает рабочие процессы и освобождает разделяемую память.
+        """
+        self.__finalizer()
+
+    def filter(self, name: Optional[str] = None, salary_from: Optional[float] = None,
+               salary_to: Optional[float] = None, nonzero: bool = False) -> List[int]:
+        """
+        Возвращает индексы строк, удовлетворяющих всем заданным условиям.
+
+        Args:
+            name (Optional[str], optional): Подстрока названия (без учета регистра).
+            salary_from (Optional[float], optional): Зарплата от не меньше значения.
+            salary_to (Optional[float], optional): Зарплата до не больше значения.
+            nonzero (bool, optional): Считать нулевую зарплату неуказанной. По умолчанию False.
+
+        Returns:
+            List[int]: Индексы подходящих строк по возрастанию.
+        """
+        name_mask = None
+        if name is not None:
+            # Подстрока проверяется один раз для каждого различного названия
+            needle = name.lower()
+            name_mask = bytes(needle in value.lower() for value in self.__names)
+
+        slices = self.__slices()
+        if len(slices) <= 1:
+            buffers = [segment.buf for segment in self.__segments]
+            return evaluate_filter(buffers, self.__length, 0, self.__length,
+                                   name_mask, salary_from, salary_to, nonzero).tolist()
+
+        segments = [segment.name for segment in self.__segments]
+        tasks = [(segments, self.__length, start, stop, name_mask, salary_from, salary_to, nonzero)
+                 for start, stop in slices]
+        result = array('q')
+        for chunk in self.__pool().map(_filter_slice, tasks):
+            result.frombytes(chunk)
+        return result.tolist()
+
+    def __slices(self) -> List[Tuple[int, int]]:
+        """
+        Делит строки на непересекающиеся части по количеству рабочих процессов.
+
+        Returns:
+            List[Tuple[int, int]]: Границы частей [start, stop).
+        """
+        workers = self.__workers or os.cpu_count() or 1
+        count = max(1, min(workers, math.ceil(self.__length / MIN_SLICE_ROWS)))
+        size = math.ceil(self.__length / count) if self.__length else 0
+        return [(start, min(start + size, self.__length)) for start in range(0, self.__length, size or 1)]
+
+    def __pool(self) -> Executor:
+        """
+        Возвращает пул рабочих процессов, создавая его при первом обращении.
+
+        Returns:
+            Executor: Пул процессов.
+        """
+        if not self.__pools:
+            self.__pools.append(ProcessPoolExecutor(max_workers=self.__workers))
+        return self.__pools[0]
@@ -0,0 +1,148 @@
+import json
+import os
+import random
+from collections import Counter
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+
+class ParseReport:
+    """
+    Отчет об ошибках парсинга вакансий.
+
+    Ошибки учитываются счетчиками по типу и тексту ошибки; примеры исходных элементов
+    хранятся в ограниченной случайной выборке (reservoir sampling), поэтому объем отчета
+    не зависит от количества ошибок. Отклоненные элементы не накапливаются в памяти: они
+    дописываются в файл карантина по мере учета через буферизованный файл, открываемый при
+    первой ошибке, и сохраняются на диск вызовом write_quarantine после парсинга.
+
+    Attributes:
+        total (int): Количество обработанных элементов.
+        rejected (int): Количество отклоненных элементов.
+        errors (Counter): Количество ошибок по виду 'Тип: текст ошибки'.
+        samples (List[Tuple[str, Any]]): Примеры отклоненных элементов (вид ошибки, элемент).
+    """
+
+    def __init__(self, sample_size: int = 5, quarantine_path: Optional[str] = None,
+                 seed: Optional[int] = None):
+        """
+        Инициализирует экземпляр ParseReport.
+
+        Args:
+            sample_size (int, optional): Максимальное количество примеров. По умолчанию 5.
+            quarantine_path (Optional[str], optional): Путь к файлу карантина (JSON Lines) для
+                                                       отклоненных элементов. По умолчанию None
+                                                       (элементы не сохраняются).
+            seed (Optional[int], optional): Начальное значение генератора выборки примеров.
+        """
+        self.sample_size = sample_size
+        self.quarantine_path = quarantine_path
+        self.__random = random.Random(seed)
+        self.__quarantine: Optional[TextIO] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Очищает отчет перед очередным парсингом. Уже учтенные элементы остаются в карантине.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл карантина.
+        """
+        self.write_quarantine()
+        self.total = 0
+        self.rejected = 0
+        self.errors: Counter = Counter()
+        self.samples: List[Tuple[str, Any]] = []
+        self.__quarantined = 0
+
+    def record_error(self, error: BaseException, item: Any) -> None:
+        """
+        Учитывает отклоненный элемент.
+
+        Args:
+            error (BaseException): Ошибка обработки элемента.
+            item (Any): Исходный элемент.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл карантина.
+        """
+        kind = f'{type(error).__name__}: {error}'
+        self.rejected += 1
+        self.errors[kind] += 1
+        if len(self.samples) < self.sample_size:
+            self.samples.append((kind, item))
+        else:
+            # Каждый отклоненный элемент попадает в выборку с равной вероятностью
+            slot = self.__random.randrange(self.rejected)
+            if slot < self.sample_size:
+                self.samples[slot] = (kind, item)
+        if self.quarantine_path is not None:
+            try:
+                if self.__quarantine is None:
+                    directory = os.path.dirname(self.quarantine_path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    self.__quarantine = open(self.quarantine_path, 'a', encoding='utf-8')
+                self.__quarantine.write(json.dumps({"error": kind, "item": item}, ensure_ascii=False,
+                                                   default=str) + '\n')
+            except IOError as e:
+                raise IOError(f'Ошибка при записи в {self.quarantine_path}: {e}')
+            self.__quarantined += 1
+
+    def write_quarantine(self) -> int:
+        """
+        Завершает запись отклоненных элементов: сбрасывает буфер и закрывает файл карантина.
+        Следующая ошибка снова откроет файл для дозаписи.
+
+        Returns:
+            int: Количество элементов, записанных с предыдущего вызова.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        if self.__quarantine is None:
+            return 0
+        file, self.__quarantine = self.__quarantine, None
+        try:
+            file.close()
+        except IOError as e:
+            raise IOError(f'Ошибка при записи в {self.quarantine_path}: {e}')
+        written, self.__quarantined = self.__quarantined, 0
+        return written
+
+    def summary(self, example_length: int = 200) -> str:
+        """
+        Формирует текстовую сводку отчета.
+
+        Args:
+            example_length (int, optional): Максимальная длина текста примера. По умолчанию 200.
+
+        Returns:
+            str: Сводка: количество отклоненных элементов, счетчики ошибок и примеры.
+        """
+        lines = [f'Пропущено некорректных элементов: {self.rejected} из {self.total}']
+        for kind, count in self.errors.most_common():
+            lines.append(f'  {kind} — {count}')
+        if self.samples:
+            lines.append('Примеры:')
+            for kind, item in self.samples:
+                text = repr(item)
+                if len(text) > example_length:
+                    text = text[:example_length] + '...'
+                lines.append(f'  {kind}: {text}')
+        if self.quarantine_path is not None:
+            lines.append(f'Отклоненные элементы сохранены в {self.quarantine_path}')
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Преобразует отчет в словарь.
+
+        Returns:
+            Dict[str, Any]: Словарь с количеством элементов, счетчиками ошибок и примерами.
+        """
+        return {
+            "total": self.total,
+            "rejected": self.rejected,
+            "errors": dict(self.errors),
+            "samples": [{"error": kind, "item": item} for kind, item in self.samples],
+        }
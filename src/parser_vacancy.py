@@ -1,5 +1,17 @@
-from typing import List, Dict, Any, Optional
-from .vacancy import Vacancy
+from operator import attrgetter
+from typing import List, Dict, Any, Callable, Optional, Iterable, Iterator, Tuple
+from .currency import CurrencyConverter
+from .interval_index import IntervalIndex
+from .near_duplicates import DEFAULT_THRESHOLD, collapse_near_duplicates
+from .parallel_filter import SharedColumns
+from .parse_report import ParseReport
+from .query import OrderItem, compile_order_by, select_top_n
+from .text_index import InvertedIndex, TrigramIndex, vacancy_text
+from .vacancy import NUMERIC_ORDER_FIELDS, LazyVacancy, Vacancy, vacancy_from_raw
+
+
+# Фильтры, которые вычисляются по столбцам в разделяемой памяти в параллельном режиме
+PARALLEL_FILTERS = ('name', 'salary_from', 'salary_to')
 
 
 class ParserVacancy:
@@ -7,17 +19,52 @@ class ParserVacancy:
     Класс для парсинга данных вакансий из API HH.ru.
 
     Attributes:
-        data (List[Dict[str, Any]]): Список вакансий в формате словарей.
+        data (Iterable[Dict[str, Any]]): Вакансии в формате словарей (список или поток).
+        converter (Optional[CurrencyConverter]): Конвертер зарплат в базовую валюту.
+        report (ParseReport): Отчет об ошибках последнего чтения исходных данных.
     """
 
-    def __init__(self, data: List[Dict[str, Any]]):
+    def __init__(self, data: Iterable[Dict[str, Any]], converter: Optional[CurrencyConverter] = None,
+                 report: Optional[ParseReport] = None, workers: Optional[int] = None):
         """
         Инициализирует экземпляр ParserVacancy.
 
         Args:
-            data (List[Dict[str, Any]]): Список вакансий в формате словарей.
+            data (Iterable[Dict[str, Any]]): Вакансии в формате словарей. Может быть потоком
+                                             (например, генератором), тогда парсинг с фильтрами
+                                             не материализует его целиком.
+            converter (Optional[CurrencyConverter], optional): Конвертер зарплат в базовую валюту.
+                                                               Фильтры и сортировки по зарплате
+                                                               используют нормализованные значения.
+                                                               По умолчанию None (без пересчета).
+            report (Optional[ParseReport], optional): Отчет об ошибках парсинга (например, с файлом
+                                                      карантина). По умолчанию создается новый.
+            workers (Optional[int], optional): Количество процессов для параллельной фильтрации
+                                               по столбцам в разделяемой памяти. По умолчанию
+                                               None (фильтрация в текущем процессе).
         """
         self.__data = data
+        self.__converter = converter
+        self.__report = report if report is not None else ParseReport()
+        # Отчет выводится один раз после каждого чтения исходных данных
+        self.__report_pending = False
+        # Вакансии и индексы поиска строятся при первом поисковом запросе и переиспользуются
+        self.__indexed: Optional[List[Vacancy]] = None
+        self.__text_index: Optional[InvertedIndex] = None
+        self.__trigram_index: Optional[TrigramIndex] = None
+        self.__interval_index: Optional[IntervalIndex] = None
+        # Столбцы для параллельной фильтрации строятся при первом запросе
+        self.__workers = workers
+        self.__columns: Optional[SharedColumns] = None
+
+    def get_report(self) -> ParseReport:
+        """
+        Возвращает отчет об ошибках парсинга.
+
+        Returns:
+            ParseReport: Отчет об ошибках последнего чтения исходных данных.
+        """
+        return self.__report
 
     def parse_vacancies(self, params: Optional[Dict[str, Any]] = None) -> List[Vacancy]:
         """
@@ -34,11 +81,21 @@ class ParserVacancy:
             Exception: Если происходит ошибка при парсинге.
         """
         try:
-            vacancies_list = self.__creating_vacancy_list()
-            # Применение фильтров, если они заданы
+            # Применение фильтров, если они заданы, к потоку вакансий
             if params:
-                vacancies_list = self.__filter_vacancies(vacancies_list, params)
-            return vacancies_list
+                if 'text' in params or 'fuzzy_name' in params or 'salary_overlap' in params:
+                    source = self.__search(params)
+                elif self.__workers is not None:
+                    source, params = self.__parallel_filter(params)
+                else:
+                    # Ленивые представления: Vacancy создается только для результатов,
+                    # поля извлекаются из словаря при первом обращении
+                    source = self.__iter_views()
+                filtered = self.__filter_vacancies(source, params)
+                result = [vac.materialize() if isinstance(vac, LazyVacancy) else vac for vac in filtered]
+                self.__finish_report()
+                return result
+            return self.__creating_vacancy_list()
         except Exception as e:
             raise Exception(f'Ошибка при парсинге данных: {e}')
 
@@ -49,80 +106,310 @@ class ParserVacancy:
         Returns:
             List[Vacancy]: Список экземпляров Vacancy.
         """
+        vacancies_list = list(self.__iter_vacancies())
+        self.__finish_report()
+        print(f'Всего вакансий после парсинга: {len(vacancies_list)}')
+        return vacancies_list
+
+    def __finish_report(self) -> None:
+        """
+        Сохраняет отклоненные элементы в карантин и выводит сводку ошибок, если они были.
+        Вызывается после парсинга, вне цикла обработки элементов.
+        """
+        if not self.__report_pending:
+            return
+        self.__report_pending = False
+        self.__report.write_quarantine()
+        if self.__report.rejected:
+            print(self.__report.summary())
+
+    def __search(self, params: Dict[str, Any]) -> List[Vacancy]:
+        """
+        Выполняет поиск по индексам: полнотекстовый ('text', 'text_mode') по названию и
+        требованиям, нечеткий ('fuzzy_name', 'fuzzy_threshold') по названию и поиск вакансий,
+        вилка зарплаты которых пересекается с диапазоном ('salary_overlap': (от, до), None —
+        открытая граница).
+
+        При первом вызове вакансии парсятся один раз, индексы строятся инкрементально при
+        первом обращении к ним; последующие запросы обращаются только к индексам.
+
+        Args:
+            params (Dict[str, Any]): Словарь с фильтрами.
+
+        Returns:
+            List[Vacancy]: Найденные вакансии по убыванию релевантности. Если заданы оба
+                           запроса, порядок задает полнотекстовый поиск; при поиске только
+                           по зарплате сохраняется исходный порядок.
+        """
+        vacancies = self.__get_indexed()
+
+        positions = None
+        if 'text' in params:
+            if self.__text_index is None:
+                self.__text_index = InvertedIndex()
+                for position, vacancy in enumerate(vacancies):
+                    self.__text_index.add(position, vacancy_text(vacancy))
+            matches = self.__text_index.search(params['text'], mode=params.get('text_mode', 'and'))
+            positions = [position for position, _ in matches]
+
+        if 'fuzzy_name' in params:
+            if self.__trigram_index is None:
+                self.__trigram_index = TrigramIndex()
+                for position, vacancy in enumerate(vacancies):
+                    self.__trigram_index.add(position, vacancy.name)
+            matches = self.__trigram_index.search(params['fuzzy_name'],
+                                                  threshold=params.get('fuzzy_threshold', 0.4))
+            fuzzy = [position for position, _ in matches]
+            if positions is None:
+                positions = fuzzy
+            else:
+                fuzzy_set = set(fuzzy)
+                positions = [position for position in positions if position in fuzzy_set]
+
+        if 'salary_overlap' in params:
+            if self.__interval_index is None:
+                self.__interval_index = IntervalIndex()
+                for position, vacancy in enumerate(vacancies):
+                    self.__interval_index.add(position, vacancy.norm_salary_from or None,
+                                              vacancy.norm_salary_to or None)
+            low, high = params['salary_overlap']
+            overlap = self.__interval_index.search(low, high)
+            if positions is None:
+                # Без текстового запроса сохраняется исходный порядок вакансий
+                positions = sorted(overlap)
+            else:
+                overlap_set = set(overlap)
+                positions = [position for position in positions if position in overlap_set]
+
+        return [vacancies[position] for position in positions]
+
+    def __parallel_filter(self, params: Dict[str, Any]) -> Tuple[List[Vacancy], Dict[str, Any]]:
+        """
+        Применяет фильтры по названию и зарплате параллельно по столбцам в разделяемой памяти.
+
+        Рабочие процессы вычисляют условия на непересекающихся частях строк и возвращают
+        индексы подходящих вакансий; сами вакансии между процессами не передаются.
+
+        Args:
+            params (Dict[str, Any]): Словарь с фильтрами.
+
+        Returns:
+            Tuple[List[Vacancy], Dict[str, Any]]: Подходящие вакансии в исходном порядке и
+                                                  оставшиеся параметры (сортировки, top_n).
+        """
+        vacancies = self.__get_indexed()
+        if self.__columns is None:
+            self.__columns = SharedColumns((vac.norm_salary_from for vac in vacancies),
+                                           (vac.norm_salary_to for vac in vacancies),
+                                           (vac.name for vac in vacancies), workers=self.__workers)
+        positions = self.__columns.filter(name=params.get('name'), salary_from=params.get('salary_from'),
+                                          salary_to=params.get('salary_to'), nonzero=True)
+        rest = {key: value for key, value in params.items() if key not in PARALLEL_FILTERS}
+        return [vacancies[position] for position in positions], rest
+
+    def __get_indexed(self) -> List[Vacancy]:
+        """
+        Возвращает список вакансий для поиска и параллельной фильтрации, парся данные
+        при первом обращении.
+
+        Returns:
+            List[Vacancy]: Вакансии с зарплатой, нормализованной к базовой валюте.
+        """
+        if self.__indexed is None:
+            self.__indexed = list(self.__iter_vacancies())
+        return self.__indexed
+
+    def __iter_vacancies(self) -> Iterator[Vacancy]:
+        """
+        Возвращает поток вакансий с зарплатой, нормализованной к базовой валюте.
+
+        Returns:
+            Iterator[Vacancy]: Поток экземпляров Vacancy.
+        """
+        vacancies = self.__construct_vacancies()
+        if self.__converter is not None:
+            vacancies = self.__converter.normalize(vacancies)
+        return vacancies
+
+    def __iter_views(self) -> Iterator[LazyVacancy]:
+        """
+        Возвращает поток ленивых представлений корректных вакансий с зарплатой,
+        нормализованной к базовой валюте.
+
+        Поля, нужные для проверки, извлекаются сразу; остальные — при первом обращении.
+
+        Returns:
+            Iterator[LazyVacancy]: Поток ленивых представлений.
+        """
+        views = self.__construct_views()
+        if self.__converter is not None:
+            views = self.__converter.normalize(views)
+        return views
+
+    def __construct_views(self) -> Iterator[LazyVacancy]:
+        """
+        Создает ленивые представления исходных данных. Проверка полей выполняется позже,
+        в __filter_vacancies, только для вакансий, прошедших фильтры.
+
+        Yields:
+            LazyVacancy: Очередное представление вакансии.
+        """
+        report = self.__report
+        report.reset()
+        self.__report_pending = True
         if not self.__data:
-            return []
+            return
 
-        vacancies_list = []
         for item in self.__data:
-            try:
-                salary = item.get('salary') or {}
-                snippet = item.get('snippet') or {}
-                area = item.get('area') or {}
-
-                vacancy = Vacancy(
-                    name=item.get('name', 'Без названия'),
-                    desc=area.get('name', 'Без описания'),
-                    salary_from=salary.get('from'),
-                    salary_to=salary.get('to'),
-                    currency=salary.get('currency', "RUB"),
-                    url=item.get('url', 'alternate_url'),
-                    requirement=snippet.get('requirement', 'Информация отсутствует')
-                )
-                vacancies_list.append(vacancy)
-            except AttributeError as e:
-                print(f"Ошибка обработки элемента: {e}, данные элемента: {item}")
+            report.total += 1
+            if not isinstance(item, dict):
+                report.record_error(TypeError('элемент не является словарем'), item)
                 continue
-            except Exception as e:
-                print(f"Неизвестная ошибка при обработке элемента: {e}, данные элемента: {item}")
+            yield LazyVacancy(item)
+
+    def __valid_only(self, vacancies: Iterable[Any]) -> Iterator[Any]:
+        """
+        Пропускает некорректные ленивые представления вакансий, учитывая их в отчете.
+
+        Args:
+            vacancies (Iterable[Any]): Вакансии или их ленивые представления.
+
+        Yields:
+            Any: Корректные вакансии или представления.
+        """
+        for vac in vacancies:
+            if isinstance(vac, LazyVacancy) and not vac.is_valid():
+                self.__report.record_error(vac.error, vac.raw)
                 continue
+            yield vac
 
-        print(f'Всего вакансий после парсинга: {len(vacancies_list)}')
-        return vacancies_list
+    def __construct_vacancies(self) -> Iterator[Vacancy]:
+        """
+        Лениво преобразует исходные данные в экземпляры Vacancy, пропуская некорректные элементы.
+        Ошибки учитываются в отчете без вывода в цикле.
+
+        Yields:
+            Vacancy: Очередной экземпляр Vacancy.
+        """
+        report = self.__report
+        report.reset()
+        self.__report_pending = True
+        if not self.__data:
+            return
+
+        for item in self.__data:
+            report.total += 1
+            if not isinstance(item, dict):
+                report.record_error(TypeError('элемент не является словарем'), item)
+                continue
+            try:
+                # Поля извлекаются функцией, скомпилированной по схеме VACANCY_SCHEMA;
+                # повторяющиеся строки интернируются при извлечении
+                vacancy = vacancy_from_raw(item)
+                yield vacancy
+            except Exception as e:
+                report.record_error(e, item)
+                continue
 
-    def __filter_vacancies(self, data: List[Vacancy], filter_params: Dict[str, Any]) -> List[Vacancy]:
+    def __filter_vacancies(self, data: Iterable[Vacancy], filter_params: Dict[str, Any]) -> List[Vacancy]:
         """
-        Применяет фильтры к списку вакансий.
+        Применяет фильтры к потоку вакансий.
+
+        Фильтры и сортировки по зарплате используют зарплату в базовой валюте
+        (norm_salary_from, norm_salary_to). Фильтры применяются лениво. Параметр 'order_by'
+        (список полей с направлением и положением пустых значений) и флаги сортировки
+        компилируются в один составной ключ, поэтому сортировка выполняется за один проход.
+        Если задан top_n, выборка выполняется ограниченной кучей по потоку подходящих вакансий
+        без полной сортировки. Параметр 'collapse_duplicates' (True или порог сходства)
+        оставляет из перепубликованных вакансий с почти одинаковыми названием и требованиями
+        первую по порядку (см. near_duplicates.collapse_near_duplicates).
 
         Args:
-            data (List[Vacancy]): Список вакансий для фильтрации.
+            data (Iterable[Vacancy]): Вакансии для фильтрации (список или поток).
             filter_params (Dict[str, Any]): Словарь с фильтрами.
 
         Returns:
             List[Vacancy]: Отфильтрованный список вакансий.
         """
-        filtered = data
+        filtered: Iterable[Vacancy] = data
 
         # Фильтр по имени
         if 'name' in filter_params:
-            filtered = [vac for vac in filtered if filter_params['name'].lower() in vac.name.lower()]
+            name = filter_params['name'].lower()
+            filtered = (vac for vac in filtered if name in (vac.name or '').lower())
 
         # Фильтр по зарплате от
         if 'salary_from' in filter_params:
-            filtered = [vac for vac in filtered if vac.salary_from and vac.salary_from >= filter_params['salary_from']]
+            salary_from = filter_params['salary_from']
+            filtered = (vac for vac in filtered if vac.norm_salary_from and vac.norm_salary_from >= salary_from)
 
         # Фильтр по зарплате до
         if 'salary_to' in filter_params:
-            filtered = [vac for vac in filtered if vac.salary_to and vac.salary_to <= filter_params['salary_to']]
-
-        # Сортировка по зарплате от
-        if filter_params.get('sorted_salary_from'):
-            filtered.sort(key=lambda x: x.salary_from or 0, reverse=True)
-
-        # Сортировка по зарплате до
-        if filter_params.get('sorted_salary_to'):
-            filtered.sort(key=lambda x: x.salary_to or 0, reverse=True)
+            salary_to = filter_params['salary_to']
+            filtered = (vac for vac in filtered if vac.norm_salary_to and vac.norm_salary_to <= salary_to)
 
-        # Сортировка по средней зарплате (по возрастанию)
-        if filter_params.get('sorted_avg_salary_asc'):
-            filtered = sorted(filtered)
+        # Проверка ленивых представлений: только для вакансий, прошедших фильтры
+        filtered = self.__valid_only(filtered)
 
-        # Сортировка по средней зарплате (по убыванию)
-        if filter_params.get('sorted_avg_salary_desc'):
-            filtered = sorted(filtered, reverse=True)
+        # Схлопывание почти дубликатов среди прошедших фильтры вакансий
+        if filter_params.get('collapse_duplicates'):
+            threshold = filter_params['collapse_duplicates']
+            filtered = collapse_near_duplicates(filtered, threshold=DEFAULT_THRESHOLD if threshold is True else threshold)
 
-        # Топ N вакансий
+        # Топ N вакансий по ключу сортировки или полная сортировка за один проход
+        order_by = self.__order_by(filter_params)
+        key = compile_order_by(order_by, self.__order_field, numeric=NUMERIC_ORDER_FIELDS) if order_by else None
         if 'top_n' in filter_params:
-            top_n = filter_params['top_n']
-            filtered = filtered[:top_n]
+            return select_top_n(filtered, filter_params['top_n'], key=key)
 
+        filtered = list(filtered)
+        if key is not None:
+            filtered.sort(key=key)
         return filtered
+
+    @staticmethod
+    def __order_by(filter_params: Dict[str, Any]) -> List[OrderItem]:
+        """
+        Собирает спецификацию сортировки из параметра 'order_by' и флагов сортировки.
+
+        Флаги применялись как последовательные устойчивые сортировки, поэтому последний
+        из них — главный ключ, а предыдущие разрешают равенство. Они добавляются после
+        полей 'order_by'. Отсутствующая зарплата сортируется как наименьшая.
+
+        Args:
+            filter_params (Dict[str, Any]): Словарь с фильтрами.
+
+        Returns:
+            List[OrderItem]: Спецификация сортировки (см. query.compile_order_by).
+        """
+        flags = [
+            ('sorted_salary_from', ('salary_from', 'desc', 'last')),
+            ('sorted_salary_to', ('salary_to', 'desc', 'last')),
+            ('sorted_avg_salary_asc', ('avg_salary', 'asc', 'first')),
+            ('sorted_avg_salary_desc', ('avg_salary', 'desc', 'last')),
+        ]
+        legacy = [item for flag, item in flags if filter_params.get(flag)]
+        return list(filter_params.get('order_by') or []) + legacy[::-1]
+
+    @staticmethod
+    def __order_field(name: str) -> Callable[[Any], Any]:
+        """
+        Возвращает функцию чтения поля вакансии для сортировки.
+
+        Зарплата берется в базовой валюте; поле 'avg_salary' — средняя зарплата в базовой
+        валюте (None, если зарплата не указана).
+
+        Args:
+            name (str): Имя поля.
+
+        Returns:
+            Callable[[Any], Any]: Функция чтения значения поля.
+        """
+        if name == 'salary_from':
+            return attrgetter('norm_salary_from')
+        if name == 'salary_to':
+            return attrgetter('norm_salary_to')
+        if name == 'avg_salary':
+            # Предвычисленный ключ равен 0, только если зарплата не указана
+            return lambda vac: vac.sort_key or None
+        return lambda vac: getattr(vac, name, None)
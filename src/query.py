@@ -0,0 +1,176 @@
+import heapq
+import math
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+
+T = TypeVar('T')
+
+
+def select_top_n(items: Iterable[T], n: int, key: Optional[Callable[[T], Any]] = None,
+                 reverse: bool = False) -> List[T]:
+    """
+    Выбирает первые N элементов потока в порядке сортировки без полной сортировки.
+
+    Использует ограниченную кучу размера N (O(m log N) для потока из m элементов),
+    поэтому поток не материализуется целиком. Результат совпадает с
+    sorted(items, key=key, reverse=reverse)[:n], включая порядок равных элементов.
+
+    Args:
+        items (Iterable[T]): Поток элементов (список, генератор и т.п.).
+        n (int): Количество элементов в выборке.
+        key (Optional[Callable[[T], Any]], optional): Функция ключа сортировки.
+                                                      Если не указана, берутся первые N элементов потока.
+        reverse (bool, optional): Выбирать наибольшие элементы. По умолчанию False.
+
+    Returns:
+        List[T]: Первые N элементов в порядке сортировки.
+    """
+    if n <= 0:
+        return []
+    if key is None:
+        return list(islice(items, n))
+    if reverse:
+        return heapq.nlargest(n, items, key=key)
+    return heapq.nsmallest(n, items, key=key)
+
+
+# Элемент спецификации сортировки: поле, (поле, направление) или (поле, направление, NULL)
+OrderItem = Union[str, Tuple[str, str], Tuple[str, str, str]]
+
+DIRECTIONS = ('asc', 'desc')
+NULLS = ('first', 'last')
+
+
+class _Descending:
+    """
+    Обертка значения с обратным порядком сравнения для сортировки по убыванию
+    нечисловых значений (например, строк) в составном ключе по возрастанию.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: '_Descending') -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: '_Descending') -> bool:
+        return other.value < self.value
+
+
+def normalize_order_by(order_by: Iterable[OrderItem]) -> List[Tuple[str, str, str]]:
+    """
+    Приводит спецификацию сортировки к списку троек (поле, направление, положение NULL).
+
+    Направление по умолчанию — 'asc'; пустые значения (None) по умолчанию располагаются
+    в конце при любом направлении.
+
+    Args:
+        order_by (Iterable[OrderItem]): Поля сортировки в порядке приоритета: имя поля,
+                                        (поле, 'asc' | 'desc') или
+                                        (поле, 'asc' | 'desc', 'first' | 'last').
+
+    Returns:
+        List[Tuple[str, str, str]]: Нормализованная спецификация.
+
+    Raises:
+        ValueError: Если направление или положение NULL указаны неверно.
+    """
+    result = []
+    for item in order_by:
+        if isinstance(item, str):
+            item = (item,)
+        field, direction, nulls = (tuple(item) + ('asc', 'last')[len(item) - 1:])[:3]
+        direction, nulls = direction.lower(), nulls.lower()
+        if direction not in DIRECTIONS:
+            raise ValueError(f'Неизвестное направление сортировки: {direction}')
+        if nulls not in NULLS:
+            raise ValueError(f'Неизвестное положение пустых значений: {nulls}')
+        result.append((field, direction, nulls))
+    return result
+
+
+def parse_order_by(text: str) -> List[Tuple[str, str, str]]:
+    """
+    Разбирает спецификацию сортировки из строки, например
+    'salary_from desc, name asc nulls first'.
+
+    Args:
+        text (str): Поля через запятую, за каждым — необязательные направление и
+                    'nulls first' | 'nulls last'.
+
+    Returns:
+        List[Tuple[str, str, str]]: Нормализованная спецификация.
+
+    Raises:
+        ValueError: Если строка не соответствует формату.
+    """
+    order_by = []
+    for part in text.split(','):
+        words = part.split()
+        if not words:
+            continue
+        field, rest = words[0], [word.lower() for word in words[1:]]
+        direction = rest.pop(0) if rest and rest[0] in DIRECTIONS else 'asc'
+        nulls = 'last'
+        if rest[:1] == ['nulls'] and len(rest) == 2:
+            nulls = rest[1]
+        elif rest:
+            raise ValueError(f'Неверный формат сортировки: {part.strip()}')
+        order_by.append((field, direction, nulls))
+    return normalize_order_by(order_by)
+
+
+def compile_order_by(order_by: Iterable[OrderItem], accessor: Callable[[str], Callable[[T], Any]],
+                     numeric: Iterable[str] = ()) -> Callable[[T], Any]:
+    """
+    Компилирует спецификацию сортировки в один составной ключ по возрастанию.
+
+    Сортировка по ключу выполняется за один проход и корректно разрешает равенство по
+    следующим полям. Для каждого поля в ключ входят признак пустого значения (положение NULL
+    не зависит от направления) и само значение: по убыванию числа берутся с обратным знаком,
+    прочие значения оборачиваются в _Descending. Функция ключа генерируется для конкретной
+    спецификации, без цикла по полям при вызове.
+
+    Для числовых полей признак пустого значения и значение объединяются в одно число
+    (пустое значение — бесконечность), поэтому сортировка по одному числовому полю
+    сравнивает числа, а не кортежи.
+
+    Args:
+        order_by (Iterable[OrderItem]): Спецификация сортировки (см. normalize_order_by).
+        accessor (Callable[[str], Callable[[T], Any]]): Возвращает функцию чтения значения
+                                                        поля по его имени.
+        numeric (Iterable[str], optional): Поля, значения которых — числа или None.
+
+    Returns:
+        Callable[[T], Any]: Функция составного ключа.
+
+    Raises:
+        ValueError: Если спецификация некорректна.
+    """
+    namespace: Dict[str, Any] = {'_Descending': _Descending, '_NUMBERS': (int, float), '_INF': math.inf}
+    numeric = set(numeric)
+    reads, parts = [], []
+    for number, (field, direction, nulls) in enumerate(normalize_order_by(order_by)):
+        value = f'_v{number}'
+        namespace[f'_get{number}'] = accessor(field)
+        reads.append(f'    {value} = _get{number}(item)')
+        if field in numeric:
+            sign = '-' if direction == 'desc' else ''
+            parts.append(f'{"-" if nulls == "first" else ""}_INF if {value} is None else {sign}{value}')
+            continue
+        # Признак пустого значения: 0 — раньше остальных, 1 — позже
+        null_rank, value_rank = (0, 1) if nulls == 'first' else (1, 0)
+        parts.append(f'{null_rank} if {value} is None else {value_rank}')
+        if direction == 'asc':
+            parts.append(f'0 if {value} is None else {value}')
+        else:
+            parts.append(f'0 if {value} is None else (-{value} if {value}.__class__ in _NUMBERS '
+                         f'else _Descending({value}))')
+    # Ключ генерируется один раз: на каждый элемент выполняется только чтение полей
+    result = parts[0] if len(parts) == 1 else '(' + ', '.join(parts) + ')'
+    source = 'def key(item):\n' + '\n'.join(reads) + f'\n    return {result}\n'
+    exec(source, namespace)
+    return namespace['key']
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from .near_duplicates import DEFAULT_THRESHOLD, collapse_near_duplicates
+from .query import compile_order_by, select_top_n
+from .vacancy import NUMERIC_ORDER_FIELDS, average_of
+
+
+@dataclass
+class UpsertResult:
+    """
+    Итог пакетной вставки с обновлением (upsert).
+
+    Attributes:
+        inserted (int): Количество добавленных вакансий.
+        updated (int): Количество вакансий, содержимое которых изменилось.
+        unchanged (int): Количество вакансий без изменений, которые не записывались.
+    """
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+def record_salary(vacancy: Dict[str, Any], key: str) -> Optional[float]:
+    """
+    Возвращает зарплату записи вакансии в базовой валюте.
+
+    Нормализованное значение (norm_salary_from, norm_salary_to) хранится в записи, только
+    если оно отличается от исходного.
+
+    Args:
+        vacancy (Dict[str, Any]): Запись вакансии.
+        key (str): Поле зарплаты: 'salary_from' или 'salary_to'.
+
+    Returns:
+        Optional[float]: Зарплата в базовой валюте или None, если она не указана.
+    """
+    norm_key = f'norm_{key}'
+    if norm_key in vacancy:
+        return vacancy[norm_key]
+    return vacancy.get(key)
+
+
+def record_matches(vacancy: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+    """
+    Проверяет запись на соответствие критериям 'name', 'salary_from' и 'salary_to'.
+
+    Args:
+        vacancy (Dict[str, Any]): Запись вакансии.
+        criteria (Dict[str, Any]): Критерии фильтрации; остальные критерии не проверяются.
+
+    Returns:
+        bool: True, если запись соответствует всем критериям.
+    """
+    for key, value in criteria.items():
+        if key == 'name' and value.lower() not in vacancy.get('name', '').lower():
+            return False
+        if key == 'salary_from' and (record_salary(vacancy, 'salary_from') is None
+                                     or record_salary(vacancy, 'salary_from') < value):
+            return False
+        if key == 'salary_to' and (record_salary(vacancy, 'salary_to') is None
+                                   or record_salary(vacancy, 'salary_to') > value):
+            return False
+    return True
+
+
+def record_order_field(name: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Возвращает функцию чтения поля записи для сортировки.
+
+    Args:
+        name (str): Имя поля. Зарплата берется в базовой валюте, 'avg_salary' — средняя
+                    зарплата в базовой валюте.
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Функция чтения значения поля.
+    """
+    if name in ('salary_from', 'salary_to'):
+        return lambda item: record_salary(item, name)
+    if name == 'avg_salary':
+        return lambda item: average_of(record_salary(item, 'salary_from'), record_salary(item, 'salary_to'))
+    return lambda item: item.get(name)
+
+
+def record_order_key(order_by: Iterable[Any]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Компилирует спецификацию сортировки записей в функцию ключа.
+
+    Args:
+        order_by (Iterable[Any]): Спецификация сортировки (см. query.compile_order_by).
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Функция составного ключа.
+    """
+    return compile_order_by(order_by, record_order_field, numeric=NUMERIC_ORDER_FIELDS)
+
+
+def select_records(records: Iterable[Dict[str, Any]], criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Применяет к потоку отобранных записей критерии 'collapse_duplicates', 'order_by' и 'top_n'.
+
+    Поток не материализуется целиком, если задан top_n.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Записи, прошедшие фильтры.
+        criteria (Dict[str, Any]): Критерии выборки.
+
+    Returns:
+        List[Dict[str, Any]]: Итоговый список записей.
+    """
+    if criteria.get('collapse_duplicates'):
+        threshold = criteria['collapse_duplicates']
+        records = collapse_near_duplicates(records, threshold=DEFAULT_THRESHOLD if threshold is True else threshold)
+    if criteria.get('order_by'):
+        key = record_order_key(criteria['order_by'])
+        if 'top_n' in criteria:
+            return select_top_n(records, criteria['top_n'], key=key)
+        return sorted(records, key=key)
+    if 'top_n' in criteria:
+        return list(islice(records, max(criteria['top_n'], 0)))
+    return list(records)
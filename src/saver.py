@@ -1,23 +1,125 @@
 from .abstract_class import Saver
-from typing import Any, Dict, List, Optional
+from .compression import codec_for_path, open_text
+from .durability import DEFAULT_GROUP_SIZE, FSYNC_BATCH, FSYNC_NEVER, FSYNC_POLICIES, WriteAheadLog, atomic_replace
+from .external_sort import DEFAULT_RUN_BYTES, external_sort
+from .file_lock import FileLock
+from .fingerprint import FingerprintIndex, record_fingerprint, stamp_fingerprint
+from .interning import intern_records
+from .interval_index import IntervalIndex
+from .json_stream import iter_json_items
+from .parallel_filter import SharedColumns
+from .records import UpsertResult, record_matches, record_order_key, record_salary, select_records
+from .text_index import InvertedIndex, TrigramIndex, vacancy_text
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import json
 import os
 
 
+# Критерии, которые вычисляются по столбцам в разделяемой памяти в параллельном режиме
+PARALLEL_CRITERIA = ('name', 'salary_from', 'salary_to')
+
+# Объем журнала упреждающей записи, после которого записывается контрольная точка
+DEFAULT_CHECKPOINT_SIZE = 16 << 20
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, ...]]:
+    """
+    Возвращает подпись файла: время изменения в наносекундах, размер, индексный дескриптор
+    и устройство.
+
+    Args:
+        path (str): Путь к файлу.
+
+    Returns:
+        Optional[Tuple[int, ...]]: Подпись или None, если файла нет.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev
+
+
 class JSONSaver(Saver):
     """
     Реализация абстрактного класса Saver для сохранения данных в JSON файл.
+
+    Загруженные данные кэшируются в памяти; перед повторным использованием кэш проверяется
+    по времени изменения, размеру и индексному дескриптору файла, поэтому последовательные
+    операции в одном сеансе не разбирают файл заново.
+
+    Файл с расширением сжатого формата ('.gz', '.xz', '.zst', см. compression.CODEC_EXTENSIONS)
+    сжимается при записи и распаковывается по мере чтения, без загрузки распакованного
+    текста целиком.
+
+    Файл записывается во временный файл и атомарно заменяется переименованием, поэтому сбой
+    во время записи не повреждает хранилище. В режиме журнала (wal=True) добавленные и
+    измененные вакансии дописываются в журнал упреждающей записи (см. durability.WriteAheadLog)
+    с групповой синхронизацией, а файл целиком перезаписывается только контрольной точкой.
+
+    Чтение, изменение и запись выполняются под межпроцессной блокировкой (см.
+    file_lock.FileLock), поэтому одновременные сохранения из нескольких процессов не теряют
+    изменений, но выполняются по очереди. Для параллельной записи из многих процессов
+    используйте JSONLSaver.
     """
 
-    def __init__(self, path: str = 'data/vacancies.json'):
+    def __init__(self, path: str = 'data/vacancies.json', workers: Optional[int] = None, wal: bool = False,
+                 fsync: str = FSYNC_BATCH, group_size: int = DEFAULT_GROUP_SIZE,
+                 checkpoint_size: int = DEFAULT_CHECKPOINT_SIZE):
         """
         Инициализирует экземпляр JSONSaver.
 
         Args:
-            path (str, optional): Путь к JSON файлу для сохранения данных.
+            path (str, optional): Путь к JSON файлу для сохранения данных, например
+                                  'data/vacancies.json.gz' для сжатого хранилища.
                                   По умолчанию 'data/vacancies.json'.
+            workers (Optional[int], optional): Количество процессов для параллельной фильтрации
+                                               по столбцам в разделяемой памяти. По умолчанию
+                                               None (фильтрация в текущем процессе).
+            wal (bool, optional): Дописывать изменения в журнал упреждающей записи вместо
+                                  перезаписи файла. По умолчанию False.
+            fsync (str, optional): Политика синхронизации с диском ('always', 'batch', 'never',
+                                   см. durability.FSYNC_POLICIES). По умолчанию 'batch'.
+            group_size (int, optional): Количество сохранений в журнале, синхронизируемых
+                                        с диском одним вызовом fsync. По умолчанию
+                                        DEFAULT_GROUP_SIZE.
+            checkpoint_size (int, optional): Объем журнала в байтах, после которого
+                                             записывается контрольная точка.
+                                             По умолчанию DEFAULT_CHECKPOINT_SIZE.
+
+        Raises:
+            ValueError: Если политика синхронизации неизвестна.
         """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f'Неизвестная политика синхронизации: {fsync}')
         self.__path = path
+        self.__codec = codec_for_path(path)
+        self.__fsync = fsync
+        # Журнал упреждающей записи хранится рядом с файлом вакансий
+        self.__wal = WriteAheadLog(os.path.splitext(path)[0] + '.wal', fsync=fsync,
+                                   group_size=group_size) if wal else None
+        self.__checkpoint_size = checkpoint_size
+        # Блокировка чтения-изменения-записи из нескольких процессов
+        self.__lock = FileLock(os.path.splitext(path)[0] + '.lock')
+        # Данные загружены с применением записей журнала: сохраненный полнотекстовый индекс устарел
+        self.__replayed = False
+        # Загруженные данные и подпись файла, по которой они были прочитаны или записаны
+        self.__cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+        # Полнотекстовый индекс по названию и требованиям хранится рядом с файлом вакансий
+        self.__index_path = os.path.splitext(path)[0] + '.index.json'
+        self.__text_index: Optional[InvertedIndex] = None
+        # Отпечатки сохраненных вакансий для удаления дубликатов; новые дописываются в файл
+        self.__fingerprint_path = os.path.splitext(path)[0] + '.fingerprints'
+        self.__fingerprints: Optional[FingerprintIndex] = None
+        # Позиции записей по идентификатору для замены вакансий строятся при первом сохранении
+        self.__positions: Optional[Dict[str, int]] = None
+        # Триграммный индекс названий строится в памяти при первом нечетком запросе
+        self.__trigram_index: Optional[TrigramIndex] = None
+        # Индекс интервалов зарплаты строится в памяти при первом запросе по диапазону
+        self.__interval_index: Optional[IntervalIndex] = None
+        # Столбцы для параллельной фильтрации строятся при первом запросе
+        self.__workers = workers
+        self.__columns: Optional[SharedColumns] = None
         os.makedirs(os.path.dirname(self.__path), exist_ok=True)
 
     def get_path(self) -> str:
@@ -32,6 +134,12 @@ class JSONSaver(Saver):
     def save(self, data: Dict[str, Any]) -> None:
         """
         Сохраняет данные в JSON файл. Не добавляет дубликаты вакансий.
+        Новые вакансии добавляются в полнотекстовый индекс, если он уже загружен; иначе
+        индекс строится при первом поиске по тексту.
+
+        Вакансия с уже сохраненным идентификатором заменяется новой версией (см. upsert);
+        вакансии без идентификатора сравниваются по отпечатку содержимого (см.
+        fingerprint.record_fingerprint) через сохраняемый индекс отпечатков.
 
         Args:
             data (Dict[str, Any]): Данные для сохранения.
@@ -39,19 +147,81 @@ class JSONSaver(Saver):
         Raises:
             IOError: Если произошла ошибка при записи в файл.
         """
-        try:
-            existing_data = self.__load_existing_data()
-            new_items = data.get('items', [])
+        self.upsert(data.get('items', []))
 
-            # Избегаем дублирования вакансий по 'name' и 'url'
-            existing_items = { (item['name'], item['url']) for item in existing_data.get('items', []) }
-            unique_new_items = [item for item in new_items if (item['name'], item['url']) not in existing_items]
+    def upsert(self, new_items: Iterable[Dict[str, Any]]) -> UpsertResult:
+        """
+        Добавляет новые вакансии и обновляет изменившиеся одной записью файла.
 
-            if unique_new_items:
-                existing_data.setdefault('items', []).extend(unique_new_items)
-                with open(self.__path, 'w', encoding='utf-8') as file:
-                    json.dump(existing_data, file, ensure_ascii=False, indent=4)
+        Вакансии сопоставляются по идентификатору, изменение определяется сравнением
+        отпечатков содержимого (см. fingerprint.record_fingerprint). Если ни одна вакансия
+        не добавлена и не изменилась, файл не записывается. Вакансии без идентификатора
+        добавляются, если их отпечатка еще нет в хранилище.
 
+        Args:
+            new_items (Iterable[Dict[str, Any]]): Записи вакансий.
+
+        Returns:
+            UpsertResult: Количество добавленных, обновленных и неизменных вакансий.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        try:
+            with self.__lock:
+                existing_data = self.__load_existing_data()
+                items = existing_data.setdefault('items', [])
+                fingerprints = self.__get_fingerprints(existing_data)
+                # Полнотекстовый индекс обновляется, только если он уже загружен: иначе он
+                # строится при первом поиске по тексту
+                text_index = self.__text_index
+                positions = self.__get_positions(items)
+                result = UpsertResult()
+                changes = []
+
+                for item in new_items:
+                    fingerprint = record_fingerprint(item)
+                    position = positions.get(item['id']) if item.get('id') is not None else None
+                    if position is None:
+                        # Вакансия с идентификатором, которого нет среди записей, добавляется, даже
+                        # если индекс отпечатков отстал от удаления (сбой до его очистки)
+                        if not fingerprints.add(fingerprint) and item.get('id') is None:
+                            result.unchanged += 1
+                            continue
+                        position = len(items)
+                        # Копия записи защищает кэш от изменения вызывающим кодом
+                        item = stamp_fingerprint(item, fingerprint)
+                        items.append(item)
+                        if item.get('id') is not None:
+                            positions[item['id']] = position
+                        if text_index is not None:
+                            text_index.add(position, vacancy_text(item))
+                        if self.__trigram_index is not None:
+                            self.__trigram_index.add(position, item.get('name') or '')
+                        changes.append([position, item])
+                        result.inserted += 1
+                    elif record_fingerprint(items[position]) == fingerprint:
+                        result.unchanged += 1
+                    else:
+                        item = stamp_fingerprint(item, fingerprint)
+                        if text_index is not None:
+                            text_index.remove(position, vacancy_text(items[position]))
+                            text_index.add(position, vacancy_text(item))
+                        fingerprints.discard(record_fingerprint(items[position]))
+                        fingerprints.add(fingerprint)
+                        items[position] = item
+                        self.__trigram_index = None
+                        changes.append([position, item])
+                        result.updated += 1
+
+                if changes:
+                    self.__interval_index = None
+                    self.__columns = None
+                    self.__persist(existing_data, changes)
+                    # Индекс записывается целиком, если после записи изменилась версия данных
+                    fingerprints.version = self.__data_version(existing_data)
+                    fingerprints.save(self.__fingerprint_path)
+                return result
 
         except IOError as e:
             raise IOError(f'Ошибка при записи в {self.__path}: {e}')
@@ -60,6 +230,23 @@ class JSONSaver(Saver):
         """
         Получает вакансии из JSON файла по заданным критериям.
 
+        Критерий 'text' выполняет полнотекстовый поиск по названию и требованиям через индекс
+        (режим задается критерием 'text_mode': 'and' или 'or'); результаты упорядочены по
+        релевантности. Критерий 'fuzzy_name' выполняет нечеткий поиск по названию, устойчивый
+        к опечаткам, через триграммный индекс (порог сходства — критерий 'fuzzy_threshold').
+        Критерий 'salary_overlap' ((от, до), None — открытая граница) отбирает через индекс
+        интервалов вакансии, вилка зарплаты в базовой валюте которых пересекается с диапазоном.
+
+        Критерий 'collapse_duplicates' (True или порог сходства) оставляет из почти одинаковых
+        по названию и требованиям записей первую (см. near_duplicates.collapse_near_duplicates).
+
+        Критерий 'order_by' задает сортировку результата списком полей с направлением и
+        положением пустых значений (см. query.compile_order_by; зарплата — в базовой валюте,
+        'avg_salary' — средняя зарплата), критерий 'top_n' ограничивает количество результатов.
+
+        Если задано количество процессов workers, критерии 'name', 'salary_from' и 'salary_to'
+        вычисляются параллельно по столбцам в разделяемой памяти.
+
         Args:
             criteria (Optional[Dict[str, Any]], optional): Словарь с критериями фильтрации.
                                                          По умолчанию None.
@@ -72,30 +259,83 @@ class JSONSaver(Saver):
             vacancies = data.get('items', [])
 
             if not criteria:
-                return vacancies
-
-            filtered = []
-            for vacancy in vacancies:
-                match = True
-                for key, value in criteria.items():
-                    if key == 'name' and value.lower() not in vacancy.get('name', '').lower():
-                        match = False
-                        break
-                    if key == 'salary_from' and (vacancy.get('salary_from') is None or vacancy.get('salary_from') < value):
-                        match = False
-                        break
-                    if key == 'salary_to' and (vacancy.get('salary_to') is None or vacancy.get('salary_to') > value):
-                        match = False
-                        break
-                if match:
-                    filtered.append(vacancy)
+                # Копии записей защищают кэш от изменения вызывающим кодом
+                return [dict(vacancy) for vacancy in vacancies]
+
+            # Поиск по индексам: позиции записей в порядке релевантности
+            positions = None
+            if 'text' in criteria:
+                matches = self.__get_text_index(data).search(criteria['text'],
+                                                             mode=criteria.get('text_mode', 'and'))
+                positions = [position for position, _ in matches]
+            if 'fuzzy_name' in criteria:
+                matches = self.__get_trigram_index(vacancies).search(criteria['fuzzy_name'],
+                                                                     threshold=criteria.get('fuzzy_threshold', 0.4))
+                fuzzy = [position for position, _ in matches]
+                if positions is None:
+                    positions = fuzzy
+                else:
+                    fuzzy_set = set(fuzzy)
+                    positions = [position for position in positions if position in fuzzy_set]
+            if 'salary_overlap' in criteria:
+                low, high = criteria['salary_overlap']
+                overlap = self.__get_interval_index(vacancies).search(low, high)
+                if positions is None:
+                    positions = sorted(overlap)
+                else:
+                    overlap_set = set(overlap)
+                    positions = [position for position in positions if position in overlap_set]
+            if positions is None and self.__workers is not None:
+                positions, criteria = self.__parallel_filter(vacancies, criteria)
+            if positions is not None:
+                vacancies = [vacancies[position] for position in positions]
+
+            filtered = select_records((vacancy for vacancy in vacancies if record_matches(vacancy, criteria)),
+                                      criteria)
 
             print(f'Найдено {len(filtered)} вакансий, соответствующих критериям.')
-            return filtered
+            return [dict(vacancy) for vacancy in filtered]
 
         except IOError as e:
             raise IOError(f'Ошибка при чтении из {self.__path}: {e}')
 
+    def iter_sorted(self, order_by: List[Any], criteria: Optional[Dict[str, Any]] = None,
+                    run_bytes: int = DEFAULT_RUN_BYTES, tmp_dir: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Возвращает поток вакансий из JSON файла в порядке сортировки, не загружая файл целиком.
+
+        Записи читаются из файла последовательно и сортируются внешней сортировкой слиянием:
+        в памяти одновременно находится серия объемом около run_bytes байт, остальные записи
+        временно хранятся в отсортированных сериях на диске. В режиме журнала перед чтением
+        записывается контрольная точка.
+
+        Args:
+            order_by (List[Any]): Спецификация сортировки (см. query.compile_order_by).
+            criteria (Optional[Dict[str, Any]], optional): Критерии 'name', 'salary_from',
+                                                         'salary_to'. По умолчанию None.
+            run_bytes (int, optional): Приблизительный объем записей в памяти, байт.
+            tmp_dir (Optional[str], optional): Каталог временных файлов. По умолчанию системный.
+
+        Yields:
+            Dict[str, Any]: Очередная вакансия.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла или записи временных файлов.
+        """
+        if self.__wal is not None and self.__wal.size:
+            # Записи читаются из файла потоком, поэтому журнал сначала переносится в файл
+            self.checkpoint()
+        if not os.path.exists(self.__path):
+            return
+        key = record_order_key(order_by)
+        records = iter_json_items(self.__path)
+        if criteria:
+            records = (vacancy for vacancy in records if record_matches(vacancy, criteria))
+        try:
+            yield from external_sort(records, key=key, run_bytes=run_bytes, tmp_dir=tmp_dir)
+        except IOError as e:
+            raise IOError(f'Ошибка при сортировке данных из {self.__path}: {e}')
+
     def delete(self, record_id: Optional[str] = None) -> None:
         """
         Удаляет все вакансии или конкретную вакансию по идентификатору.
@@ -109,34 +349,221 @@ class JSONSaver(Saver):
             IOError: Если произошла ошибка при удалении данных.
         """
         try:
-            if not os.path.exists(self.__path):
-                return
+            with self.__lock:
+                if not os.path.exists(self.__path) and (self.__wal is None or not self.__wal.size):
+                    return
 
-            if record_id:
-                with open(self.__path, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                original_length = len(data.get('items', []))
-                data['items'] = [item for item in data.get('items', []) if item.get('id') != record_id]
-                new_length = len(data['items'])
-                if new_length < original_length:
-                    with open(self.__path, 'w', encoding='utf-8') as file:
-                        json.dump(data, file, ensure_ascii=False, indent=4)
-                    print(f'Вакансия с id {record_id} удалена из {self.__path}.')
+                if record_id:
+                    data = self.__load_existing_data()
+                    original_length = len(data.get('items', []))
+                    data['items'] = [item for item in data.get('items', []) if item.get('id') != record_id]
+                    new_length = len(data['items'])
+                    if new_length < original_length:
+                        self.__dump(data)
+                        self.__reset_text_index()
+                        print(f'Вакансия с id {record_id} удалена из {self.__path}.')
+                    else:
+                        print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
                 else:
-                    print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
-            else:
-                # Удаление всех вакансий
-                with open(self.__path, 'w', encoding='utf-8') as file:
-                    json.dump({"items": []}, file, ensure_ascii=False, indent=4)
-                print(f'Все вакансии удалены из {self.__path}.')
+                    # Удаление всех вакансий
+                    data: Dict[str, Any] = {"items": []}
+                    if self.__wal is not None:
+                        # Номер контрольной точки продолжается, чтобы оставшиеся записи журнала
+                        # не применились к пустому файлу
+                        data['generation'] = self.__load_existing_data().get('generation', 0)
+                    self.__dump(data)
+                    self.__reset_text_index()
+                    print(f'Все вакансии удалены из {self.__path}.')
 
         except IOError as e:
             raise IOError(f'Ошибка при удалении данных из {self.__path}: {e}')
 
+    def commit(self) -> None:
+        """
+        Синхронизирует журнал с диском, не дожидаясь заполнения группы сохранений.
+        Без журнала ничего не делает.
+
+        Raises:
+            IOError: Если произошла ошибка при синхронизации журнала.
+        """
+        if self.__wal is not None:
+            self.__wal.commit()
+
+    def checkpoint(self) -> None:
+        """
+        Записывает контрольную точку: атомарно перезаписывает файл текущими данными
+        с учетом журнала и очищает журнал. Без журнала ничего не делает.
+
+        Raises:
+            IOError: Если произошла ошибка при записи файла.
+        """
+        if self.__wal is None:
+            return
+        try:
+            with self.__lock:
+                self.__checkpoint(self.__load_existing_data())
+        except IOError as e:
+            raise IOError(f'Ошибка при записи контрольной точки в {self.__path}: {e}')
+
+    def __get_text_index(self, data: Dict[str, Any]) -> InvertedIndex:
+        """
+        Возвращает полнотекстовый индекс хранилища, загружая его с диска при первом обращении.
+
+        Если версия сохраненного индекса не совпадает с версией данных (см. __data_version:
+        файл вакансий перезаписан после сохранения индекса, в том числе без изменения
+        количества записей) или данные восстановлены из журнала, индекс строится заново
+        и сохраняется.
+
+        Args:
+            data (Dict[str, Any]): Текущие данные хранилища.
+
+        Returns:
+            InvertedIndex: Индекс, в котором идентификатор документа — позиция записи.
+        """
+        if self.__text_index is None:
+            version = self.__data_version(data)
+            # Индекс на диске соответствует контрольной точке, а не записям из журнала
+            index = None if self.__replayed else InvertedIndex.load(self.__index_path)
+            if index is None or index.version != version:
+                index = InvertedIndex()
+                for position, item in enumerate(data.get('items', [])):
+                    index.add(position, vacancy_text(item))
+                if not self.__replayed:
+                    index.version = version
+                    index.save(self.__index_path)
+            self.__text_index = index
+        return self.__text_index
+
+    def __get_fingerprints(self, data: Dict[str, Any]) -> FingerprintIndex:
+        """
+        Возвращает индекс отпечатков хранилища, загружая его с диска при первом обращении.
+
+        Если версия сохраненного индекса не совпадает с версией данных (см. __data_version:
+        файл вакансий записан, а индекс нет, например из-за сбоя между записями) или количество
+        отпечатков не совпадает с количеством записей (сбой до дописывания индекса после записи
+        в журнал), индекс строится по записям.
+
+        Args:
+            data (Dict[str, Any]): Текущие данные хранилища.
+
+        Returns:
+            FingerprintIndex: Индекс отпечатков.
+        """
+        if self.__fingerprints is None:
+            items = data.get('items', [])
+            version = self.__data_version(data)
+            index = FingerprintIndex.load(self.__fingerprint_path)
+            if index.version != version or len(index) != len(items):
+                index = FingerprintIndex(record_fingerprint(item) for item in items)
+                index.version = version
+            self.__fingerprints = index
+        return self.__fingerprints
+
+    def __get_positions(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Возвращает позиции записей по идентификатору вакансии, строя словарь при первом обращении.
+
+        Args:
+            items (List[Dict[str, Any]]): Текущие записи хранилища.
+
+        Returns:
+            Dict[str, int]: Позиция записи по идентификатору; записи без идентификатора не входят.
+        """
+        if self.__positions is None:
+            self.__positions = {item['id']: position for position, item in enumerate(items)
+                                if item.get('id') is not None}
+        return self.__positions
+
+    def __get_trigram_index(self, items: List[Dict[str, Any]]) -> TrigramIndex:
+        """
+        Возвращает триграммный индекс названий, строя его при первом обращении.
+
+        Args:
+            items (List[Dict[str, Any]]): Текущие записи хранилища.
+
+        Returns:
+            TrigramIndex: Индекс, в котором идентификатор документа — позиция записи.
+        """
+        if self.__trigram_index is None or len(self.__trigram_index) != len(items):
+            self.__trigram_index = TrigramIndex()
+            for position, item in enumerate(items):
+                self.__trigram_index.add(position, item.get('name') or '')
+        return self.__trigram_index
+
+    def __get_interval_index(self, items: List[Dict[str, Any]]) -> IntervalIndex:
+        """
+        Возвращает индекс интервалов зарплаты в базовой валюте, строя его при первом обращении.
+
+        Args:
+            items (List[Dict[str, Any]]): Текущие записи хранилища.
+
+        Returns:
+            IntervalIndex: Индекс, в котором идентификатор документа — позиция записи.
+        """
+        if self.__interval_index is None or len(self.__interval_index) != len(items):
+            self.__interval_index = IntervalIndex()
+            for position, item in enumerate(items):
+                self.__interval_index.add(position, record_salary(item, 'salary_from') or None,
+                                          record_salary(item, 'salary_to') or None)
+        return self.__interval_index
+
+    def __parallel_filter(self, items: List[Dict[str, Any]],
+                          criteria: Dict[str, Any]) -> Tuple[Optional[List[int]], Dict[str, Any]]:
+        """
+        Вычисляет критерии по названию и зарплате параллельно по столбцам в разделяемой памяти.
+
+        Args:
+            items (List[Dict[str, Any]]): Текущие записи хранилища.
+            criteria (Dict[str, Any]): Критерии фильтрации.
+
+        Returns:
+            Tuple[Optional[List[int]], Dict[str, Any]]: Позиции подходящих записей (None, если
+                                                        таких критериев нет) и оставшиеся критерии.
+        """
+        if not any(key in criteria for key in PARALLEL_CRITERIA):
+            return None, criteria
+        if self.__columns is None or len(self.__columns) != len(items):
+            self.__columns = SharedColumns((record_salary(item, 'salary_from') for item in items),
+                                           (record_salary(item, 'salary_to') for item in items),
+                                           (item.get('name') for item in items), workers=self.__workers)
+        positions = self.__columns.filter(name=criteria.get('name'), salary_from=criteria.get('salary_from'),
+                                          salary_to=criteria.get('salary_to'))
+        rest = {key: value for key, value in criteria.items() if key not in PARALLEL_CRITERIA}
+        return positions, rest
+
+    def __discard_indexes(self) -> None:
+        """
+        Сбрасывает загруженные в память индексы поиска и отпечатков; при следующем обращении
+        они загружаются с диска или строятся заново.
+        """
+        self.__text_index = None
+        self.__trigram_index = None
+        self.__interval_index = None
+        self.__columns = None
+        self.__fingerprints = None
+        self.__positions = None
+
+    def __reset_text_index(self) -> None:
+        """
+        Удаляет индексы поиска и отпечатков после удаления записей: позиции записей изменились.
+        """
+        self.__discard_indexes()
+        for path in (self.__index_path, self.__fingerprint_path):
+            if os.path.exists(path):
+                os.remove(path)
+
     def __load_existing_data(self) -> Dict[str, Any]:
         """
         Загружает существующие данные из JSON файла.
 
+        Если файл не изменился с последнего чтения или записи (см. __file_signature),
+        возвращаются кэшированные данные без чтения файла. В режиме журнала к данным
+        контрольной точки применяются записи журнала.
+
+        Повторяющиеся строковые поля записей (название, регион, валюта) интернируются,
+        чтобы каждое различное значение хранилось в памяти один раз. Сжатый файл читается
+        потоком: в памяти находятся только записи и текущий распакованный фрагмент.
+
         Returns:
             Dict[str, Any]: Данные из файла.
 
@@ -144,9 +571,147 @@ class JSONSaver(Saver):
             IOError: Если произошла ошибка при чтении файла.
         """
         try:
-            if not os.path.exists(self.__path):
+            signature = self.__file_signature()
+            if self.__cache is not None and self.__cache[0] == signature:
+                return self.__cache[1]
+            if signature is None:
+                # Файл удален другим экземпляром: индексы прежнего содержимого недействительны
+                self.__discard_indexes()
+                self.__cache = None
                 return {"items": []}
-            with open(self.__path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except IOError as e:
+            if not os.path.exists(self.__path):
+                data = {"items": []}
+            elif self.__codec is not None:
+                other_fields: Dict[str, Any] = {}
+                items = list(iter_json_items(self.__path, other_fields=other_fields))
+                data = dict(other_fields, items=items)
+            else:
+                with open(self.__path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+            if self.__wal is not None:
+                self.__replay(data.setdefault('items', []), data.get('generation', 0))
+            # Файл изменен другим экземпляром или прервана запись: позиции и содержимое записей
+            # могли не совпасть с индексами в памяти
+            self.__discard_indexes()
+            intern_records(data.get('items', []))
+            self.__cache = (signature, data)
+            return data
+        except (IOError, EOFError) as e:
             raise IOError(f'Ошибка при чтении данных из {self.__path}: {e}')
+
+    def __replay(self, items: List[Dict[str, Any]], generation: int) -> None:
+        """
+        Применяет к записям контрольной точки изменения из журнала.
+
+        Запись журнала {'generation': номер, 'put': [[позиция, вакансия], ...]} заменяет
+        вакансию на позиции или добавляет ее в конец. Номер записи — номер контрольной точки,
+        к которой она применяется; каждая контрольная точка увеличивает номер в файле.
+        Записи прежних контрольных точек (сбой между записью контрольной точки и очисткой
+        журнала) уже вошли в файл, в том числе с последующими удалениями, и пропускаются.
+
+        Args:
+            items (List[Dict[str, Any]]): Записи контрольной точки; изменяются на месте.
+            generation (int): Номер контрольной точки из файла вакансий.
+
+        Raises:
+            IOError: Если журнал не соответствует файлу вакансий.
+        """
+        entries = [entry for entry in self.__wal.replay() if entry.get('generation', 0) == generation]
+        for entry in entries:
+            for position, item in entry['put']:
+                if position < len(items):
+                    items[position] = item
+                elif position == len(items):
+                    items.append(item)
+                else:
+                    raise IOError(f'журнал {self.__wal.path} не соответствует файлу вакансий')
+        self.__replayed = bool(entries)
+
+    def __persist(self, data: Dict[str, Any], changes: List[List[Any]]) -> None:
+        """
+        Сохраняет добавленные и измененные вакансии.
+
+        В режиме журнала изменения дописываются в журнал, а контрольная точка записывается,
+        когда объем журнала достигает checkpoint_size. Без журнала файл перезаписывается.
+
+        Args:
+            data (Dict[str, Any]): Данные хранилища с примененными изменениями.
+            changes (List[List[Any]]): Пары [позиция, вакансия].
+        """
+        if self.__wal is not None:
+            self.__wal.append({'generation': data.get('generation', 0), 'put': changes})
+            if self.__wal.size < self.__checkpoint_size:
+                self.__cache = (self.__file_signature(), data)
+                return
+        self.__checkpoint(data)
+
+    def __checkpoint(self, data: Dict[str, Any]) -> None:
+        """
+        Записывает данные в файл и сохраняет полнотекстовый индекс, если он загружен.
+
+        Args:
+            data (Dict[str, Any]): Данные для записи.
+        """
+        self.__dump(data)
+        if self.__text_index is not None:
+            self.__text_index.version = self.__data_version(data)
+            self.__text_index.save(self.__index_path)
+
+    def __dump(self, data: Dict[str, Any]) -> None:
+        """
+        Записывает данные в файл. Сжатый файл записывается без отступов: отступы не нужны
+        для чтения человеком и увеличивают объем распаковываемых данных.
+
+        Данные записываются во временный файл, который затем атомарно заменяет основной
+        (см. durability.atomic_replace). После записи журнал очищается: его изменения
+        вошли в файл. В режиме журнала номер контрольной точки 'generation' в данных
+        увеличивается, чтобы записи журнала, оставшиеся после сбоя до его очистки,
+        не применялись повторно (см. __replay).
+
+        Args:
+            data (Dict[str, Any]): Данные для записи.
+        """
+        # При ошибке записи кэш может не соответствовать файлу, поэтому он сбрасывается заранее
+        self.__cache = None
+        if self.__wal is not None:
+            data['generation'] = data.get('generation', 0) + 1
+        tmp_path = self.__path + '.tmp'
+        with open_text(tmp_path, 'w', codec=self.__codec) as file:
+            if self.__codec is None:
+                json.dump(data, file, ensure_ascii=False, indent=4)
+            else:
+                json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+        atomic_replace(tmp_path, self.__path, fsync=self.__fsync != FSYNC_NEVER)
+        if self.__wal is not None:
+            self.__wal.reset()
+        self.__replayed = False
+        self.__cache = (self.__file_signature(), data)
+
+    def __data_version(self, data: Dict[str, Any]) -> List[Any]:
+        """
+        Возвращает версию данных, сохраняемую вместе с индексами: номер контрольной точки
+        и подпись файла вакансий, из которого данные прочитаны или в который записаны.
+
+        Args:
+            data (Dict[str, Any]): Текущие данные хранилища.
+
+        Returns:
+            List[Any]: Версия данных в виде, совпадающем с прочитанным из JSON.
+        """
+        signature = self.__cache[0] if self.__cache is not None else None
+        if self.__wal is not None and signature is not None:
+            signature = signature[0]
+        return [data.get('generation', 0), list(signature) if signature is not None else None]
+
+    def __file_signature(self) -> Optional[Tuple[Any, ...]]:
+        """
+        Возвращает подпись файла для проверки кэша: время изменения в наносекундах, размер,
+        индексный дескриптор и устройство. В режиме журнала — подписи файла и журнала.
+
+        Returns:
+            Optional[Tuple[Any, ...]]: Подпись или None, если файла (и журнала) нет.
+        """
+        if self.__wal is None:
+            return _stat_signature(self.__path)
+        signatures = (_stat_signature(self.__path), _stat_signature(self.__wal.path))
+        return None if signatures == (None, None) else signatures
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, TypeVar
+from .interning import intern_value
+
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Описание поля вакансии в исходном словаре API HH.ru.
+
+    Attributes:
+        name (str): Имя поля Vacancy.
+        path (Tuple[str, ...]): Путь к значению в исходном словаре, например ('salary', 'from').
+        default (Any): Значение, если ключ отсутствует или промежуточный объект пуст.
+                       Явное значение None в исходных данных сохраняется.
+        intern (bool): Интернировать строковое значение (см. interning.intern_value).
+    """
+    name: str
+    path: Tuple[str, ...]
+    default: Any = None
+    intern: bool = False
+
+
+# Поля Vacancy и их расположение в ответе API HH.ru
+VACANCY_SCHEMA: Tuple[FieldSpec, ...] = (
+    FieldSpec('name', ('name',), 'Без названия', intern=True),
+    FieldSpec('desc', ('area', 'name'), 'Без описания', intern=True),
+    FieldSpec('salary_from', ('salary', 'from')),
+    FieldSpec('salary_to', ('salary', 'to')),
+    FieldSpec('currency', ('salary', 'currency'), 'RUB', intern=True),
+    FieldSpec('url', ('url',), 'alternate_url'),
+    FieldSpec('requirement', ('snippet', 'requirement'), 'Информация отсутствует'),
+    FieldSpec('id', ('id',)),
+    FieldSpec('employer', ('employer', 'name'), intern=True),
+    FieldSpec('published_at', ('published_at',)),
+    FieldSpec('experience', ('experience', 'name'), intern=True),
+    FieldSpec('schedule', ('schedule', 'name'), intern=True),
+    FieldSpec('alternate_url', ('alternate_url',)),
+)
+
+
+def _compile(specs: Sequence[FieldSpec], body: Callable[[Sequence[str]], str],
+             namespace: Optional[Dict[str, Any]] = None) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Генерирует функцию извлечения полей по схеме.
+
+    Каждый промежуточный объект пути читается из словаря один раз и переиспользуется всеми
+    полями с общим префиксом пути; значения по умолчанию передаются через пространство имен
+    функции, а не через текст кода.
+
+    Args:
+        specs (Sequence[FieldSpec]): Поля схемы.
+        body (Callable[[Sequence[str]], str]): Строит выражение результата по выражениям полей.
+        namespace (Optional[Dict[str, Any]], optional): Дополнительные имена, доступные
+                                                        выражению результата.
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Функция, принимающая исходный словарь.
+    """
+    namespace = {**(namespace or {}), '_EMPTY': {}, '_intern': intern_value}
+    lines = []
+    prefixes: Dict[Tuple[str, ...], str] = {(): 'raw'}
+    values = []
+    for number, spec in enumerate(specs):
+        if not spec.path:
+            raise ValueError(f'Путь поля {spec.name} не может быть пустым')
+        for depth in range(1, len(spec.path)):
+            prefix = spec.path[:depth]
+            if prefix not in prefixes:
+                variable = f'_p{len(prefixes)}'
+                # Отсутствующий или пустой промежуточный объект заменяется пустым словарем
+                lines.append(f'    {variable} = {prefixes[prefix[:-1]]}.get({prefix[-1]!r}) or _EMPTY')
+                prefixes[prefix] = variable
+        namespace[f'_d{number}'] = spec.default
+        value = f'{prefixes[spec.path[:-1]]}.get({spec.path[-1]!r}, _d{number})'
+        values.append(f'_intern({value})' if spec.intern else value)
+    lines.append(f'    return {body(values)}')
+    source = 'def extract(raw):\n' + '\n'.join(lines) + '\n'
+    exec(source, namespace)
+    return namespace['extract']
+
+
+def compile_extractor(specs: Iterable[FieldSpec],
+                      factory: Optional[Callable[..., T]] = None) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Компилирует схему в функцию извлечения всех полей из исходного словаря.
+
+    Функция компилируется один раз; на каждый элемент выполняется только чтение значений
+    из словаря, без обхода схемы.
+
+    Args:
+        specs (Iterable[FieldSpec]): Поля схемы.
+        factory (Optional[Callable[..., T]], optional): Конструктор, которому поля передаются
+                                                        именованными аргументами (например,
+                                                        Vacancy), без промежуточного словаря.
+                                                        По умолчанию None.
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Функция, возвращающая словарь {имя поля: значение}
+                                         или результат factory.
+
+    Raises:
+        ValueError: Если путь поля пуст.
+        AttributeError: При вызове функции, если промежуточный объект пути не является словарем.
+    """
+    specs = tuple(specs)
+    if factory is not None:
+        return _compile(specs, lambda values: '_factory(' + ', '.join(
+            f'{spec.name}={value}' for spec, value in zip(specs, values)) + ')', {'_factory': factory})
+    return _compile(specs, lambda values: '{' + ', '.join(
+        f'{spec.name!r}: {value}' for spec, value in zip(specs, values)) + '}')
+
+
+def compile_field(spec: FieldSpec) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Компилирует описание одного поля в функцию извлечения его значения.
+
+    Args:
+        spec (FieldSpec): Описание поля.
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Функция, возвращающая значение поля.
+
+    Raises:
+        ValueError: Если путь поля пуст.
+    """
+    return _compile((spec,), lambda values: values[0])
+
+
+def compile_fields(specs: Iterable[FieldSpec]) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """
+    Компилирует схему в отдельные функции извлечения каждого поля.
+
+    Args:
+        specs (Iterable[FieldSpec]): Поля схемы.
+
+    Returns:
+        Dict[str, Callable[[Dict[str, Any]], Any]]: Функции извлечения по именам полей.
+    """
+    return {spec.name: compile_field(spec) for spec in specs}
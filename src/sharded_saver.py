@@ -0,0 +1,503 @@
+from .abstract_class import Saver
+from .durability import atomic_replace
+from .file_lock import FileLock
+from .jsonl_saver import JSONLSaver
+from .records import UpsertResult, record_matches, record_salary, select_records
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import hashlib
+import json
+import os
+import re
+import shutil
+
+
+# Ключевое слово сегмента для вакансий, сохраненных без ключевого слова
+DEFAULT_KEYWORD = 'all'
+
+# Файлы сегмента: строки вакансий и индексы JSONLSaver
+SHARD_SUFFIXES = ('', '.ids', '.fingerprints')
+
+MANIFEST_NAME = 'manifest.json'
+
+MANIFEST_VERSION = 1
+
+# Поля записи, диапазоны значений которых хранятся в манифесте для отсечения сегментов
+STATS_FIELDS = ('salary_from', 'salary_to', 'published_at')
+
+# Критерии, задающие круг сегментов запроса (ключевые слова и даты сбора); остальные критерии
+# shard_matches отсекают сегменты по значениям полей вакансий
+SCOPE_CRITERIA = ('keyword', 'crawled_from', 'crawled_to')
+
+
+def shard_directory(keyword: str) -> str:
+    """
+    Возвращает имя директории сегментов ключевого слова.
+
+    Символы, недопустимые в именах файлов, заменяются на '_'; если имя при этом изменилось,
+    к нему добавляется хэш ключевого слова, чтобы разные ключевые слова не совпали.
+
+    Args:
+        keyword (str): Ключевое слово поиска.
+
+    Returns:
+        str: Имя директории.
+    """
+    folded = keyword.casefold()
+    name = re.sub(r'[^\w-]+', '_', folded).strip('_')
+    if name != folded:
+        name += '-' + hashlib.blake2b(keyword.encode('utf-8'), digest_size=4).hexdigest()
+    return name
+
+
+def _merge_range(current: Optional[List[Any]], values: Iterable[Any]) -> Optional[List[Any]]:
+    """
+    Расширяет диапазон [минимум, максимум] значениями, пропуская None.
+
+    Args:
+        current (Optional[List[Any]]): Текущий диапазон или None, если значений еще нет.
+        values (Iterable[Any]): Новые значения.
+
+    Returns:
+        Optional[List[Any]]: Расширенный диапазон.
+    """
+    values = [value for value in values if value is not None]
+    if not values:
+        return current
+    low, high = min(values), max(values)
+    if current is None:
+        return [low, high]
+    return [min(current[0], low), max(current[1], high)]
+
+
+def _before_or_on(value: str, end: str) -> bool:
+    """
+    Сравнивает дату или время ISO 8601 с концом периода: '2024-05-01T10:00' входит в период
+    до '2024-05-01' включительно.
+    """
+    return value[:len(end)] <= end
+
+
+def shard_matches(shard: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+    """
+    Проверяет по статистике манифеста, могут ли в сегменте быть вакансии, соответствующие
+    критериям.
+
+    Args:
+        shard (Dict[str, Any]): Описание сегмента из манифеста.
+        criteria (Dict[str, Any]): Критерии 'keyword' (строка или список), 'crawled_from',
+                                   'crawled_to', 'published_from', 'published_to' (даты ISO 8601),
+                                   'salary_from' и 'salary_to' (в базовой валюте); остальные
+                                   критерии не проверяются.
+
+    Returns:
+        bool: False, если сегмент можно не читать.
+    """
+    keyword = criteria.get('keyword')
+    if keyword is not None:
+        keywords = [keyword] if isinstance(keyword, str) else keyword
+        if shard['keyword'] not in keywords:
+            return False
+    if 'crawled_from' in criteria and shard['date'] < criteria['crawled_from']:
+        return False
+    if 'crawled_to' in criteria and not _before_or_on(shard['date'], criteria['crawled_to']):
+        return False
+    stats = shard['stats']
+    if 'salary_from' in criteria and (stats['salary_from'] is None
+                                      or stats['salary_from'][1] < criteria['salary_from']):
+        return False
+    if 'salary_to' in criteria and (stats['salary_to'] is None or stats['salary_to'][0] > criteria['salary_to']):
+        return False
+    if 'published_from' in criteria and (stats['published_at'] is None
+                                         or stats['published_at'][1] < criteria['published_from']):
+        return False
+    if 'published_to' in criteria and (stats['published_at'] is None
+                                       or not _before_or_on(stats['published_at'][0], criteria['published_to'])):
+        return False
+    return True
+
+
+def _published_matches(vacancy: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
+    """
+    Проверяет дату публикации вакансии по критериям 'published_from' и 'published_to'.
+    """
+    if 'published_from' not in criteria and 'published_to' not in criteria:
+        return True
+    published = vacancy.get('published_at')
+    if not published:
+        return False
+    if 'published_from' in criteria and published < criteria['published_from']:
+        return False
+    return 'published_to' not in criteria or _before_or_on(published, criteria['published_to'])
+
+
+class ShardedSaver(Saver):
+    """
+    Реализация абстрактного класса Saver с разделением вакансий на сегменты по ключевому
+    слову поиска и дате сбора.
+
+    Каждый сегмент — файл JSON Lines '<директория ключевого слова>/<ГГГГ-ММ-ДД>.jsonl'
+    (см. JSONLSaver), поэтому сохранение затрагивает только сегмент текущего сбора.
+    Манифест хранит для каждого сегмента количество вакансий и диапазоны зарплаты в базовой
+    валюте и дат публикации; запрос читает только сегменты, которые по этим диапазонам
+    могут содержать подходящие вакансии. Диапазоны только расширяются: после обновления
+    или удаления вакансий они остаются верной, хотя и неточной, оценкой.
+
+    Старые сегменты удаляются (drop) или переносятся в архив (archive) целиком по ключевому
+    слову и дате сбора. Архив — такое же хранилище ShardedSaver со своим манифестом.
+    """
+
+    def __init__(self, path: str = 'data/shards', keyword: Optional[str] = None):
+        """
+        Инициализирует экземпляр ShardedSaver.
+
+        Args:
+            path (str, optional): Путь к директории хранилища. По умолчанию 'data/shards'.
+            keyword (Optional[str], optional): Ключевое слово для сохраняемых вакансий,
+                                               если оно не передано в данных. По умолчанию
+                                               None (DEFAULT_KEYWORD).
+        """
+        self.__path = path
+        self.__keyword = keyword
+        self.__manifest_path = os.path.join(path, MANIFEST_NAME)
+        # Блокировка чтения-изменения-записи манифеста из нескольких процессов
+        self.__lock = FileLock(os.path.join(path, 'manifest.lock'))
+        os.makedirs(path, exist_ok=True)
+
+    def get_path(self) -> str:
+        """
+        Возвращает путь к директории хранилища.
+
+        Returns:
+            str: Путь к директории.
+        """
+        return self.__path
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """
+        Сохраняет вакансии в сегмент ключевого слова и даты сбора. Не добавляет дубликаты
+        вакансий внутри сегмента.
+
+        Args:
+            data (Dict[str, Any]): Вакансии в списке 'items', ключевое слово 'keyword' и дата
+                                   сбора 'crawl_date' (ГГГГ-ММ-ДД, по умолчанию сегодня).
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+            ValueError: Если дата сбора задана в неверном формате.
+        """
+        self.upsert(data.get('items', []), keyword=data.get('keyword'), crawl_date=data.get('crawl_date'))
+
+    def upsert(self, items: Iterable[Dict[str, Any]], keyword: Optional[str] = None,
+               crawl_date: Optional[str] = None) -> UpsertResult:
+        """
+        Добавляет новые и обновляет изменившиеся вакансии в сегменте (см. JSONLSaver.upsert).
+
+        Диапазоны сегмента в манифесте расширяются до записи вакансий, поэтому после сбоя
+        между записями манифест не исключает из запросов сохраненные вакансии. Блокировка
+        манифеста удерживается до обновления количества вакансий, поэтому одновременные
+        drop и archive не удаляют описание сегмента, в который выполняется запись.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Записи вакансий.
+            keyword (Optional[str], optional): Ключевое слово поиска. По умолчанию ключевое
+                                               слово экземпляра.
+            crawl_date (Optional[str], optional): Дата сбора ГГГГ-ММ-ДД. По умолчанию сегодня.
+
+        Returns:
+            UpsertResult: Количество добавленных, обновленных и неизменных вакансий.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+            ValueError: Если дата сбора задана в неверном формате.
+        """
+        items = list(items)
+        keyword = keyword or self.__keyword or DEFAULT_KEYWORD
+        crawl_date = date.fromisoformat(crawl_date).isoformat() if crawl_date else date.today().isoformat()
+        if not items:
+            return UpsertResult()
+        with self.__lock:
+            manifest = self.__load_manifest()
+            shard = self.__find_shard(manifest, keyword, crawl_date)
+            if shard is None:
+                shard = {"keyword": keyword, "date": crawl_date,
+                         "path": f'{shard_directory(keyword)}/{crawl_date}.jsonl', "count": 0,
+                         "stats": {field: None for field in STATS_FIELDS}}
+                manifest['shards'].append(shard)
+            stats = shard['stats']
+            for field in ('salary_from', 'salary_to'):
+                stats[field] = _merge_range(stats[field], (record_salary(item, field) for item in items))
+            stats['published_at'] = _merge_range(stats['published_at'], (item.get('published_at') or None
+                                                                         for item in items))
+            self.__write_manifest(manifest)
+
+            result = self.__shard_saver(shard).upsert(items)
+
+            if result.inserted:
+                shard['count'] += result.inserted
+                self.__write_manifest(manifest)
+        return result
+
+    def shards(self, criteria: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Возвращает описания сегментов из манифеста, которые могут содержать вакансии,
+        соответствующие критериям (см. shard_matches), от новых к старым.
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Критерии отбора. По умолчанию None.
+
+        Returns:
+            List[Dict[str, Any]]: Описания сегментов: ключевое слово, дата сбора, путь,
+                                  количество вакансий и диапазоны значений полей.
+        """
+        shards = self.__load_manifest()['shards']
+        if criteria:
+            shards = [shard for shard in shards if shard_matches(shard, criteria)]
+        return sorted(shards, key=lambda shard: (shard['date'], shard['keyword']), reverse=True)
+
+    def iter_vacancies(self, criteria: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Возвращает поток вакансий из сегментов, не отсеченных по манифесту, от новых к старым.
+
+        Вакансия, найденная в нескольких сегментах (например, по разным ключевым словам),
+        возвращается один раз — из самого нового сегмента. Если самый новый сегмент с ней
+        отсечен по диапазонам полей, вакансия не подходит по критериям, и ее копии из более
+        старых сегментов пропускаются: идентификаторы отсеченного сегмента читаются из его
+        индекса ключей.
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Критерии отбора сегментов и вакансий:
+                                                         'name', 'salary_from', 'salary_to',
+                                                         критерии дат и ключевого слова
+                                                         (см. shard_matches). По умолчанию None.
+
+        Yields:
+            Dict[str, Any]: Очередная вакансия.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файлов.
+        """
+        criteria = criteria or {}
+        shards = self.shards({key: criteria[key] for key in SCOPE_CRITERIA if key in criteria})
+        matching = [shard_matches(shard, criteria) for shard in shards]
+        # Отсеченные сегменты старше последнего читаемого не скрывают ни одной копии
+        last = max((index for index, match in enumerate(matching) if match), default=-1)
+        seen = set()
+        for shard, match in zip(shards[:last + 1], matching):
+            saver = self.__shard_saver(shard)
+            if not match:
+                seen.update(saver.ids())
+                continue
+            for vacancy in saver.iter_vacancies():
+                record_id = vacancy.get('id')
+                if record_id is not None:
+                    if record_id in seen:
+                        continue
+                    seen.add(record_id)
+                if record_matches(vacancy, criteria) and _published_matches(vacancy, criteria):
+                    yield vacancy
+
+    def get_vacancies(self, criteria: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии по заданным критериям, читая только подходящие сегменты.
+
+        Поддерживаются критерии iter_vacancies, а также 'collapse_duplicates', 'order_by'
+        и 'top_n' (см. JSONSaver.get_vacancies).
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Словарь с критериями фильтрации.
+                                                         По умолчанию None.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий, соответствующих критериям.
+        """
+        vacancies = self.iter_vacancies(criteria)
+        if not criteria:
+            return list(vacancies)
+        filtered = select_records(vacancies, criteria)
+        print(f'Найдено {len(filtered)} вакансий, соответствующих критериям.')
+        return filtered
+
+    def delete(self, record_id: Optional[str] = None) -> None:
+        """
+        Удаляет все вакансии или конкретную вакансию по идентификатору из всех сегментов.
+
+        Args:
+            record_id (Optional[str], optional): Идентификатор вакансии для удаления.
+                                                Если не указан, удаляются все вакансии.
+                                                По умолчанию None.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении данных.
+        """
+        try:
+            if record_id:
+                with self.__lock:
+                    manifest = self.__load_manifest()
+                    removed = 0
+                    for shard in manifest['shards']:
+                        saver = self.__shard_saver(shard)
+                        if saver.get(record_id) is not None:
+                            saver.delete(record_id)
+                            shard['count'] -= 1
+                            removed += 1
+                    if removed:
+                        self.__write_manifest(manifest)
+                if not removed:
+                    print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
+            else:
+                self.drop()
+                print(f'Все вакансии удалены из {self.__path}.')
+        except (IOError, OSError) as e:
+            raise IOError(f'Ошибка при удалении данных из {self.__path}: {e}')
+
+    def drop(self, keyword: Optional[str] = None, before: Optional[str] = None) -> int:
+        """
+        Удаляет сегменты целиком. Без аргументов удаляет все сегменты.
+
+        Args:
+            keyword (Optional[str], optional): Удалять только сегменты ключевого слова.
+            before (Optional[str], optional): Удалять только сегменты, собранные раньше даты
+                                              ГГГГ-ММ-ДД.
+
+        Returns:
+            int: Количество удаленных сегментов.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении файлов.
+        """
+        return self.__detach(keyword, before, None)
+
+    def archive(self, path: str, keyword: Optional[str] = None, before: Optional[str] = None) -> int:
+        """
+        Переносит сегменты в архивное хранилище ShardedSaver вместе с их описаниями из манифеста.
+
+        Args:
+            path (str): Путь к директории архивного хранилища.
+            keyword (Optional[str], optional): Переносить только сегменты ключевого слова.
+            before (Optional[str], optional): Переносить только сегменты, собранные раньше даты
+                                              ГГГГ-ММ-ДД.
+
+        Returns:
+            int: Количество перенесенных сегментов.
+
+        Raises:
+            IOError: Если произошла ошибка при переносе файлов.
+        """
+        return self.__detach(keyword, before, ShardedSaver(path))
+
+    def __detach(self, keyword: Optional[str], before: Optional[str], archive: Optional['ShardedSaver']) -> int:
+        """
+        Удаляет сегменты из хранилища, перенося их файлы в архив, если он задан.
+
+        При переносе сегменты сначала копируются в архив и добавляются в его манифест, затем
+        удаляются из манифеста хранилища, и только после этого удаляются их файлы. Прерванный
+        перенос оставляет сегмент в обоих хранилищах, но не теряет его. При удалении сегмент
+        сначала удаляется из манифеста, поэтому прерванная операция оставляет лишние файлы,
+        но не описания без файлов.
+
+        Args:
+            keyword (Optional[str]): Ключевое слово сегментов или None для всех.
+            before (Optional[str]): Дата сбора, раньше которой отбираются сегменты, или None.
+            archive (Optional[ShardedSaver]): Архивное хранилище или None для удаления.
+
+        Returns:
+            int: Количество отобранных сегментов.
+        """
+        try:
+            with self.__lock:
+                manifest = self.__load_manifest()
+                detached = [shard for shard in manifest['shards']
+                            if (keyword is None or shard['keyword'] == keyword)
+                            and (before is None or shard['date'] < before)]
+                if not detached:
+                    return 0
+                if archive is not None:
+                    for shard in detached:
+                        archive.__attach(shard, os.path.join(self.__path, shard['path']))
+                manifest['shards'] = [shard for shard in manifest['shards'] if shard not in detached]
+                self.__write_manifest(manifest)
+                for shard in detached:
+                    source = os.path.join(self.__path, shard['path'])
+                    for suffix in SHARD_SUFFIXES + ('.lock',):
+                        if os.path.exists(source + suffix):
+                            os.remove(source + suffix)
+                    directory = os.path.dirname(source)
+                    if not os.listdir(directory):
+                        os.rmdir(directory)
+            return len(detached)
+        except (IOError, OSError) as e:
+            raise IOError(f'Ошибка при удалении сегментов из {self.__path}: {e}')
+
+    def __attach(self, shard: Dict[str, Any], source: str) -> None:
+        """
+        Копирует файлы сегмента в хранилище и добавляет его описание в манифест. Сегмент
+        с тем же ключевым словом и датой заменяется.
+
+        Args:
+            shard (Dict[str, Any]): Описание сегмента.
+            source (str): Путь к файлу сегмента в исходном хранилище.
+        """
+        target = os.path.join(self.__path, shard['path'])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with self.__lock:
+            for suffix in SHARD_SUFFIXES:
+                if os.path.exists(source + suffix):
+                    shutil.copyfile(source + suffix, target + suffix)
+            manifest = self.__load_manifest()
+            manifest['shards'] = [existing for existing in manifest['shards']
+                                  if (existing['keyword'], existing['date']) != (shard['keyword'], shard['date'])]
+            manifest['shards'].append(shard)
+            self.__write_manifest(manifest)
+
+    def __shard_saver(self, shard: Dict[str, Any]) -> JSONLSaver:
+        """
+        Возвращает хранилище JSON Lines сегмента.
+        """
+        return JSONLSaver(path=os.path.join(self.__path, shard['path']))
+
+    @staticmethod
+    def __find_shard(manifest: Dict[str, Any], keyword: str, crawl_date: str) -> Optional[Dict[str, Any]]:
+        """
+        Находит описание сегмента в манифесте по ключевому слову и дате сбора.
+        """
+        for shard in manifest['shards']:
+            if shard['keyword'] == keyword and shard['date'] == crawl_date:
+                return shard
+        return None
+
+    def __load_manifest(self) -> Dict[str, Any]:
+        """
+        Загружает манифест хранилища.
+
+        Returns:
+            Dict[str, Any]: Манифест или пустой манифест, если файла нет.
+
+        Raises:
+            IOError: Если манифест не удалось прочитать.
+        """
+        if not os.path.exists(self.__manifest_path):
+            return {"version": MANIFEST_VERSION, "shards": []}
+        try:
+            with open(self.__manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (IOError, ValueError) as e:
+            raise IOError(f'Ошибка при чтении манифеста из {self.__manifest_path}: {e}')
+
+    def __write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Записывает манифест через атомарную замену файла (см. durability.atomic_replace).
+
+        Args:
+            manifest (Dict[str, Any]): Манифест.
+
+        Raises:
+            IOError: Если произошла ошибка при записи файла.
+        """
+        tmp_path = self.__manifest_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, ensure_ascii=False, indent=4)
+            atomic_replace(tmp_path, self.__manifest_path)
+        except IOError as e:
+            raise IOError(f'Ошибка при записи манифеста в {self.__manifest_path}: {e}')
@@ -0,0 +1,382 @@
+from .abstract_class import Saver
+from .fingerprint import record_fingerprint
+from .query import normalize_order_by
+from .records import record_salary, select_records
+from .text_index import stem, tokenize
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import sqlite3
+
+
+# Таблица вакансий: столбцы для фильтров и сортировки и исходная запись в формате JSON.
+# Полнотекстовая таблица FTS5 пополняется одним запросом после пакетной вставки (построчный
+# триггер при вставке в несколько раз медленнее), удаление и замена вакансии синхронизируются
+# триггерами.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    rowid INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    id TEXT,
+    name TEXT,
+    area TEXT,
+    currency TEXT,
+    url TEXT,
+    requirement TEXT,
+    salary_from REAL,
+    salary_to REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vacancies_salary_from ON vacancies(salary_from);
+CREATE INDEX IF NOT EXISTS vacancies_salary_to ON vacancies(salary_to);
+CREATE INDEX IF NOT EXISTS vacancies_currency ON vacancies(currency);
+CREATE INDEX IF NOT EXISTS vacancies_area ON vacancies(area);
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+    name, requirement, content='vacancies', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_delete AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts(vacancies_fts, rowid, name, requirement)
+    VALUES ('delete', old.rowid, old.name, old.requirement);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_update AFTER UPDATE ON vacancies BEGIN
+    INSERT INTO vacancies_fts(vacancies_fts, rowid, name, requirement)
+    VALUES ('delete', old.rowid, old.name, old.requirement);
+    INSERT INTO vacancies_fts(rowid, name, requirement) VALUES (new.rowid, new.name, new.requirement);
+END;
+"""
+
+# Уникальный индекс идентификаторов: вакансия хранится в одной версии. В базах, созданных до
+# его появления, индекс был неуникальным, и перед созданием остается последняя версия вакансии.
+ID_INDEX_SQL = """
+DELETE FROM vacancies WHERE id IS NOT NULL AND rowid NOT IN (
+    SELECT MAX(rowid) FROM vacancies WHERE id IS NOT NULL GROUP BY id
+);
+DROP INDEX IF EXISTS vacancies_id;
+CREATE UNIQUE INDEX vacancies_id_unique ON vacancies(id) WHERE id IS NOT NULL;
+"""
+
+# Вакансия с сохраненным идентификатором заменяется, если изменился ее отпечаток; строка
+# сохраняет rowid, поэтому порядок вакансий не меняется. Вакансия без идентификатора
+# пропускается, если запись с тем же отпечатком уже есть.
+INSERT_SQL = ('INSERT INTO vacancies '
+              '(fingerprint, id, name, area, currency, url, requirement, salary_from, salary_to, data) '
+              'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+              'ON CONFLICT(id) WHERE id IS NOT NULL DO UPDATE SET '
+              'fingerprint = excluded.fingerprint, name = excluded.name, area = excluded.area, '
+              'currency = excluded.currency, url = excluded.url, requirement = excluded.requirement, '
+              'salary_from = excluded.salary_from, salary_to = excluded.salary_to, data = excluded.data '
+              'WHERE vacancies.fingerprint != excluded.fingerprint '
+              'ON CONFLICT DO NOTHING')
+
+# Добавление в полнотекстовую таблицу строк, вставленных после строки с указанным rowid
+INDEX_FTS_SQL = ('INSERT INTO vacancies_fts(rowid, name, requirement) '
+                 'SELECT rowid, name, requirement FROM vacancies WHERE rowid > ?')
+
+# Поля сортировки, которые вычисляются в SQL (зарплата — в базовой валюте)
+ORDER_COLUMNS = {
+    'salary_from': 'vacancies.salary_from',
+    'salary_to': 'vacancies.salary_to',
+    'avg_salary': 'CASE WHEN vacancies.salary_from IS NOT NULL AND vacancies.salary_to IS NOT NULL '
+                  'THEN (vacancies.salary_from + vacancies.salary_to) / 2.0 '
+                  'ELSE COALESCE(vacancies.salary_from, vacancies.salary_to) END',
+    'name': 'vacancies.name',
+    'desc': 'vacancies.area',
+    'currency': 'vacancies.currency',
+    'url': 'vacancies.url',
+    'requirement': 'vacancies.requirement',
+    'id': 'vacancies.id',
+}
+
+
+def fts_query(text: str, mode: str = 'and') -> Optional[str]:
+    """
+    Строит запрос FTS5 из слов запроса пользователя.
+
+    Каждое слово приводится к основе (см. text_index.stem) и ищется как префикс, поэтому
+    словоформы находятся так же, как в полнотекстовом индексе JSONSaver.
+
+    Args:
+        text (str): Текст запроса.
+        mode (str, optional): 'and' — все слова, 'or' — хотя бы одно. По умолчанию 'and'.
+
+    Returns:
+        Optional[str]: Запрос FTS5 или None, если в тексте нет слов.
+
+    Raises:
+        ValueError: Если указан неизвестный режим поиска.
+    """
+    if mode not in ('and', 'or'):
+        raise ValueError("Режим поиска должен быть 'and' или 'or'.")
+    terms = list(dict.fromkeys(stem(token) for token in tokenize(text)))
+    if not terms:
+        return None
+    return f' {mode.upper()} '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def _lower(value: Optional[str]) -> Optional[str]:
+    """
+    Приводит строку к нижнему регистру с учетом кириллицы (встроенная lower() SQLite
+    работает только с ASCII).
+    """
+    return value.lower() if value is not None else None
+
+
+class SQLiteSaver(Saver):
+    """
+    Реализация абстрактного класса Saver с хранением вакансий в базе SQLite.
+
+    Фильтры по зарплате, валюте и региону вычисляются по индексам, полнотекстовый поиск —
+    по таблице FTS5; сортировка и ограничение количества результатов выполняются в SQL.
+    """
+
+    def __init__(self, path: str = 'data/vacancies.db'):
+        """
+        Инициализирует экземпляр SQLiteSaver и создает таблицы, если их нет.
+
+        Args:
+            path (str, optional): Путь к файлу базы данных. По умолчанию 'data/vacancies.db'.
+
+        Raises:
+            IOError: Если не удалось открыть базу данных.
+        """
+        self.__path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            self.__connection = sqlite3.connect(path)
+            self.__connection.create_function('py_lower', 1, _lower, deterministic=True)
+            self.__connection.execute('PRAGMA journal_mode=WAL')
+            self.__connection.execute('PRAGMA synchronous=NORMAL')
+            self.__connection.executescript(SCHEMA)
+            exists = self.__connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' "
+                                               "AND name = 'vacancies_id_unique'").fetchone()
+            if exists is None:
+                self.__connection.executescript(ID_INDEX_SQL)
+        except sqlite3.Error as e:
+            raise IOError(f'Ошибка при открытии базы данных {path}: {e}')
+
+    def __enter__(self) -> 'SQLiteSaver':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        self.__connection.close()
+
+    def get_path(self) -> str:
+        """
+        Возвращает путь к файлу базы данных.
+
+        Returns:
+            str: Путь к файлу базы данных.
+        """
+        return self.__path
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """
+        Сохраняет вакансии одной транзакцией. Не добавляет дубликаты вакансий: вакансия с уже
+        сохраненным идентификатором заменяется, если изменилось ее содержимое (по отпечатку,
+        см. fingerprint.record_fingerprint), вакансия без идентификатора сравнивается по отпечатку.
+        Если вакансия встречается в 'items' несколько раз, сохраняется последняя версия.
+
+        Args:
+            data (Dict[str, Any]): Данные для сохранения: вакансии в списке 'items'.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в базу данных.
+        """
+        items = list(data.get('items', []))
+        # Из нескольких версий вакансии в пакете сохраняется последняя: триггер обновления
+        # удалил бы из FTS строку вставленной в этом же пакете версии, которая еще не проиндексирована
+        last = {item['id']: index for index, item in enumerate(items) if item.get('id') is not None}
+        rows = ((record_fingerprint(item), item.get('id'), item.get('name'), item.get('desc'), item.get('currency'),
+                 item.get('url'), item.get('requirement'), record_salary(item, 'salary_from'),
+                 record_salary(item, 'salary_to'), json.dumps(item, ensure_ascii=False))
+                for index, item in enumerate(items) if item.get('id') is None or last[item['id']] == index)
+        try:
+            with self.__connection:
+                # Новые строки получают rowid больше текущего максимума
+                last_rowid = self.__connection.execute('SELECT COALESCE(MAX(rowid), 0) FROM vacancies').fetchone()[0]
+                self.__connection.executemany(INSERT_SQL, rows)
+                self.__connection.execute(INDEX_FTS_SQL, (last_rowid,))
+        except sqlite3.Error as e:
+            raise IOError(f'Ошибка при записи в {self.__path}: {e}')
+
+    def get_vacancies(self, criteria: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Получает вакансии из базы данных по заданным критериям.
+
+        Критерии 'name', 'salary_from', 'salary_to', 'salary_overlap' (см. JSONSaver), 'currency',
+        'area' (регион, поле 'desc'), 'text' и 'text_mode' (полнотекстовый поиск FTS5 по названию
+        и требованиям, результаты по релевантности), 'order_by' и 'top_n' вычисляются в SQL.
+        Критерий 'collapse_duplicates' и сортировка по полям, которых нет в таблице,
+        применяются к отобранным записям.
+
+        Args:
+            criteria (Optional[Dict[str, Any]], optional): Словарь с критериями фильтрации.
+                                                         По умолчанию None.
+
+        Returns:
+            List[Dict[str, Any]]: Список вакансий, соответствующих критериям.
+
+        Raises:
+            IOError: Если произошла ошибка при чтении из базы данных.
+        """
+        criteria = criteria or {}
+        try:
+            if not criteria:
+                return self.__fetch('SELECT data FROM vacancies ORDER BY rowid', ())
+
+            source, where, params = self.__where(criteria)
+            if source is None:
+                filtered: List[Dict[str, Any]] = []
+            else:
+                order = self.__order(criteria)
+                sql = f'SELECT vacancies.data FROM {source}'
+                if where:
+                    sql += ' WHERE ' + ' AND '.join(where)
+                if order is None or criteria.get('collapse_duplicates'):
+                    # Остальные критерии применяются к отобранным записям
+                    sql += ' ORDER BY ' + ('vacancies_fts.rank' if 'text' in criteria else 'vacancies.rowid')
+                    rest = {key: value for key, value in criteria.items()
+                            if key in ('collapse_duplicates', 'order_by', 'top_n')}
+                    filtered = select_records(self.__iter_fetch(sql, params), rest)
+                else:
+                    sql += ' ORDER BY ' + order
+                    if 'top_n' in criteria:
+                        sql += ' LIMIT ?'
+                        params.append(max(criteria['top_n'], 0))
+                    filtered = self.__fetch(sql, params)
+
+            print(f'Найдено {len(filtered)} вакансий, соответствующих критериям.')
+            return filtered
+        except sqlite3.Error as e:
+            raise IOError(f'Ошибка при чтении из {self.__path}: {e}')
+
+    def delete(self, record_id: Optional[str] = None) -> None:
+        """
+        Удаляет все вакансии или конкретную вакансию по идентификатору.
+
+        Args:
+            record_id (Optional[str], optional): Идентификатор вакансии для удаления.
+                                                Если не указан, удаляются все вакансии.
+                                                По умолчанию None.
+
+        Raises:
+            IOError: Если произошла ошибка при удалении данных.
+        """
+        try:
+            with self.__connection:
+                if record_id:
+                    cursor = self.__connection.execute('DELETE FROM vacancies WHERE id = ?', (record_id,))
+                    if cursor.rowcount:
+                        print(f'Вакансия с id {record_id} удалена из {self.__path}.')
+                    else:
+                        print(f'Вакансия с id {record_id} не найдена в {self.__path}.')
+                else:
+                    self.__connection.execute('DELETE FROM vacancies')
+                    print(f'Все вакансии удалены из {self.__path}.')
+        except sqlite3.Error as e:
+            raise IOError(f'Ошибка при удалении данных из {self.__path}: {e}')
+
+    def __fetch(self, sql: str, params: Iterable[Any]) -> List[Dict[str, Any]]:
+        """
+        Выполняет запрос и возвращает записи вакансий.
+
+        Args:
+            sql (str): Запрос, возвращающий столбец data.
+            params (Iterable[Any]): Параметры запроса.
+
+        Returns:
+            List[Dict[str, Any]]: Записи вакансий.
+        """
+        return [json.loads(data) for data, in self.__connection.execute(sql, tuple(params))]
+
+    def __iter_fetch(self, sql: str, params: Iterable[Any]) -> Iterable[Dict[str, Any]]:
+        """
+        Выполняет запрос и возвращает поток записей вакансий.
+
+        Args:
+            sql (str): Запрос, возвращающий столбец data.
+            params (Iterable[Any]): Параметры запроса.
+
+        Yields:
+            Dict[str, Any]: Очередная запись вакансии.
+        """
+        for data, in self.__connection.execute(sql, tuple(params)):
+            yield json.loads(data)
+
+    @staticmethod
+    def __where(criteria: Dict[str, Any]) -> Tuple[Optional[str], List[str], List[Any]]:
+        """
+        Переводит критерии фильтрации в условия SQL.
+
+        Args:
+            criteria (Dict[str, Any]): Критерии фильтрации.
+
+        Returns:
+            Tuple[Optional[str], List[str], List[Any]]: Источник строк для FROM (None, если
+                                                         запрос заведомо ничего не найдет),
+                                                         условия и их параметры.
+        """
+        source, where, params = 'vacancies', [], []
+        if 'text' in criteria:
+            match = fts_query(criteria['text'], criteria.get('text_mode', 'and'))
+            if match is None:
+                return None, where, params
+            source = 'vacancies JOIN vacancies_fts ON vacancies_fts.rowid = vacancies.rowid'
+            where.append('vacancies_fts MATCH ?')
+            params.append(match)
+        if 'name' in criteria:
+            where.append('instr(py_lower(vacancies.name), ?) > 0')
+            params.append(criteria['name'].lower())
+        if 'salary_from' in criteria:
+            where.append('vacancies.salary_from >= ?')
+            params.append(criteria['salary_from'])
+        if 'salary_to' in criteria:
+            where.append('vacancies.salary_to <= ?')
+            params.append(criteria['salary_to'])
+        if 'salary_overlap' in criteria:
+            low, high = criteria['salary_overlap']
+            where.append('(vacancies.salary_from IS NOT NULL OR vacancies.salary_to IS NOT NULL)')
+            if high is not None:
+                where.append('(vacancies.salary_from IS NULL OR vacancies.salary_from <= ?)')
+                params.append(high)
+            if low is not None:
+                where.append('(vacancies.salary_to IS NULL OR vacancies.salary_to >= ?)')
+                params.append(low)
+        if 'currency' in criteria:
+            where.append('vacancies.currency = ?')
+            params.append(criteria['currency'])
+        if 'area' in criteria:
+            where.append('vacancies.area = ?')
+            params.append(criteria['area'])
+        return source, where, params
+
+    @staticmethod
+    def __order(criteria: Dict[str, Any]) -> Optional[str]:
+        """
+        Переводит спецификацию сортировки в ORDER BY.
+
+        Равные записи упорядочиваются по порядку добавления, как при устойчивой сортировке.
+
+        Args:
+            criteria (Dict[str, Any]): Критерии выборки.
+
+        Returns:
+            Optional[str]: Выражение ORDER BY или None, если сортировку нельзя выполнить в SQL.
+        """
+        if not criteria.get('order_by'):
+            return 'vacancies_fts.rank, vacancies.rowid' if 'text' in criteria else 'vacancies.rowid'
+        terms = []
+        for field, direction, nulls in normalize_order_by(criteria['order_by']):
+            column = ORDER_COLUMNS.get(field)
+            if column is None:
+                return None
+            terms.append(f'{column} {direction.upper()} NULLS {nulls.upper()}')
+        return ', '.join(terms) + ', vacancies.rowid'
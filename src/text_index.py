@@ -0,0 +1,563 @@
+from .durability import atomic_replace
+import heapq
+import json
+import math
+import os
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+TOKEN_RE = re.compile(r'[a-zа-я0-9+#]+')
+
+RU_VOWELS = 'аеиоуыэюя'
+
+# Минимальная длина основы: защищает короткие слова ('опыт', 'сеть') от усечения
+MIN_STEM_LENGTH = 3
+
+# Окончания упрощенного стеммера Snowball для русского языка (длинные проверяются первыми)
+RU_PERFECTIVE_GERUND_1 = ('вшись', 'вши', 'в')  # только после 'а' или 'я'
+RU_PERFECTIVE_GERUND_2 = ('ывшись', 'ившись', 'ывши', 'ивши', 'ыв', 'ив')
+RU_REFLEXIVE = ('ся', 'сь')
+RU_ADJECTIVE = ('ими', 'ыми', 'его', 'ого', 'ему', 'ому', 'ее', 'ие', 'ые', 'ое', 'ей', 'ий', 'ый',
+                'ой', 'ем', 'им', 'ым', 'ом', 'их', 'ых', 'ую', 'юю', 'ая', 'яя', 'ою', 'ею')
+RU_PARTICIPLE_1 = ('ем', 'нн', 'вш', 'ющ', 'щ')  # только после 'а' или 'я'
+RU_PARTICIPLE_2 = ('ивш', 'ывш', 'ующ')
+RU_VERB_1 = ('ешь', 'нно', 'ете', 'йте', 'ла', 'на', 'ли', 'ем', 'ло', 'но', 'ет', 'ют', 'ны', 'ть',
+             'й', 'л', 'н')  # только после 'а' или 'я'
+RU_VERB_2 = ('уйте', 'ейте', 'ует', 'уют', 'ила', 'ыла', 'ена', 'ите', 'или', 'ыли', 'ило', 'ыло',
+             'ено', 'ят', 'ит', 'ыт', 'ены', 'ить', 'ыть', 'ишь', 'ей', 'уй', 'ил', 'ыл', 'им', 'ым',
+             'ен', 'ю')
+RU_NOUN = ('иями', 'ями', 'ами', 'ией', 'иям', 'ием', 'иях', 'ев', 'ов', 'ие', 'ье', 'еи', 'ии', 'ей',
+           'ой', 'ий', 'ям', 'ем', 'ам', 'ом', 'ах', 'ях', 'ию', 'ью', 'ия', 'ья', 'а', 'е', 'и', 'й',
+           'о', 'у', 'ы', 'ь', 'ю', 'я')
+RU_SUPERLATIVE = ('ейше', 'ейш')
+RU_DERIVATIONAL = ('ость', 'ост')
+
+# Список вхождений триграммы подсчитывается целиком, если он не длиннее
+# BULK_COUNT_FACTOR * число кандидатов (подсчет в C быстрее бинарного поиска в Python)
+BULK_COUNT_FACTOR = 16
+
+EN_SUFFIXES = ('ational', 'ization', 'fulness', 'ousness', 'iveness', 'ations', 'ation', 'ement',
+               'ments', 'ment', 'ness', 'ings', 'ing', 'ies', 'ied', 'ers', 'er', 'ed', 'ly', 'es', 's')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Разбивает текст на слова в нижнем регистре.
+
+    Args:
+        text (str): Исходный текст.
+
+    Returns:
+        List[str]: Список слов.
+    """
+    if not text:
+        return []
+    return TOKEN_RE.findall(text.lower().replace('ё', 'е'))
+
+
+def _strip_ending(word: str, start: int, endings: Tuple[str, ...],
+                  after_a: bool = False) -> Optional[str]:
+    """
+    Удаляет первое подходящее окончание из области слова, начинающейся с позиции start.
+
+    Args:
+        word (str): Слово.
+        start (int): Начало области, в которой ищется окончание.
+        endings (Tuple[str, ...]): Окончания в порядке проверки.
+        after_a (bool, optional): Окончание должно следовать за 'а' или 'я'. По умолчанию False.
+
+    Returns:
+        Optional[str]: Слово без окончания или None, если окончание не найдено.
+    """
+    for ending in endings:
+        if word.endswith(ending) and len(word) - len(ending) >= max(start, MIN_STEM_LENGTH):
+            stem = word[:-len(ending)]
+            if after_a and not (len(stem) > start and stem[-1] in 'ая'):
+                continue
+            return stem
+    return None
+
+
+def stem_ru(word: str) -> str:
+    """
+    Выделяет основу русского слова (упрощенный стеммер Snowball).
+
+    Args:
+        word (str): Слово в нижнем регистре.
+
+    Returns:
+        str: Основа слова.
+    """
+    rv = next((i + 1 for i, char in enumerate(word) if char in RU_VOWELS), len(word))
+    if rv >= len(word):
+        return word
+
+    stem = (_strip_ending(word, rv, RU_PERFECTIVE_GERUND_1, after_a=True)
+            or _strip_ending(word, rv, RU_PERFECTIVE_GERUND_2))
+    if stem is None:
+        word = _strip_ending(word, rv, RU_REFLEXIVE) or word
+        adjective = _strip_ending(word, rv, RU_ADJECTIVE)
+        if adjective is not None:
+            stem = (_strip_ending(adjective, rv, RU_PARTICIPLE_1, after_a=True)
+                    or _strip_ending(adjective, rv, RU_PARTICIPLE_2)
+                    or adjective)
+        else:
+            stem = (_strip_ending(word, rv, RU_VERB_1, after_a=True)
+                    or _strip_ending(word, rv, RU_VERB_2)
+                    or _strip_ending(word, rv, RU_NOUN)
+                    or word)
+    word = stem
+
+    if word.endswith('и') and len(word) - 1 >= rv:
+        word = word[:-1]
+    word = _strip_ending(word, rv, RU_DERIVATIONAL) or word
+    if word.endswith('нн'):
+        word = word[:-1]
+    else:
+        superlative = _strip_ending(word, rv, RU_SUPERLATIVE)
+        if superlative is not None:
+            word = superlative[:-1] if superlative.endswith('нн') else superlative
+        elif word.endswith('ь') and len(word) - 1 >= rv:
+            word = word[:-1]
+    return word
+
+
+def stem_en(word: str) -> str:
+    """
+    Выделяет основу английского слова (упрощенное удаление суффиксов в духе Porter).
+
+    Args:
+        word (str): Слово в нижнем регистре.
+
+    Returns:
+        str: Основа слова.
+    """
+    if len(word) <= 3 or word.endswith('ss'):
+        return word
+    for suffix in EN_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            stem = word[:-len(suffix)]
+            if suffix in ('ies', 'ied'):
+                stem += 'y'
+            elif len(stem) > 3 and stem[-1] == stem[-2] and stem[-1] not in 'lsz':
+                # developing -> develop, running -> run
+                stem = stem[:-1]
+            return stem
+    return word
+
+
+def stem(word: str) -> str:
+    """
+    Выделяет основу слова, выбирая стеммер по алфавиту слова.
+
+    Args:
+        word (str): Слово в нижнем регистре.
+
+    Returns:
+        str: Основа слова.
+    """
+    if any('а' <= char <= 'я' for char in word):
+        return stem_ru(word)
+    if word.isalpha():
+        return stem_en(word)
+    return word
+
+
+def analyze(text: str) -> List[str]:
+    """
+    Разбивает текст на термы: слова в нижнем регистре, приведенные к основе.
+
+    Args:
+        text (str): Исходный текст.
+
+    Returns:
+        List[str]: Список термов.
+    """
+    return [stem(token) for token in tokenize(text)]
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс для полнотекстового поиска с ранжированием BM25.
+
+    Attributes:
+        k1 (float): Параметр насыщения частоты терма BM25.
+        b (float): Параметр нормализации длины документа BM25.
+        version (Optional[Any]): Версия данных, по которым построен индекс, сохраняемая вместе
+                                 с ним (например, подпись файла вакансий); None, если не задана.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Инициализирует пустой экземпляр InvertedIndex.
+
+        Args:
+            k1 (float, optional): Параметр k1 BM25. По умолчанию 1.5.
+            b (float, optional): Параметр b BM25. По умолчанию 0.75.
+        """
+        self.k1 = k1
+        self.b = b
+        self.version: Optional[Any] = None
+        self.__postings: Dict[str, Dict[Hashable, int]] = defaultdict(dict)
+        self.__doc_lengths: Dict[Hashable, int] = {}
+        self.__total_length = 0
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество проиндексированных документов.
+
+        Returns:
+            int: Количество документов.
+        """
+        return len(self.__doc_lengths)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        """
+        Проверяет, проиндексирован ли документ.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+
+        Returns:
+            bool: True, если документ есть в индексе.
+        """
+        return doc_id in self.__doc_lengths
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """
+        Добавляет документ в индекс.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+            text (str): Текст документа.
+        """
+        if doc_id in self.__doc_lengths:
+            return
+        terms = analyze(text)
+        self.__doc_lengths[doc_id] = len(terms)
+        self.__total_length += len(terms)
+        for term in terms:
+            postings = self.__postings[term]
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+
+    def remove(self, doc_id: Hashable, text: str) -> None:
+        """
+        Удаляет документ из индекса.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+            text (str): Текст, с которым документ был добавлен: по нему находятся
+                        списки документов, из которых нужно удалить документ.
+        """
+        if doc_id not in self.__doc_lengths:
+            return
+        self.__total_length -= self.__doc_lengths.pop(doc_id)
+        for term in set(analyze(text)):
+            postings = self.__postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.__postings[term]
+
+    def search(self, query: str, mode: str = 'and', limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Ищет документы по запросу и ранжирует их по BM25.
+
+        Args:
+            query (str): Текст запроса из одного или нескольких слов.
+            mode (str, optional): 'and' — документ должен содержать все термы запроса,
+                                  'or' — хотя бы один. По умолчанию 'and'.
+            limit (Optional[int], optional): Максимальное количество результатов. По умолчанию None.
+
+        Returns:
+            List[Tuple[Hashable, float]]: Пары (идентификатор документа, оценка) по убыванию оценки.
+
+        Raises:
+            ValueError: Если указан неизвестный режим поиска.
+        """
+        if mode not in ('and', 'or'):
+            raise ValueError("Режим поиска должен быть 'and' или 'or'.")
+        terms = list(dict.fromkeys(analyze(query)))
+        if not terms or not self.__doc_lengths:
+            return []
+
+        postings = [self.__postings.get(term, {}) for term in terms]
+        if mode == 'and':
+            if not all(postings):
+                return []
+            # Пересечение начинается с самого короткого списка
+            smallest = min(postings, key=len)
+            candidates = [doc_id for doc_id in smallest if all(doc_id in plist for plist in postings)]
+        else:
+            candidates = set()
+            for plist in postings:
+                candidates.update(plist)
+
+        total_docs = len(self.__doc_lengths)
+        avg_length = self.__total_length / total_docs or 1
+        idfs = [math.log(1 + (total_docs - len(plist) + 0.5) / (len(plist) + 0.5)) for plist in postings]
+        k1, b = self.k1, self.b
+
+        scores = []
+        for doc_id in candidates:
+            norm = k1 * (1 - b + b * self.__doc_lengths[doc_id] / avg_length)
+            score = 0.0
+            for plist, idf in zip(postings, idfs):
+                tf = plist.get(doc_id)
+                if tf:
+                    score += idf * tf * (k1 + 1) / (tf + norm)
+            scores.append((doc_id, score))
+
+        scores.sort(key=lambda pair: pair[1], reverse=True)
+        return scores[:limit] if limit is not None else scores
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Преобразует индекс в словарь для сохранения.
+
+        Returns:
+            Dict[str, Any]: Словарь с данными индекса.
+        """
+        return {
+            "k1": self.k1,
+            "b": self.b,
+            "version": self.version,
+            "docs": [[doc_id, length] for doc_id, length in self.__doc_lengths.items()],
+            "postings": {term: [[doc_id, tf] for doc_id, tf in plist.items()]
+                         for term, plist in self.__postings.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'InvertedIndex':
+        """
+        Создает индекс из словаря, полученного методом to_dict.
+
+        Args:
+            data (Dict[str, Any]): Словарь с данными индекса.
+
+        Returns:
+            InvertedIndex: Восстановленный индекс.
+        """
+        index = cls(k1=data.get('k1', 1.5), b=data.get('b', 0.75))
+        index.version = data.get('version')
+        index.__doc_lengths = {doc_id: length for doc_id, length in data.get('docs', [])}
+        index.__total_length = sum(index.__doc_lengths.values())
+        for term, plist in data.get('postings', {}).items():
+            index.__postings[term] = {doc_id: tf for doc_id, tf in plist}
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет индекс в JSON файл.
+
+        Индекс записывается во временный файл, который затем атомарно заменяет прежний
+        (см. durability.atomic_replace), поэтому прерванная запись не оставляет поврежденный файл.
+
+        Args:
+            path (str): Путь к файлу индекса.
+
+        Raises:
+            IOError: Если произошла ошибка при записи в файл.
+        """
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, ensure_ascii=False)
+            atomic_replace(tmp_path, path)
+        except IOError as e:
+            raise IOError(f'Ошибка при записи индекса в {path}: {e}')
+
+    @classmethod
+    def load(cls, path: str) -> 'InvertedIndex':
+        """
+        Загружает индекс из JSON файла.
+
+        Args:
+            path (str): Путь к файлу индекса.
+
+        Returns:
+            InvertedIndex: Загруженный индекс или пустой, если файла нет или он поврежден
+                           (индекс строится заново по данным).
+
+        Raises:
+            IOError: Если произошла ошибка при чтении файла.
+        """
+        try:
+            if not os.path.exists(path):
+                return cls()
+            with open(path, 'r', encoding='utf-8') as file:
+                return cls.from_dict(json.load(file))
+        except ValueError:
+            return cls()
+        except IOError as e:
+            raise IOError(f'Ошибка при чтении индекса из {path}: {e}')
+
+
+def vacancy_text(vacancy: Any) -> str:
+    """
+    Возвращает индексируемый текст вакансии: название и требования.
+
+    Args:
+        vacancy (Any): Экземпляр Vacancy или запись вакансии в виде словаря.
+
+    Returns:
+        str: Текст для индексации.
+    """
+    if isinstance(vacancy, dict):
+        return f"{vacancy.get('name') or ''} {vacancy.get('requirement') or ''}"
+    return f"{vacancy.name or ''} {vacancy.requirement or ''}"
+
+
+def build_index(documents: Iterable[Tuple[Hashable, str]]) -> InvertedIndex:
+    """
+    Строит индекс по парам (идентификатор, текст).
+
+    Args:
+        documents (Iterable[Tuple[Hashable, str]]): Документы для индексации.
+
+    Returns:
+        InvertedIndex: Построенный индекс.
+    """
+    index = InvertedIndex()
+    for doc_id, text in documents:
+        index.add(doc_id, text)
+    return index
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Возвращает множество триграмм текста.
+
+    Каждое слово дополняется двумя пробелами в начале и одним в конце, как в pg_trgm,
+    поэтому начало слова весит больше, чем его середина.
+
+    Args:
+        text (str): Исходный текст.
+
+    Returns:
+        Set[str]: Множество триграмм.
+    """
+    result = set()
+    for word in tokenize(text):
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+class TrigramIndex:
+    """
+    Триграммный индекс для нечеткого поиска, устойчивого к опечаткам.
+
+    Сходство названия с запросом — доля триграмм запроса, найденных в названии. Кандидаты
+    выбираются по спискам вхождений самых редких триграмм запроса (prefix filtering),
+    поэтому запрос не сравнивается с каждой записью.
+    """
+
+    def __init__(self):
+        """
+        Инициализирует пустой экземпляр TrigramIndex.
+        """
+        self.__postings: Dict[str, array] = {}
+        self.__sizes = array('H')
+        self.__doc_ids: List[Hashable] = []
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество проиндексированных документов.
+
+        Returns:
+            int: Количество документов.
+        """
+        return len(self.__doc_ids)
+
+    def add(self, doc_id: Hashable, text: str) -> None:
+        """
+        Добавляет документ в индекс.
+
+        Args:
+            doc_id (Hashable): Идентификатор документа.
+            text (str): Текст документа (например, название вакансии).
+        """
+        position = len(self.__doc_ids)
+        grams = trigrams(text)
+        for gram in grams:
+            postings = self.__postings.get(gram)
+            if postings is None:
+                postings = self.__postings[gram] = array('I')
+            # Позиции добавляются по возрастанию, поэтому списки вхождений отсортированы
+            postings.append(position)
+        self.__sizes.append(min(len(grams), 0xFFFF))
+        self.__doc_ids.append(doc_id)
+
+    def search(self, query: str, threshold: float = 0.4,
+               limit: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Ищет документы, похожие на запрос, с учетом опечаток.
+
+        Args:
+            query (str): Текст запроса.
+            threshold (float, optional): Минимальное сходство от 0 до 1. По умолчанию 0.4.
+            limit (Optional[int], optional): Максимальное количество результатов. По умолчанию None.
+
+        Returns:
+            List[Tuple[Hashable, float]]: Пары (идентификатор документа, сходство) по убыванию
+                                          сходства; при равном сходстве выше более короткие названия.
+
+        Raises:
+            ValueError: Если порог сходства вне диапазона (0, 1].
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Порог сходства должен быть в диапазоне (0, 1].")
+        grams = trigrams(query)
+        if not grams or not self.__doc_ids:
+            return []
+
+        size = len(grams)
+        min_overlap = max(1, math.ceil(threshold * size - 1e-9))
+        postings = sorted((self.__postings.get(gram, ()) for gram in grams), key=len)
+        # Документ с min_overlap общими триграммами обязательно содержит одну из
+        # (size - min_overlap + 1) самых редких триграмм запроса
+        prefix_length = size - min_overlap + 1
+        counts = Counter()
+        for plist in postings[:prefix_length]:
+            counts.update(plist)
+        candidates = len(counts)
+
+        # Остальные триграммы: короткие списки вхождений выгоднее подсчитать целиком,
+        # для длинных проверяется только вхождение кандидатов (бинарным поиском).
+        # Документы вне кандидатов не наберут min_overlap и отсеются ниже.
+        probes = []
+        for plist in postings[prefix_length:]:
+            if len(plist) <= BULK_COUNT_FACTOR * candidates:
+                counts.update(plist)
+            else:
+                probes.append(plist)
+
+        entries = counts.items()
+        if limit is not None and not probes and len(counts) > limit:
+            # Перекрытия окончательны: достаточно документов не хуже limit-го по перекрытию
+            cutoff = max(min_overlap, heapq.nlargest(limit, counts.values())[-1])
+            entries = [(position, overlap) for position, overlap in entries if overlap >= cutoff]
+
+        sizes = self.__sizes
+        scored = []
+        for position, overlap in entries:
+            if overlap + len(probes) < min_overlap:
+                continue
+            for plist in probes:
+                i = bisect_left(plist, position)
+                if i < len(plist) and plist[i] == position:
+                    overlap += 1
+            if overlap >= min_overlap:
+                union = size + sizes[position] - overlap
+                scored.append((overlap / size, overlap / union, position))
+
+        if limit is not None:
+            scored = heapq.nlargest(limit, scored)
+        else:
+            scored.sort(reverse=True)
+        return [(self.__doc_ids[position], similarity) for similarity, _, position in scored]
@@ -9,7 +9,12 @@ PARAMS_ADDED = {
     "sorted_salary_to": "Сортировка по зарплате до",
     "sorted_avg_salary_asc": "Сортировка по средней зарплате в порядке возрастания",
     "sorted_avg_salary_desc": "Сортировка по средней зарплате в порядке убывания",
-    "top_n": "Топ N вакансий"
+    "top_n": "Топ N вакансий",
+    "text": "Поиск по названию и требованиям",
+    "fuzzy_name": "Нечеткий поиск по названию",
+    "order_by": "Порядок сортировки",
+    "salary_overlap": "Вилка зарплаты пересекается с диапазоном",
+    "collapse_duplicates": "Схлопывание почти одинаковых вакансий"
 }
 
 
@@ -51,6 +56,11 @@ def get_info_commands_criteria() -> str:
         "11. done - завершить добавление фильтров\n"
         "12. clear - очистить фильтры\n"
         "13. stop - отменить добавление фильтров\n"
+        "14. text - поиск по названию и требованиям\n"
+        "15. fuzzy_name - нечеткий поиск по названию (с опечатками)\n"
+        "16. order_by - порядок сортировки (например: salary_from desc, name asc nulls first)\n"
+        "17. salary_overlap - вилка зарплаты пересекается с диапазоном (например: 100000 150000, - вместо открытой границы)\n"
+        "18. collapse_duplicates - схлопнуть почти одинаковые вакансии (перепубликации)\n"
         "Введите критерий: "
     )
 
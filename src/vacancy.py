@@ -1,5 +1,96 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
+from .fingerprint import FINGERPRINT_FIELDS, content_fingerprint
+from .schema import VACANCY_SCHEMA, compile_extractor, compile_fields
+
+
+def validate_vacancy_fields(name: Any, salary_from: Any, salary_to: Any, url: Any) -> None:
+    """
+    Проверяет поля вакансии.
+
+    Args:
+        name (Any): Название вакансии.
+        salary_from (Any): Минимальная зарплата.
+        salary_to (Any): Максимальная зарплата.
+        url (Any): URL вакансии.
+
+    Raises:
+        ValueError: Если значения полей некорректны.
+    """
+    if salary_from is not None and salary_from < 0:
+        raise ValueError("salary_from не может быть отрицательным.")
+    if salary_to is not None and salary_to < 0:
+        raise ValueError("salary_to не может быть отрицательным.")
+    if salary_from is not None and salary_to is not None:
+        if salary_from > salary_to:
+            raise ValueError("salary_from не может быть больше salary_to.")
+    if url and not (url.startswith("http://") or url.startswith("https://")):
+        raise ValueError("url должен начинаться с 'http://' или 'https://'.")
+    if not name:
+        raise ValueError("Название вакансии не может быть пустым.")
+
+
+def average_of(salary_from: Optional[float], salary_to: Optional[float]) -> Optional[float]:
+    """
+    Вычисляет среднее значение по границам зарплаты.
+
+    Args:
+        salary_from (Optional[float]): Нижняя граница.
+        salary_to (Optional[float]): Верхняя граница.
+
+    Returns:
+        Optional[float]: Среднее значение или None, если обе границы не указаны.
+    """
+    if salary_from is not None and salary_to is not None:
+        return (salary_from + salary_to) / 2
+    elif salary_from is not None:
+        return float(salary_from)
+    elif salary_to is not None:
+        return float(salary_to)
+    return None
+
+
+# Поля Vacancy, которые сохраняются в словарь, только если они заданы
+OPTIONAL_FIELDS = ('id', 'employer', 'published_at', 'experience', 'schedule', 'alternate_url')
+
+# Поля сортировки вакансий с числовыми значениями (см. query.compile_order_by):
+# зарплата в базовой валюте и средняя зарплата 'avg_salary'
+NUMERIC_ORDER_FIELDS = ('salary_from', 'salary_to', 'avg_salary')
+
+
+class _SalaryField:
+    """
+    Поле зарплаты Vacancy, при присваивании которого пересчитывается ключ сортировки sort_key
+    и сбрасывается вычисленный отпечаток fingerprint.
+
+    Значение хранится в атрибуте экземпляра с префиксом '_'. Пересчет начинается после
+    __post_init__, когда все поля зарплаты уже заданы.
+    """
+
+    def __init__(self, default: Any):
+        """
+        Инициализирует поле.
+
+        Args:
+            default (Any): Значение по умолчанию.
+        """
+        self.__default = default
+        self.__name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = '_' + name
+
+    def __get__(self, instance: Optional['Vacancy'], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            # dataclass берет значение по умолчанию из атрибута класса
+            return self.__default
+        return getattr(instance, self.__name)
+
+    def __set__(self, instance: 'Vacancy', value: Any) -> None:
+        setattr(instance, self.__name, value)
+        if instance._ready:
+            instance.fingerprint = None
+            instance.refresh_sort_key()
 
 
 @dataclass
@@ -15,32 +106,53 @@ class Vacancy:
         currency (str): Валюта зарплаты.
         url (str): URL вакансии.
         requirement (str): Требования к вакансии. По умолчанию 'Информация отсутствует'.
+        id (Optional[str]): Идентификатор вакансии на HH.ru.
+        employer (Optional[str]): Название работодателя.
+        published_at (Optional[str]): Дата публикации в формате ISO 8601.
+        experience (Optional[str]): Требуемый опыт работы.
+        schedule (Optional[str]): График работы.
+        alternate_url (Optional[str]): Ссылка на страницу вакансии на сайте HH.ru.
+        salary_rate (float): Множитель пересчета зарплаты в базовую валюту (см. CurrencyConverter).
+        norm_salary_from (Optional[float]): Минимальная зарплата в базовой валюте.
+        norm_salary_to (Optional[float]): Максимальная зарплата в базовой валюте.
+        sort_key (float): Предвычисленный ключ сортировки по средней зарплате в базовой валюте
+                          (0, если зарплата не указана). Пересчитывается при присваивании
+                          salary_from, salary_to или salary_rate.
+        fingerprint (Optional[str]): Вычисленный отпечаток содержимого вакансии (см. get_fingerprint).
     """
     name: str
     desc: str
-    salary_from: Optional[int] = field(default=None, compare=False)
-    salary_to: Optional[int] = field(default=None, compare=False)
+    salary_from: Optional[int] = _SalaryField(None)
+    salary_to: Optional[int] = _SalaryField(None)
     currency: str = field(default="RUB", compare=False)
     url: str = field(default="", compare=False)
     requirement: str = field(default='Информация отсутствует', compare=False)
+    id: Optional[str] = field(default=None, repr=False, compare=False)
+    employer: Optional[str] = field(default=None, repr=False, compare=False)
+    published_at: Optional[str] = field(default=None, repr=False, compare=False)
+    experience: Optional[str] = field(default=None, repr=False, compare=False)
+    schedule: Optional[str] = field(default=None, repr=False, compare=False)
+    alternate_url: Optional[str] = field(default=None, repr=False, compare=False)
+    # Не поле dataclass (без аннотации типа): задается в __post_init__
+    salary_rate = _SalaryField(1.0)
+    norm_salary_from: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    norm_salary_to: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # Признак завершения инициализации (не поле dataclass: без аннотации типа)
+    _ready = False
+    sort_key: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Значения полей и вычисленный по ним отпечаток (не поле dataclass: без аннотации типа)
+    __fingerprint = None
 
     def __post_init__(self):
         """
         Выполняет валидацию данных после инициализации экземпляра.
         """
-        if self.salary_from is not None and self.salary_from < 0:
-            raise ValueError("salary_from не может быть отрицательным.")
-        if self.salary_to is not None and self.salary_to < 0:
-            raise ValueError("salary_to не может быть отрицательным.")
-        if self.salary_from is not None and self.salary_to is not None:
-            if self.salary_from > self.salary_to:
-                raise ValueError("salary_from не может быть больше salary_to.")
-        if self.url and not (self.url.startswith("http://") or self.url.startswith("https://")):
-            raise ValueError("url должен начинаться с 'http://' или 'https://'.")
-        if not self.name:
-            raise ValueError("Название вакансии не может быть пустым.")
+        validate_vacancy_fields(self.name, self.salary_from, self.salary_to, self.url)
         if not self.desc:
             self.desc = "Описание отсутствует"
+        self.salary_rate = 1.0
+        self.refresh_sort_key()
+        self._ready = True
 
     def get_salary_range(self) -> str:
         """
@@ -65,7 +177,7 @@ class Vacancy:
         Returns:
             dict: Словарь с данными вакансии.
         """
-        return {
+        data = {
             "name": self.name,
             "desc": self.desc,
             "salary_from": self.salary_from,
@@ -74,6 +186,17 @@ class Vacancy:
             "url": self.url,
             "requirement": self.requirement
         }
+        # Дополнительные поля сохраняются, только если они известны
+        for name in OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        data["fingerprint"] = self.get_fingerprint()
+        # Нормализованная зарплата сохраняется, только если она отличается от исходной
+        if self.norm_salary_from != self.salary_from or self.norm_salary_to != self.salary_to:
+            data["norm_salary_from"] = self.norm_salary_from
+            data["norm_salary_to"] = self.norm_salary_to
+        return data
 
     def average_salary(self) -> Optional[float]:
         """
@@ -82,35 +205,273 @@ class Vacancy:
         Returns:
             Optional[float]: Среднее значение зарплаты или None, если зарплата не указана.
         """
-        if self.salary_from is not None and self.salary_to is not None:
-            return (self.salary_from + self.salary_to) / 2
-        elif self.salary_from is not None:
-            return float(self.salary_from)
-        elif self.salary_to is not None:
-            return float(self.salary_to)
+        return average_of(self.salary_from, self.salary_to)
+
+    def __fingerprint_values(self) -> tuple:
+        """
+        Возвращает идентификатор и значения полей FINGERPRINT_FIELDS.
+
+        Returns:
+            tuple: Значения, по которым вычисляется отпечаток.
+        """
+        return (self.id,) + tuple(getattr(self, name) for name in FINGERPRINT_FIELDS)
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        """
+        Вычисленный отпечаток или None, если он не вычислялся или поля содержимого с тех пор
+        изменились.
+        """
+        cached = self.__fingerprint
+        if cached is not None and cached[0] == self.__fingerprint_values():
+            return cached[1]
         return None
 
+    @fingerprint.setter
+    def fingerprint(self, value: Optional[str]) -> None:
+        # Присваивание None сбрасывает вычисленный отпечаток
+        self.__fingerprint = None if value is None else (self.__fingerprint_values(), value)
+
+    def get_fingerprint(self) -> str:
+        """
+        Возвращает отпечаток содержимого вакансии: идентификатор и хэш нормализованных полей.
+
+        Отпечаток вычисляется при первом обращении и сохраняется вместе со значениями полей,
+        по которым он вычислен; после изменения любого из этих полей он вычисляется заново.
+        Он совпадает с отпечатком записи to_dict() (см. fingerprint.record_fingerprint),
+        поэтому по нему выполняется удаление дубликатов при сохранении.
+
+        Returns:
+            str: Отпечаток вакансии.
+        """
+        values = self.__fingerprint_values()
+        cached = self.__fingerprint
+        if cached is None or cached[0] != values:
+            cached = self.__fingerprint = (values, content_fingerprint(values[0], values[1:]))
+        return cached[1]
+
+    def refresh_sort_key(self) -> None:
+        """
+        Пересчитывает нормализованную зарплату и ключ сортировки sort_key. Вызывается при
+        инициализации и при присваивании salary_from, salary_to или salary_rate.
+
+        Для сортировки больших списков используйте
+        sorted(vacancies, key=operator.attrgetter('sort_key')) вместо сравнения объектов.
+        """
+        rate = self.salary_rate
+        if rate == 1.0:
+            # Зарплата указана в базовой валюте или курс неизвестен
+            self.norm_salary_from = self.salary_from
+            self.norm_salary_to = self.salary_to
+        else:
+            self.norm_salary_from = self.salary_from * rate if self.salary_from is not None else None
+            self.norm_salary_to = self.salary_to * rate if self.salary_to is not None else None
+        self.sort_key = average_of(self.norm_salary_from, self.norm_salary_to) or 0
+
     def __eq__(self, other):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.average_salary() == other.average_salary()
+        return self.sort_key == other.sort_key
 
     def __lt__(self, other):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return (self.average_salary() or 0) < (other.average_salary() or 0)
+        return self.sort_key < other.sort_key
 
     def __le__(self, other):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self < other or self == other
+        return self.sort_key <= other.sort_key
 
     def __gt__(self, other):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return not self <= other
+        return self.sort_key > other.sort_key
 
     def __ge__(self, other):
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return not self < other
+        return self.sort_key >= other.sort_key
+
+
+# Извлечение полей Vacancy из исходного словаря API HH.ru, скомпилированное по схеме:
+# создание Vacancy сразу из словаря и извлечение каждого поля отдельно (для LazyVacancy)
+vacancy_from_raw: Callable[[Dict[str, Any]], Vacancy] = compile_extractor(VACANCY_SCHEMA, factory=Vacancy)
+RAW_FIELD_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = compile_fields(VACANCY_SCHEMA)
+
+
+class _LazyField:
+    """
+    Поле LazyVacancy, вычисляемое при первом обращении.
+
+    Значение сохраняется в __dict__ экземпляра под тем же именем и при следующих обращениях
+    читается напрямую, без вызова дескриптора.
+    """
+
+    def __init__(self, compute: Callable[[Any], Any], from_raw: bool = False):
+        """
+        Инициализирует ленивое поле.
+
+        Args:
+            compute (Callable[[Any], Any]): Функция вычисления значения поля.
+            from_raw (bool, optional): Функция принимает исходный словарь, а не представление.
+                                       По умолчанию False.
+        """
+        self.__compute = compute
+        self.__from_raw = from_raw
+        self.__name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = name
+
+    def __get__(self, instance: Optional['LazyVacancy'], owner: Optional[type] = None) -> Any:
+        """
+        Вычисляет значение поля и сохраняет его в экземпляре.
+        """
+        if instance is None:
+            return self
+        value = self.__compute(instance.raw if self.__from_raw else instance)
+        instance.__dict__[self.__name] = value
+        return value
+
+
+def _raw_field(name: str) -> _LazyField:
+    """
+    Создает ленивое поле, извлекаемое из исходного словаря.
+
+    Args:
+        name (str): Имя поля Vacancy.
+
+    Returns:
+        _LazyField: Ленивое поле.
+    """
+    return _LazyField(RAW_FIELD_EXTRACTORS[name], from_raw=True)
+
+
+def _norm_salary(field_name: str) -> _LazyField:
+    """
+    Создает ленивое поле зарплаты в базовой валюте.
+
+    Args:
+        field_name (str): Поле исходной зарплаты: 'salary_from' или 'salary_to'.
+
+    Returns:
+        _LazyField: Ленивое поле.
+    """
+    def compute(view: 'LazyVacancy') -> Optional[float]:
+        value = getattr(view, field_name)
+        if not isinstance(value, (int, float)):
+            # Некорректное значение отсеивается фильтрами, а затем проверкой is_valid
+            return None
+        if view.salary_rate == 1.0:
+            return value
+        return value * view.salary_rate
+    return _LazyField(compute)
+
+
+class LazyVacancy:
+    """
+    Ленивое представление вакансии поверх исходного словаря API HH.ru.
+
+    Поля извлекаются из словаря при первом обращении, поэтому фильтрация и сортировка
+    читают только нужные поля. Полноценный проверенный экземпляр Vacancy создается
+    методом materialize() только для возвращаемых вакансий.
+
+    Attributes:
+        raw (Dict[str, Any]): Исходный словарь вакансии.
+        salary_rate (float): Множитель пересчета зарплаты в базовую валюту.
+        error (Optional[Exception]): Ошибка проверки, если вакансия некорректна.
+    """
+
+    name = _raw_field('name')
+    desc = _raw_field('desc')
+    salary_from = _raw_field('salary_from')
+    salary_to = _raw_field('salary_to')
+    currency = _raw_field('currency')
+    url = _raw_field('url')
+    requirement = _raw_field('requirement')
+    id = _raw_field('id')
+    employer = _raw_field('employer')
+    published_at = _raw_field('published_at')
+    experience = _raw_field('experience')
+    schedule = _raw_field('schedule')
+    alternate_url = _raw_field('alternate_url')
+    norm_salary_from = _norm_salary('salary_from')
+    norm_salary_to = _norm_salary('salary_to')
+    sort_key = _LazyField(lambda view: average_of(view.norm_salary_from, view.norm_salary_to) or 0)
+
+    def __init__(self, raw: Dict[str, Any]):
+        """
+        Инициализирует экземпляр LazyVacancy.
+
+        Args:
+            raw (Dict[str, Any]): Исходный словарь вакансии.
+        """
+        self.raw = raw
+        self.__salary_rate = 1.0
+        self.error: Optional[Exception] = None
+
+    def __repr__(self) -> str:
+        return f'LazyVacancy({self.raw!r})'
+
+    @property
+    def salary_rate(self) -> float:
+        return self.__salary_rate
+
+    @salary_rate.setter
+    def salary_rate(self, rate: float) -> None:
+        # Вычисленные нормализованная зарплата и ключ сортировки пересчитываются при обращении
+        self.__salary_rate = rate
+        self.refresh_sort_key()
+
+    def average_salary(self) -> Optional[float]:
+        """
+        Вычисляет среднее значение зарплаты.
+
+        Returns:
+            Optional[float]: Среднее значение зарплаты или None, если зарплата не указана.
+        """
+        return average_of(self.salary_from, self.salary_to)
+
+    def refresh_sort_key(self) -> None:
+        """
+        Сбрасывает вычисленные нормализованную зарплату и ключ сортировки; они будут
+        пересчитаны при следующем обращении. Вызывается при присваивании salary_rate.
+        """
+        for name in ('norm_salary_from', 'norm_salary_to', 'sort_key'):
+            self.__dict__.pop(name, None)
+
+    def is_valid(self) -> bool:
+        """
+        Проверяет поля вакансии без создания экземпляра Vacancy.
+
+        Returns:
+            bool: True, если из представления можно создать Vacancy. Иначе ошибка
+                  сохраняется в атрибуте error.
+        """
+        raw = self.raw
+        extract = RAW_FIELD_EXTRACTORS
+        try:
+            # Поля читаются из словаря напрямую: проверка выполняется для каждой вакансии,
+            # прошедшей фильтры, а не только для возвращаемых
+            validate_vacancy_fields(extract['name'](raw), extract['salary_from'](raw),
+                                    extract['salary_to'](raw), extract['url'](raw))
+            return True
+        except (ValueError, TypeError, AttributeError) as e:
+            self.error = e
+            return False
+
+    def materialize(self) -> Vacancy:
+        """
+        Создает проверенный экземпляр Vacancy из представления.
+
+        Returns:
+            Vacancy: Экземпляр вакансии с тем же множителем пересчета зарплаты.
+
+        Raises:
+            ValueError: Если поля вакансии некорректны.
+        """
+        vacancy = Vacancy(**{spec.name: getattr(self, spec.name) for spec in VACANCY_SCHEMA})
+        if self.salary_rate != 1.0:
+            vacancy.salary_rate = self.salary_rate
+        return vacancy
@@ -0,0 +1,118 @@
+import unittest
+import tempfile
+import os
+from unittest import mock
+from src.columnar_store import ColumnarSaver
+from src.jsonl_saver import JSONLSaver
+from src.vacancy import Vacancy
+
+
+class TestColumnarSaver(unittest.TestCase):
+    def setUp(self):
+        # Создаем временную директорию для хранилища
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.columns')
+        self.saver = ColumnarSaver(path=self.path)
+        python = Vacancy("Python Developer", "Москва", 100000, 150000, "RUB", "https://hh.ru/vacancy/1", "Django",
+                         id="1", employer="Яндекс", published_at="2024-05-01T10:00:00+0300")
+        java = Vacancy("Java Developer", "Москва", None, 2000, "USD", "https://hh.ru/vacancy/2", "Spring", id="2")
+        senior = Vacancy("Senior Python Developer", "Казань", 200000, None, "RUB", "https://hh.ru/vacancy/3",
+                         "Python", id="3", experience="От 3 до 6 лет", schedule="Удаленная работа")
+        self.vacancies = [python.to_dict(), java.to_dict(), senior.to_dict()]
+        # Зарплата в долларах хранится вместе с нормализованной
+        self.vacancies[1].update(norm_salary_from=None, norm_salary_to=180000.5)
+
+    def tearDown(self):
+        self.saver.close()
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        # Записи Vacancy.to_dict восстанавливаются без изменений, дубликаты пропускаются
+        self.saver.save({"items": self.vacancies[:2]})
+        self.saver.save({"items": self.vacancies})
+        self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies)
+        with ColumnarSaver(path=self.path) as saver:
+            self.assertEqual(saver.get_vacancies(), self.vacancies)
+            self.assertEqual(len(saver), 3)
+
+    def test_extra_fields(self):
+        # Поля без столбцов и значения неподходящего типа сохраняются в записи
+        record = {"id": 7, "name": "Аналитик", "salary_from": 1.5, "tags": ["sql", "python"]}
+        self.saver.save({"items": [record]})
+        restored = list(self.saver.iter_vacancies())[0]
+        self.assertEqual(restored["id"], 7)
+        self.assertEqual(restored["salary_from"], 1.5)
+        self.assertEqual(restored["tags"], ["sql", "python"])
+        self.assertIsNone(restored["url"])
+
+    def test_get_vacancies_matches_jsonl(self):
+        # Фильтры по столбцам дают тот же результат, что и построчная фильтрация
+        self.saver.save({"items": self.vacancies})
+        jsonl = JSONLSaver(path=os.path.join(self.temp_dir.name, 'vacancies.jsonl'))
+        jsonl.save({"items": self.vacancies})
+        criteria_list = [
+            {"name": "python"},
+            {"name": "PYTHON", "salary_from": 150000},
+            {"salary_to": 170000},
+            {"salary_to": 200000},
+            {"name": "нет такой"},
+            {"order_by": [("salary_to", "desc")], "top_n": 2},
+            {"salary_from": 0, "order_by": [("avg_salary", "desc")]},
+        ]
+        with mock.patch('builtins.print'):
+            for criteria in criteria_list:
+                self.assertEqual(self.saver.get_vacancies(criteria), jsonl.get_vacancies(criteria), criteria)
+
+    def test_scan(self):
+        # Чтение отдельных столбцов без сборки записей
+        self.saver.save({"items": self.vacancies})
+        columns = self.saver.scan(["name", "norm_salary_to", "id"])
+        self.assertEqual(columns["name"], ["Python Developer", "Java Developer", "Senior Python Developer"])
+        self.assertEqual(columns["norm_salary_to"], [150000.0, 180000.5, None])
+        self.assertEqual(columns["id"], ["1", "2", "3"])
+        with self.assertRaises(KeyError):
+            self.saver.scan(["unknown"])
+
+    def test_interrupted_write(self):
+        # Данные, дописанные без фиксации манифеста, не видны и обрезаются при сохранении
+        self.saver.save({"items": self.vacancies[:1]})
+        self.saver.close()
+        for name in ('name.i32', 'salary_from.f64', 'id.heap', 'id.end', 'flags.u8'):
+            with open(os.path.join(self.path, name), 'ab') as file:
+                file.write(b'\xff' * 5)
+        saver = ColumnarSaver(path=self.path)
+        self.assertEqual(list(saver.iter_vacancies()), self.vacancies[:1])
+        saver.save({"items": self.vacancies[1:]})
+        saver.close()
+        self.assertEqual(list(ColumnarSaver(path=self.path).iter_vacancies()), self.vacancies)
+
+    def test_replace_by_id(self):
+        # Измененная вакансия с сохраненным идентификатором заменяет прежнюю на ее месте
+        self.saver.save({"items": self.vacancies[:2]})
+        changed = dict(self.vacancies[0], salary_from=120000)
+        first = dict(self.vacancies[2], requirement="Go")
+        self.saver.save({"items": [first, changed, self.vacancies[2]]})
+        self.assertEqual(list(self.saver.iter_vacancies()), [changed, self.vacancies[1], self.vacancies[2]])
+        with ColumnarSaver(path=self.path) as saver:
+            saver.save({"items": [self.vacancies[0], first]})
+            self.assertEqual(list(saver.iter_vacancies()), [self.vacancies[0], self.vacancies[1], first])
+            saver.save({"items": [first, self.vacancies[0]]})
+            self.assertEqual(len(saver), 3)
+
+    def test_delete(self):
+        # Удаление по идентификатору перестраивает хранилище, удаление всех вакансий очищает его
+        self.saver.save({"items": self.vacancies})
+        with mock.patch('builtins.print'):
+            self.saver.delete("2")
+            self.assertEqual(list(self.saver.iter_vacancies()), [self.vacancies[0], self.vacancies[2]])
+            self.assertFalse(os.path.exists(self.path + '.old'))
+            self.saver.save({"items": self.vacancies})
+            self.assertEqual(len(self.saver), 3)
+            self.saver.delete()
+            self.assertEqual(list(self.saver.iter_vacancies()), [])
+            self.saver.save({"items": self.vacancies[:1]})
+            self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
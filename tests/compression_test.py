@@ -0,0 +1,80 @@
+import unittest
+import tempfile
+import os
+import gzip
+from unittest import mock
+from src import compression
+from src.compression import CodecStats, available_codecs, codec_for_path, compare_codecs, open_text
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.text = '{"items": [' + ', '.join(f'{{"name": "Вакансия {i}"}}' for i in range(2000)) + ']}'
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_codec_for_path(self):
+        # Кодек определяется по расширению файла
+        self.assertEqual(codec_for_path('data/vacancies.json.gz'), 'gzip')
+        self.assertEqual(codec_for_path('data/vacancies.json.XZ'), 'lzma')
+        self.assertEqual(codec_for_path('data/vacancies.json.zst'), 'zstd')
+        self.assertIsNone(codec_for_path('data/vacancies.json'))
+
+    def test_open_text_round_trip(self):
+        # Текст восстанавливается после сжатия каждым доступным кодеком
+        for codec in available_codecs():
+            path = os.path.join(self.temp_dir.name, f'data.{codec}')
+            with open_text(path, 'w', codec=codec) as file:
+                file.write(self.text)
+            with open_text(path, codec=codec) as file:
+                self.assertEqual(file.read(), self.text)
+            self.assertLess(os.path.getsize(path), len(self.text.encode('utf-8')))
+
+    def test_open_text_errors(self):
+        # Неизвестный режим, неизвестный кодек и недоступный zstd
+        path = os.path.join(self.temp_dir.name, 'data.gz')
+        with self.assertRaises(ValueError):
+            open_text(path, 'a')
+        with self.assertRaises(ValueError):
+            open_text(path, 'w', codec='brotli')
+        with mock.patch.object(compression, 'zstandard', None):
+            self.assertNotIn('zstd', available_codecs())
+            with self.assertRaises(ValueError):
+                open_text(os.path.join(self.temp_dir.name, 'data.zst'), 'w')
+
+    def test_compare_codecs(self):
+        # Степень сжатия и скорость измеряются для каждого кодека
+        path = os.path.join(self.temp_dir.name, 'data.json')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.text)
+        with mock.patch('builtins.print') as mock_print:
+            results = compare_codecs(path, codecs=['gzip', 'lzma'])
+        self.assertEqual([stats.codec for stats in results], ['gzip', 'lzma'])
+        self.assertEqual(mock_print.call_count, 2)
+        for stats in results:
+            self.assertEqual(stats.raw_size, len(self.text.encode('utf-8')))
+            self.assertGreater(stats.ratio, 1)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['data.json'])
+
+    def test_codec_stats(self):
+        # Производные показатели и пустые измерения
+        stats = CodecStats('gzip', 4_000_000, 1_000_000, 2.0, 0.5)
+        self.assertEqual(stats.ratio, 4.0)
+        self.assertEqual(stats.compress_speed, 2.0)
+        self.assertEqual(stats.decompress_speed, 8.0)
+        self.assertEqual(CodecStats('gzip', 0, 0, 0.0, 0.0).ratio, 0.0)
+        self.assertIn('gzip', str(stats))
+
+    def test_gzip_compatible(self):
+        # Файл gzip читается стандартными средствами
+        path = os.path.join(self.temp_dir.name, 'data.json.gz')
+        with open_text(path, 'w') as file:
+            file.write(self.text)
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            self.assertEqual(file.read(), self.text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import tempfile
+import os
+from unittest import mock
+from src.currency import CurrencyConverter
+from src.parser_vacancy import ParserVacancy
+from src.vacancy import Vacancy
+
+
+class TestCurrencyConverter(unittest.TestCase):
+    def setUp(self):
+        # Курсы в формате справочника hh.ru: единиц валюты за 1 рубль
+        self.rates = {"RUR": 1.0, "USD": 0.01, "KZT": 5.0}
+        self.converter = CurrencyConverter(rates=self.rates)
+
+    def test_factor_with_aliases(self):
+        """
+        Тестирует множители пересчета, включая синоним RUB для рубля и неизвестную валюту.
+        """
+        self.assertEqual(self.converter.factor("USD"), 100.0)
+        self.assertEqual(self.converter.factor("RUB"), 1.0)
+        self.assertIsNone(self.converter.factor("XXX"))
+
+    def test_normalize_vacancies(self):
+        """
+        Тестирует пересчет зарплат в базовую валюту и обновление ключа сортировки.
+        """
+        usd = Vacancy(name="Remote Developer", desc="Remote", salary_from=2000, salary_to=3000, currency="USD")
+        kzt = Vacancy(name="Almaty Developer", desc="Almaty", salary_to=500000, currency="KZT")
+        unknown = Vacancy(name="Other Developer", desc="Other", salary_from=1000, currency="XXX")
+        result = list(self.converter.normalize([usd, kzt, unknown]))
+        self.assertEqual(result, [usd, kzt, unknown])
+        self.assertEqual((usd.norm_salary_from, usd.norm_salary_to), (200000, 300000))
+        self.assertEqual(usd.sort_key, 250000)
+        self.assertIsNone(kzt.norm_salary_from)
+        self.assertEqual(kzt.norm_salary_to, 100000)
+        self.assertEqual(unknown.norm_salary_from, 1000)
+        # Исходные значения не меняются
+        self.assertEqual(usd.salary_from, 2000)
+
+    def test_to_dict_contains_normalized_salary(self):
+        """
+        Тестирует, что нормализованная зарплата сохраняется в словаре только при пересчете.
+        """
+        usd = Vacancy(name="Remote Developer", desc="Remote", salary_from=2000, currency="USD")
+        rub = Vacancy(name="Developer", desc="Moscow", salary_from=2000)
+        list(self.converter.normalize([usd, rub]))
+        self.assertEqual(usd.to_dict()["norm_salary_from"], 200000)
+        self.assertNotIn("norm_salary_from", rub.to_dict())
+
+    def test_parser_sorts_by_normalized_salary(self):
+        """
+        Тестирует, что фильтры и сортировки парсера используют зарплату в базовой валюте.
+        """
+        data = [
+            {"name": "Rub Developer", "salary": {"from": 150000, "to": None, "currency": "RUR"},
+             "url": "https://hh.ru/vacancy/1"},
+            {"name": "Usd Developer", "salary": {"from": 3000, "to": None, "currency": "USD"},
+             "url": "https://hh.ru/vacancy/2"},
+        ]
+        parser = ParserVacancy(data=data, converter=self.converter)
+        result = parser.parse_vacancies(params={"salary_from": 100000, "sorted_salary_from": True})
+        self.assertEqual([vac.name for vac in result], ["Usd Developer", "Rub Developer"])
+
+    def test_save_and_load(self):
+        """
+        Тестирует сохранение и загрузку таблицы курсов.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'currency_rates.json')
+            self.converter.save(path)
+            loaded = CurrencyConverter.load(path)
+            self.assertEqual(loaded.rates, self.rates)
+            self.assertEqual(CurrencyConverter.load(os.path.join(temp_dir, 'missing.json')).rates, {})
+
+    def test_cached_uses_fresh_cache(self):
+        """
+        Тестирует, что актуальный кэш курсов используется без запроса к API.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'currency_rates.json')
+            fetch = mock.Mock(return_value=self.rates)
+            CurrencyConverter.cached(path, fetch)
+            converter = CurrencyConverter.cached(path, fetch)
+            fetch.assert_called_once()
+            self.assertEqual(converter.rates, self.rates)
+
+    def test_cached_falls_back_to_stale_cache(self):
+        """
+        Тестирует использование устаревшего кэша при недоступности API.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'currency_rates.json')
+            self.converter.save(path)
+            fetch = mock.Mock(side_effect=Exception("API недоступно"))
+            converter = CurrencyConverter.cached(path, fetch, max_age=0)
+            self.assertEqual(converter.rates, self.rates)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+import os
+from unittest import mock
+from src.durability import WriteAheadLog, atomic_replace
+
+
+class TestWriteAheadLog(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.wal')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_group_commit(self):
+        # Записи дописываются сразу, а синхронизируются группой: один fsync на группу
+        wal = WriteAheadLog(self.path, group_size=3)
+        with mock.patch('os.fsync') as fsync:
+            wal.append({"put": [[0, "a"]]})
+            wal.append({"put": [[1, "b"]]})
+            self.assertEqual(fsync.call_count, 0)
+            self.assertEqual(len(WriteAheadLog(self.path).replay()), 2)
+            wal.append({"put": [[2, "c"]]})
+            self.assertEqual(fsync.call_count, 1)
+            wal.commit()
+            self.assertEqual(fsync.call_count, 1)
+            wal.append({"put": [[3, "d"]]})
+            wal.commit()
+            self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(len(WriteAheadLog(self.path).replay()), 4)
+
+    def test_fsync_policies(self):
+        # 'always' фиксирует каждую запись, 'never' не вызывает fsync
+        with mock.patch('os.fsync') as fsync:
+            wal = WriteAheadLog(self.path, fsync='always', group_size=10)
+            wal.append(1)
+            wal.append(2)
+            self.assertEqual(fsync.call_count, 2)
+            wal = WriteAheadLog(self.path, fsync='never', group_size=1)
+            wal.append(3)
+            self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(wal.replay(), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            WriteAheadLog(self.path, fsync='sometimes')
+
+    def test_replay_skips_torn_lines(self):
+        # Поврежденная и оборванная строки пропускаются, следующая запись начинается с новой строки
+        wal = WriteAheadLog(self.path, fsync='never', group_size=1)
+        wal.append({"put": [[0, "a"]]})
+        with open(self.path, 'ab') as file:
+            file.write(b'00000000 {"put": []}\n')
+            file.write(b'1234abcd {"put"')
+        self.assertEqual(wal.replay(), [{"put": [[0, "a"]]}])
+        wal.append({"put": [[1, "b"]]})
+        self.assertEqual(wal.replay(), [{"put": [[0, "a"]]}, {"put": [[1, "b"]]}])
+        wal.reset()
+        self.assertEqual(wal.replay(), [])
+        self.assertEqual(wal.size, 0)
+
+    def test_atomic_replace(self):
+        # Файл заменяется целиком, временный файл исчезает
+        path = os.path.join(self.temp_dir.name, 'vacancies.json')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('old')
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            file.write('new')
+        atomic_replace(path + '.tmp', path)
+        with open(path, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), 'new')
+        self.assertFalse(os.path.exists(path + '.tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
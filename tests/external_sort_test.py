@@ -0,0 +1,60 @@
+import os
+import random
+import tempfile
+import unittest
+from src.external_sort import external_sort
+
+
+class TestExternalSort(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        self.records = [{"id": number, "salary": rng.randint(0, 30)} for number in range(500)]
+        self.key = lambda record: record["salary"]
+
+    def test_matches_sorted_and_is_stable(self):
+        """
+        Тестирует совпадение с устойчивой сортировкой в памяти при разных размерах серий.
+        """
+        expected = sorted(self.records, key=self.key)
+        for run_bytes, fan_in in ((1, 2), (160, 3), (1200, 64), (100000, 2)):
+            result = list(external_sort(iter(self.records), key=self.key, run_bytes=run_bytes, fan_in=fan_in))
+            self.assertEqual(result, expected, (run_bytes, fan_in))
+
+    def test_temporary_files_removed(self):
+        """
+        Тестирует удаление временных серий после чтения и при прерывании чтения.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            list(external_sort(self.records, key=self.key, run_bytes=250, tmp_dir=tmp_dir))
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+            stream = external_sort(self.records, key=self.key, run_bytes=250, tmp_dir=tmp_dir)
+            self.assertEqual(next(stream), sorted(self.records, key=self.key)[0])
+            self.assertEqual(len(os.listdir(tmp_dir)), 1)
+            stream.close()
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_runs_limited_by_size(self):
+        """
+        Тестирует, что серии ограничены объемом: крупные записи дают серии из меньшего числа записей.
+        """
+        large = [dict(record, desc="x" * 100) for record in self.records]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for records, count in ((self.records, 10), (large, 50)):
+                stream = external_sort(records, key=self.key, run_bytes=1200, fan_in=1000, tmp_dir=tmp_dir)
+                next(stream)
+                self.assertEqual(len(os.listdir(os.path.join(tmp_dir, os.listdir(tmp_dir)[0]))), count)
+                stream.close()
+
+    def test_invalid_parameters(self):
+        """
+        Тестирует ошибку при некорректном размере серии или слияния.
+        """
+        with self.assertRaises(ValueError):
+            list(external_sort(self.records, run_bytes=0))
+        with self.assertRaises(ValueError):
+            list(external_sort(self.records, fan_in=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
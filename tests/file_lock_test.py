@@ -0,0 +1,46 @@
+import unittest
+import tempfile
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from src.file_lock import FileLock
+
+
+def acquire_in_process(path):
+    """
+    Захватывает блокировку из отдельного процесса и возвращает время захвата.
+    """
+    with FileLock(path):
+        return time.monotonic()
+
+
+class TestFileLock(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.jsonl.lock')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_reentrant(self):
+        # Повторный захват в том же экземпляре не блокирует, после освобождения замок свободен
+        lock = FileLock(self.path)
+        with lock:
+            with lock:
+                self.assertTrue(os.path.exists(self.path))
+        with FileLock(self.path):
+            pass
+
+    def test_excludes_other_process(self):
+        # Другой процесс захватывает блокировку только после освобождения
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            executor.submit(time.monotonic).result()
+            with FileLock(self.path):
+                future = executor.submit(acquire_in_process, self.path)
+                time.sleep(0.2)
+                released = time.monotonic()
+            self.assertGreaterEqual(future.result(), released)
+
+
+if __name__ == '__main__':
+    unittest.main()
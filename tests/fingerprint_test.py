@@ -0,0 +1,117 @@
+import unittest
+import tempfile
+import os
+from src.fingerprint import FingerprintIndex, content_fingerprint, record_fingerprint, stamp_fingerprint
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_content_fingerprint_normalized(self):
+        """
+        Тестирует нормализацию значений: регистр, пробелы и тип числа не влияют на отпечаток.
+        """
+        self.assertEqual(content_fingerprint("1", ["Python  Developer", 100000, None]),
+                         content_fingerprint("1", ["python developer", 100000.0, None]))
+        self.assertNotEqual(content_fingerprint("1", ["Python Developer", 100000]),
+                            content_fingerprint("2", ["Python Developer", 100000]))
+        self.assertNotEqual(content_fingerprint(None, ["a", "b"]), content_fingerprint(None, ["a b", ""]))
+
+    def test_record_fingerprint(self):
+        """
+        Тестирует отпечаток записи: он вычисляется по содержимому, сохраненный отпечаток не используется.
+        """
+        record = {"id": "7", "name": "Python Developer", "url": "https://hh.ru/vacancy/7"}
+        fingerprint = record_fingerprint(record)
+        self.assertTrue(fingerprint.startswith("7:"))
+        self.assertEqual(record_fingerprint(dict(record, requirement=None)), fingerprint)
+        self.assertEqual(record_fingerprint(dict(record, fingerprint="saved")), fingerprint)
+        self.assertNotEqual(record_fingerprint(dict(record, fingerprint=fingerprint, name="Java")), fingerprint)
+        self.assertEqual(stamp_fingerprint(dict(record, fingerprint="saved"), fingerprint)["fingerprint"], fingerprint)
+        self.assertNotIn("fingerprint", stamp_fingerprint(record, fingerprint))
+
+
+class TestFingerprintIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.fingerprints')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_add(self):
+        """
+        Тестирует добавление отпечатков и обнаружение повторов.
+        """
+        index = FingerprintIndex(["a"])
+        self.assertFalse(index.add("a"))
+        self.assertTrue(index.add("b"))
+        self.assertFalse(index.add("b"))
+        self.assertIn("b", index)
+        self.assertEqual(len(index), 2)
+
+    def test_save_appends_new(self):
+        """
+        Тестирует сохранение: загруженный индекс дописывает в файл только новые отпечатки.
+        """
+        index = FingerprintIndex(["a", "b"])
+        index.save(self.path)
+        loaded = FingerprintIndex.load(self.path)
+        self.assertEqual(len(loaded), 2)
+        loaded.add("c")
+        loaded.save(self.path)
+        loaded.save(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            lines = file.read().split()
+        self.assertEqual(sorted(lines), ["a", "b", "c"])
+        self.assertEqual(len(FingerprintIndex.load(os.path.join(self.temp_dir.name, 'missing'))), 0)
+
+    def test_discard(self):
+        """
+        Тестирует удаление отпечатков: удаление дописывается в файл, а когда строк удаления
+        больше, чем отпечатков, файл записывается целиком.
+        """
+        index = FingerprintIndex(["a", "b", "c"])
+        index.save(self.path)
+        loaded = FingerprintIndex.load(self.path)
+        loaded.discard("a")
+        loaded.discard("missing")
+        self.assertNotIn("a", loaded)
+        self.assertTrue(loaded.add("a2"))
+        loaded.save(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read().split()[3:], ["-a", "a2"])
+        loaded = FingerprintIndex.load(self.path)
+        self.assertEqual((len(loaded), "a" in loaded, "a2" in loaded), (3, False, True))
+        for fingerprint in ("b", "c", "a2"):
+            loaded.discard(fingerprint)
+        loaded.save(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), '')
+
+
+    def test_version(self):
+        """
+        Тестирует версию данных: она хранится в первой строке, при ее изменении файл
+        записывается целиком, неполная последняя строка пропускается при загрузке.
+        """
+        index = FingerprintIndex(["a"])
+        index.version = [1, [10, 20]]
+        index.save(self.path)
+        loaded = FingerprintIndex.load(self.path)
+        self.assertEqual(loaded.version, [1, [10, 20]])
+        loaded.add("b")
+        loaded.save(self.path)
+        loaded.version = [2, [30, 40]]
+        loaded.add("c")
+        loaded.save(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            lines = file.read().split()
+        self.assertEqual((lines[0], sorted(lines[1:])), ('#[2,[30,40]]', ["a", "b", "c"]))
+        self.assertEqual(os.listdir(self.temp_dir.name), ['vacancies.fingerprints'])
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write("d")
+        loaded = FingerprintIndex.load(self.path)
+        self.assertEqual((len(loaded), "d" in loaded, loaded.version), (3, False, [2, [30, 40]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from src.interning import intern_record, intern_records, intern_value
+from src.parser_vacancy import ParserVacancy
+
+
+def _copy(text):
+    """
+    Возвращает равную, но отдельную копию строки (как после json.load).
+    """
+    return json.loads(json.dumps(text))
+
+
+class TestInterning(unittest.TestCase):
+    def test_intern_value(self):
+        """
+        Тестирует, что равные строки сводятся к одному экземпляру, а не строки не меняются.
+        """
+        first, second = _copy('Санкт-Петербург'), _copy('Санкт-Петербург')
+        self.assertIsNot(first, second)
+        self.assertIs(intern_value(first), intern_value(second))
+        self.assertIsNone(intern_value(None))
+        self.assertEqual(intern_value(100000), 100000)
+
+    def test_intern_records(self):
+        """
+        Тестирует интернирование повторяющихся полей записей на месте; прочие поля не меняются.
+        """
+        records = [
+            {"name": _copy("Python Developer"), "desc": _copy("Москва"), "currency": _copy("RUR"),
+             "url": _copy("https://hh.ru/vacancy/1")},
+            {"name": _copy("Python Developer"), "desc": _copy("Москва"), "currency": _copy("RUR"),
+             "url": _copy("https://hh.ru/vacancy/1")},
+        ]
+        self.assertIs(intern_records(records), records)
+        for field in ('name', 'desc', 'currency'):
+            self.assertIs(records[0][field], records[1][field])
+        self.assertIsNot(records[0]['url'], records[1]['url'])
+
+        record = {"name": None, "salary_from": 100}
+        self.assertEqual(intern_record(record), {"name": None, "salary_from": 100})
+
+    def test_parsed_vacancies_share_strings(self):
+        """
+        Тестирует, что вакансии после парсинга ссылаются на общие экземпляры повторяющихся строк.
+        """
+        data = json.loads(json.dumps([
+            {"name": "Python Developer", "area": {"name": "Москва"},
+             "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+             "url": f"https://hh.ru/vacancy/{i}", "snippet": {"requirement": "Python"}}
+            for i in range(3)
+        ]))
+        with redirect_stdout(io.StringIO()):
+            eager = ParserVacancy(data).parse_vacancies()
+            lazy = ParserVacancy(data).parse_vacancies({"salary_from": 0})
+        for vacancies in (eager, lazy):
+            self.assertEqual(len(vacancies), 3)
+            for field in ('name', 'desc', 'currency'):
+                self.assertEqual(len({id(getattr(vac, field)) for vac in vacancies}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import random
+from src.interval_index import IntervalIndex, LEAF_BLOCK
+
+
+class TestIntervalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = IntervalIndex()
+        self.index.add('a', 100, 200)
+        self.index.add('b', 150, None)
+        self.index.add('c', None, 120)
+        self.index.add('d', 300, 400)
+
+    def test_search_overlap(self):
+        """
+        Тестирует поиск интервалов, пересекающихся с диапазоном, включая границы.
+        """
+        self.assertEqual(self.index.search(110, 160), ['c', 'a', 'b'])
+        self.assertEqual(self.index.search(200, 300), ['a', 'b', 'd'])
+        self.assertEqual(self.index.search(410, 500), ['b'])
+
+    def test_search_open_range(self):
+        """
+        Тестирует запросы с открытыми границами диапазона.
+        """
+        self.assertEqual(self.index.search(None, 90), ['c'])
+        self.assertEqual(self.index.search(350, None), ['b', 'd'])
+        self.assertEqual(self.index.search(), ['c', 'a', 'b', 'd'])
+        self.assertEqual(self.index.search(200, 100), [])
+
+    def test_add_invalid(self):
+        """
+        Тестирует пропуск интервалов без границ и ошибку для перевернутого интервала.
+        """
+        self.assertFalse(self.index.add('e', None, None))
+        self.assertEqual(len(self.index), 4)
+        with self.assertRaises(ValueError):
+            self.index.add('f', 500, 100)
+
+    def test_add_after_search(self):
+        """
+        Тестирует добавление интервалов после запроса.
+        """
+        self.assertEqual(self.index.search(500, 600), ['b'])
+        self.index.add('g', 550, 700)
+        self.assertEqual(self.index.search(500, 600), ['b', 'g'])
+
+    def test_matches_brute_force(self):
+        """
+        Тестирует совпадение результатов с полным перебором на случайных интервалах.
+        """
+        rng = random.Random(7)
+        index = IntervalIndex()
+        intervals = {}
+        for doc_id in range(LEAF_BLOCK * 10 + 3):
+            low = rng.choice([None, rng.randint(0, 1000)])
+            high = rng.choice([None, (low or 0) + rng.randint(0, 200)])
+            if index.add(doc_id, low, high):
+                intervals[doc_id] = (low, high)
+        for _ in range(50):
+            low = rng.choice([None, rng.randint(0, 1200)])
+            high = rng.choice([None, (low or 0) + rng.randint(0, 100)])
+            expected = {doc_id for doc_id, (start, stop) in intervals.items()
+                        if (high is None or start is None or start <= high)
+                        and (low is None or stop is None or stop >= low)}
+            self.assertEqual(set(index.search(low, high)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
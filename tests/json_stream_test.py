@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+import unittest
+from src.json_stream import iter_json_items
+
+
+class TestIterJsonItems(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, data, **kwargs):
+        """
+        Записывает данные в тестовый JSON файл.
+        """
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, **kwargs)
+
+    def test_items_read_in_small_chunks(self):
+        """
+        Тестирует чтение элементов фрагментами меньше размера элемента, включая числа на границе фрагментов.
+        """
+        items = [{"name": "Разработчик " * number, "salary_from": number * 1000.5, "tags": [1, None, True]}
+                 for number in range(50)] + [1, 22222, 3.5e10, -0.25, "строка", None]
+        self.write({"meta": {"total": 56}, "items": items, "tail": [1, 2]}, indent=4)
+        for chunk_size in (1, 3, 7, 1 << 16):
+            self.assertEqual(list(iter_json_items(self.path, chunk_size=chunk_size)), items)
+        other_fields = {}
+        list(iter_json_items(self.path, chunk_size=3, other_fields=other_fields))
+        self.assertEqual(other_fields, {"meta": {"total": 56}, "tail": [1, 2]})
+
+    def test_missing_and_empty_items(self):
+        """
+        Тестирует пустой массив и отсутствие ключа массива.
+        """
+        self.write({"items": []})
+        self.assertEqual(list(iter_json_items(self.path)), [])
+        self.write({"other": [1, 2]})
+        self.assertEqual(list(iter_json_items(self.path)), [])
+        self.assertEqual(list(iter_json_items(self.path, field='other')), [1, 2])
+
+    def test_invalid_json(self):
+        """
+        Тестирует ошибку для файла, не являющегося JSON объектом.
+        """
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write('[1, 2]')
+        with self.assertRaises(ValueError):
+            list(iter_json_items(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
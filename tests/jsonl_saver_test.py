@@ -0,0 +1,191 @@
+import unittest
+import tempfile
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+from src.jsonl_saver import JSONLSaver
+from src.fingerprint import record_fingerprint
+from src.records import UpsertResult
+from src.vacancy import Vacancy
+
+
+def save_in_process(path, writer, count):
+    """
+    Сохраняет вакансии по одной из отдельного процесса: собственные вакансии писателя,
+    общую вакансию без идентификатора и новую версию общей вакансии.
+    """
+    saver = JSONLSaver(path=path)
+    for number in range(count):
+        saver.save({"items": [{"id": f"{writer}-{number}", "name": f"Developer {number}"},
+                              {"id": None, "name": "Общая вакансия"},
+                              {"id": "shared", "name": f"Версия {writer}-{number}"}]})
+
+
+class TestJSONLSaver(unittest.TestCase):
+    def setUp(self):
+        # Создаем временную директорию и файл для тестов
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_file = os.path.join(self.temp_dir.name, 'vacancies.jsonl')
+        self.saver = JSONLSaver(path=self.temp_file)
+        self.vacancies = [
+            {"id": "1", "name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Django"},
+            {"id": "2", "name": "Java Developer", "desc": "Москва", "salary_from": None, "salary_to": 200000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring"},
+            {"id": "3", "name": "Senior Python Developer", "desc": "Казань", "salary_from": 200000,
+             "salary_to": None, "currency": "RUB", "url": "https://hh.ru/vacancy/3", "requirement": "Python"},
+        ]
+
+    def tearDown(self):
+        # Закрываем временную директорию
+        self.temp_dir.cleanup()
+
+    def test_save_appends_without_duplicates(self):
+        # Новые вакансии дописываются в конец файла, дубликаты пропускаются
+        self.saver.save({"items": self.vacancies[:2]})
+        JSONLSaver(path=self.temp_file).save({"items": self.vacancies})
+        with open(self.temp_file, 'r', encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.vacancies)
+        self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies)
+
+    def test_save_rebuilds_missing_fingerprints(self):
+        # Индекс отпечатков строится по файлу, если файл индекса удален
+        self.saver.save({"items": self.vacancies})
+        os.remove(self.temp_file + '.fingerprints')
+        saver = JSONLSaver(path=self.temp_file)
+        saver.save({"items": self.vacancies})
+        self.assertEqual(len(saver.get_vacancies()), 3)
+
+    def test_torn_tail(self):
+        # Оборванная последняя строка пропускается при чтении и обрезается при записи
+        self.saver.save({"items": self.vacancies[:1]})
+        with open(self.temp_file, 'a', encoding='utf-8') as file:
+            file.write('{"id": "9", "name": "Обор')
+        self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies[:1])
+        self.saver.save({"items": self.vacancies[1:]})
+        self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies)
+
+    def test_get_vacancies_with_criteria(self):
+        # Фильтрация, сортировка и топ N за один проход по файлу
+        self.saver.save({"items": self.vacancies})
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"name": "python"}), [self.vacancies[0], self.vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"salary_to": 180000}), self.vacancies[:1])
+            result = self.saver.get_vacancies({"order_by": [("salary_to", "desc")], "top_n": 2})
+            self.assertEqual(result, [self.vacancies[1], self.vacancies[0]])
+
+    def test_delete_and_compact(self):
+        # Удаление по идентификатору, удаление всех вакансий и сжатие файла
+        self.saver.save({"items": self.vacancies})
+        with mock.patch('builtins.print'):
+            self.saver.delete("2")
+            self.assertEqual(list(self.saver.iter_vacancies()), [self.vacancies[0], self.vacancies[2]])
+            # Повторные строки без идентификатора, записанные в обход индекса, удаляются сжатием
+            duplicate = dict(self.vacancies[0], id=None)
+            with open(self.temp_file, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(duplicate, ensure_ascii=False) + '\n')
+                file.write(json.dumps(duplicate, ensure_ascii=False) + '\n')
+            # Удаляются вакансия 2, ее надгробие и повтор
+            self.assertEqual(self.saver.compact(), 3)
+            self.assertEqual(list(self.saver.iter_vacancies()), [self.vacancies[0], self.vacancies[2], duplicate])
+            self.saver.delete("1")
+            self.saver.delete("3")
+            self.assertEqual(self.saver.compact(), 4)
+            self.assertEqual(list(self.saver.iter_vacancies()), [duplicate])
+            self.saver.save({"items": self.vacancies})
+            self.assertEqual(list(self.saver.iter_vacancies()), [duplicate] + self.vacancies)
+            self.saver.delete()
+            self.assertEqual(list(self.saver.iter_vacancies()), [])
+            self.saver.save({"items": self.vacancies[:1]})
+            self.assertEqual(list(self.saver.iter_vacancies()), self.vacancies[:1])
+
+    def test_primary_key(self):
+        # Поиск, замена и удаление по идентификатору без перезаписи файла
+        self.saver.save({"items": self.vacancies})
+        self.assertEqual(self.saver.get("2"), self.vacancies[1])
+        self.assertIsNone(self.saver.get("9"))
+        inode = os.stat(self.temp_file).st_ino
+        updated = dict(self.vacancies[1], salary_from=180000)
+        self.saver.save({"items": [updated]})
+        self.assertEqual(self.saver.get("2"), updated)
+        self.assertEqual(list(self.saver.iter_vacancies()), [self.vacancies[0], self.vacancies[2], updated])
+        with mock.patch('builtins.print') as mock_print:
+            self.saver.delete("2")
+            mock_print.assert_called_with(f'Вакансия с id 2 удалена из {self.temp_file}.')
+            self.saver.delete("2")
+            mock_print.assert_called_with(f'Вакансия с id 2 не найдена в {self.temp_file}.')
+        self.assertIsNone(self.saver.get("2"))
+        self.assertEqual(os.stat(self.temp_file).st_ino, inode)
+        # Удаленную вакансию можно сохранить снова
+        self.saver.save({"items": [self.vacancies[1]]})
+        self.assertEqual(JSONLSaver(path=self.temp_file).get("2"), self.vacancies[1])
+
+    def test_upsert(self):
+        # Дописываются только новые и изменившиеся вакансии
+        self.assertEqual(self.saver.upsert(self.vacancies[:2]), UpsertResult(inserted=2))
+        size = os.path.getsize(self.temp_file)
+        self.assertEqual(self.saver.upsert(self.vacancies[:2]), UpsertResult(unchanged=2))
+        self.assertEqual(os.path.getsize(self.temp_file), size)
+        updated = dict(self.vacancies[0], requirement="FastAPI")
+        unnamed = dict(self.vacancies[2], id=None)
+        result = self.saver.upsert([updated, self.vacancies[1], self.vacancies[2], unnamed, unnamed])
+        self.assertEqual(result, UpsertResult(inserted=2, updated=1, unchanged=2))
+        self.assertEqual(list(JSONLSaver(path=self.temp_file).iter_vacancies()),
+                         [self.vacancies[1], updated, self.vacancies[2], unnamed])
+        self.assertEqual(sorted(JSONLSaver(path=self.temp_file).ids()), ["1", "2", "3"])
+
+    def test_upsert_edited_record(self):
+        # Прочитанная и измененная запись обновляется, хотя хранит прежний отпечаток
+        vacancy = Vacancy(name="Python Developer", desc="Москва", salary_from=100000,
+                          url="https://hh.ru/vacancy/1", id="1")
+        self.saver.upsert([vacancy.to_dict()])
+        record = JSONLSaver(path=self.temp_file).get("1")
+        record["salary_from"] = 120000
+        self.assertEqual(self.saver.upsert([record]).updated, 1)
+        stored = JSONLSaver(path=self.temp_file).get("1")
+        self.assertEqual(stored["salary_from"], 120000)
+        self.assertEqual(stored["fingerprint"], record_fingerprint(stored))
+        self.assertEqual(JSONLSaver(path=self.temp_file).upsert([stored]).unchanged, 1)
+
+    def test_key_index_recovery(self):
+        # Индекс ключей восстанавливается по концу файла и строится заново без журнала
+        self.saver.save({"items": self.vacancies[:2]})
+        with open(self.temp_file + '.ids', 'rb') as file:
+            journal = file.read()
+        self.saver.save({"items": self.vacancies[2:]})
+        with mock.patch('builtins.print'):
+            self.saver.delete("1")
+        # Журнал отстает от файла данных, как после прерванной записи
+        with open(self.temp_file + '.ids', 'wb') as file:
+            file.write(journal + b'["3", 0')
+        saver = JSONLSaver(path=self.temp_file)
+        self.assertIsNone(saver.get("1"))
+        self.assertEqual(saver.get("3"), self.vacancies[2])
+        self.assertEqual(list(saver.iter_vacancies()), self.vacancies[1:])
+        os.remove(self.temp_file + '.ids')
+        self.assertEqual(list(JSONLSaver(path=self.temp_file).iter_vacancies()), self.vacancies[1:])
+
+    def test_concurrent_writers(self):
+        # Одновременные сохранения из нескольких процессов не теряют и не повреждают вакансии
+        writers, count = 4, 30
+        with ProcessPoolExecutor(max_workers=writers) as executor:
+            for future in [executor.submit(save_in_process, self.temp_file, writer, count)
+                           for writer in range(writers)]:
+                future.result()
+        saver = JSONLSaver(path=self.temp_file)
+        vacancies = list(saver.iter_vacancies())
+        ids = [vacancy["id"] for vacancy in vacancies]
+        self.assertEqual(len(vacancies), writers * count + 2)
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids.count(None), 1)
+        self.assertEqual(saver.get("3-29"), {"id": "3-29", "name": "Developer 29"})
+        self.assertTrue(saver.get("shared")["name"].startswith("Версия"))
+        # Индексы, сохраненные разными процессами, согласованы с файлом
+        os.remove(self.temp_file + '.ids')
+        self.assertEqual(list(JSONLSaver(path=self.temp_file).iter_vacancies()), vacancies)
+        self.assertEqual(saver.compact(), writers * count - 1)
+
+if __name__ == '__main__':
+    unittest.main()
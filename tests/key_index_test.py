@@ -0,0 +1,73 @@
+import unittest
+import tempfile
+import os
+from src.key_index import KeyIndex
+
+
+class TestKeyIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'vacancies.jsonl.ids')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_set_get_remove(self):
+        # Добавление, замена и удаление записей
+        index = KeyIndex()
+        index.set("1", 0, "1:aa")
+        index.set("2", 10, "2:bb")
+        index.set("1", 20, "1:cc")
+        self.assertEqual(index.get("1"), (20, "1:cc"))
+        self.assertEqual(index.remove("2"), (10, "2:bb"))
+        self.assertIsNone(index.remove("2"))
+        self.assertNotIn("2", index)
+        self.assertEqual(list(index), ["1"])
+
+    def test_save_and_load(self):
+        # Журнал дописывается изменениями и восстанавливается до последней отметки
+        index = KeyIndex()
+        index.set("1", 0, "1:aa")
+        index.end = 10
+        index.save(self.path)
+        index.set("2", 10, "2:bb")
+        index.remove("1")
+        index.end = 20
+        index.save(self.path)
+        with open(self.path, 'r', encoding='utf-8') as file:
+            self.assertEqual(len(file.readlines()), 5)
+
+        loaded = KeyIndex.load(self.path)
+        self.assertEqual(loaded.end, 20)
+        self.assertEqual(list(loaded), ["2"])
+        self.assertEqual(loaded.get("2"), (10, "2:bb"))
+        self.assertEqual(len(KeyIndex.load(os.path.join(self.temp_dir.name, 'missing'))), 0)
+
+    def test_uncommitted_tail(self):
+        # Изменения после последней отметки и оборванная строка не учитываются и перезаписываются
+        index = KeyIndex()
+        index.set("1", 0, "1:aa")
+        index.end = 10
+        index.save(self.path)
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('["2", 10, "2:bb"]\n["3", 2')
+        loaded = KeyIndex.load(self.path)
+        self.assertEqual(list(loaded), ["1"])
+        self.assertEqual(loaded.end, 10)
+        loaded.set("4", 10, "4:dd")
+        loaded.end = 20
+        loaded.save(self.path)
+        reloaded = KeyIndex.load(self.path)
+        self.assertEqual(sorted(reloaded), ["1", "4"])
+        self.assertEqual(reloaded.end, 20)
+
+    def test_corrupted_journal(self):
+        # Поврежденная строка журнала
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write('не JSON\n')
+        with self.assertRaises(IOError):
+            KeyIndex.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from src.near_duplicates import (NearDuplicateIndex, cluster_near_duplicates, collapse_near_duplicates, jaccard,
+                                 minhash, shingles)
+
+
+class TestNearDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.texts = [
+            "Python Developer Опыт работы с Django от 3 лет, знание PostgreSQL и Redis",
+            "Python-разработчик Опыт работы с Django от 3 лет, знание PostgreSQL и Redis",
+            "Senior Python Developer Опыт работы с Django от 3 лет, знание PostgreSQL и Redis",
+            "Java Developer Spring Boot, Kafka, опыт микросервисов",
+        ]
+
+    def test_shingles_and_jaccard(self):
+        """
+        Тестирует шинглы из термов и коэффициент Жаккара.
+        """
+        self.assertEqual(shingles("Python разработчики", size=2), frozenset(["python разработчик"]))
+        self.assertEqual(shingles("Python Developer Django"), frozenset(["python develop", "develop django"]))
+        self.assertEqual(shingles(""), frozenset())
+        self.assertEqual(jaccard(shingles(self.texts[0]), shingles(self.texts[0])), 1.0)
+        self.assertEqual(jaccard(shingles(self.texts[0]), shingles(self.texts[3])), 0.0)
+        self.assertEqual(jaccard(frozenset(), frozenset()), 0.0)
+
+    def test_minhash(self):
+        """
+        Тестирует сигнатуру MinHash: одинаковые множества дают одинаковые сигнатуры,
+        пустые корзины заполняются.
+        """
+        items = shingles(self.texts[0])
+        signature = minhash(items, 30)
+        self.assertEqual(len(signature), 30)
+        self.assertTrue(all(value >= 0 for value in signature))
+        self.assertEqual(signature, minhash(frozenset(items), 30))
+
+    def test_index_add_and_search(self):
+        """
+        Тестирует поиск почти дубликатов в индексе.
+        """
+        index = NearDuplicateIndex(threshold=0.8)
+        self.assertEqual(index.add(0, self.texts[0]), [])
+        matches = index.add(2, self.texts[2])
+        self.assertEqual([doc_id for doc_id, _ in matches], [0])
+        self.assertGreaterEqual(matches[0][1], 0.8)
+        self.assertEqual(index.search(self.texts[3]), [])
+        self.assertEqual(index.add(4, ""), [])
+        self.assertEqual(len(index), 2)
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(threshold=0)
+
+    def test_cluster_and_collapse(self):
+        """
+        Тестирует группировку и схлопывание почти дубликатов.
+        """
+        documents = list(enumerate(self.texts))
+        self.assertEqual(cluster_near_duplicates(documents, threshold=0.6), [[0, 1, 2]])
+        self.assertEqual(cluster_near_duplicates(documents, threshold=0.9), [[0, 2]])
+        self.assertEqual(list(collapse_near_duplicates(self.texts, threshold=0.6, text=str)),
+                         [self.texts[0], self.texts[3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
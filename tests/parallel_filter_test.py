@@ -0,0 +1,75 @@
+import random
+import unittest
+from unittest import mock
+from src.parallel_filter import SharedColumns
+
+
+class TestSharedColumns(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.salary_from = [rng.choice([None, 0, rng.randint(1, 300000)]) for _ in range(1000)]
+        self.salary_to = [rng.choice([None, rng.randint(1, 300000)]) for _ in range(1000)]
+        self.names = [rng.choice(["Python Developer", "Java Developer", None, "Senior PYTHON"]) for _ in range(1000)]
+
+    def expected(self, name=None, salary_from=None, salary_to=None, nonzero=False):
+        """
+        Возвращает результат построчной фильтрации для сравнения.
+        """
+        result = []
+        for index, (low, high, title) in enumerate(zip(self.salary_from, self.salary_to, self.names)):
+            if name is not None and name.lower() not in (title or '').lower():
+                continue
+            if salary_from is not None and (low is None or low < salary_from or (nonzero and not low)):
+                continue
+            if salary_to is not None and (high is None or high > salary_to or (nonzero and not high)):
+                continue
+            result.append(index)
+        return result
+
+    def check(self, columns):
+        """
+        Сравнивает фильтрацию по столбцам с построчной для набора условий.
+        """
+        for query in ({}, {"name": "python"}, {"salary_from": 0}, {"salary_from": 0, "nonzero": True},
+                      {"name": "java", "salary_from": 100000, "salary_to": 250000},
+                      {"salary_to": 150000, "nonzero": True}):
+            self.assertEqual(columns.filter(**query), self.expected(**query), query)
+
+    def test_filter_in_process(self):
+        """
+        Тестирует фильтрацию по столбцам в текущем процессе.
+        """
+        with SharedColumns(self.salary_from, self.salary_to, self.names) as columns:
+            self.assertEqual(len(columns), 1000)
+            self.check(columns)
+
+    @mock.patch('src.parallel_filter.MIN_SLICE_ROWS', 100)
+    def test_filter_parallel(self):
+        """
+        Тестирует параллельную фильтрацию непересекающихся частей и объединение индексов.
+        """
+        with SharedColumns(self.salary_from, self.salary_to, self.names, workers=3) as columns:
+            self.check(columns)
+
+    @mock.patch('src.parallel_filter.MIN_SLICE_ROWS', 100)
+    @mock.patch('src.parallel_filter.os.cpu_count', return_value=4)
+    def test_default_workers_per_cpu(self, _cpu_count):
+        """
+        Тестирует деление строк по количеству процессоров, если количество процессов не задано.
+        """
+        with SharedColumns(self.salary_from, self.salary_to, self.names) as columns:
+            self.assertEqual(len(columns._SharedColumns__slices()), 4)
+            self.check(columns)
+
+    def test_empty_and_mismatched_columns(self):
+        """
+        Тестирует пустые столбцы и ошибку при разной длине столбцов.
+        """
+        with SharedColumns([], [], []) as columns:
+            self.assertEqual(columns.filter(salary_from=1), [])
+        with self.assertRaises(ValueError):
+            SharedColumns([1], [], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import unittest
+from src.parse_report import ParseReport
+
+
+class TestParseReport(unittest.TestCase):
+    def test_counters_and_bounded_samples(self):
+        """
+        Тестирует счетчики ошибок по виду и ограниченную выборку примеров.
+        """
+        report = ParseReport(sample_size=3, seed=1)
+        for number in range(100):
+            error = ValueError('salary_from не может быть отрицательным') if number % 4 else TypeError('не словарь')
+            report.record_error(error, {"number": number})
+        self.assertEqual(report.rejected, 100)
+        self.assertEqual(report.errors['ValueError: salary_from не может быть отрицательным'], 75)
+        self.assertEqual(report.errors['TypeError: не словарь'], 25)
+        self.assertEqual(len(report.samples), 3)
+        self.assertEqual(len({item["number"] for _, item in report.samples}), 3)
+
+        report.total = 200
+        summary = report.summary()
+        self.assertIn('Пропущено некорректных элементов: 100 из 200', summary)
+        self.assertIn('ValueError: salary_from не может быть отрицательным — 75', summary)
+        self.assertEqual(report.to_dict()["rejected"], 100)
+
+        report.reset()
+        self.assertEqual((report.total, report.rejected, report.samples), (0, 0, []))
+
+    def test_quarantine_streamed(self):
+        """
+        Тестирует, что отклоненные элементы дописываются в карантин по мере учета, а файл
+        открывается при первой ошибке и закрывается вызовом write_quarantine.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'quarantine', 'rejected.jsonl')
+            report = ParseReport(quarantine_path=path)
+            self.assertEqual(report.write_quarantine(), 0)
+            self.assertFalse(os.path.exists(path))
+            report.record_error(ValueError('URL не может быть пустым'), {"name": "Python", "url": ""})
+            self.assertTrue(os.path.exists(path))
+            report.record_error(TypeError('не словарь'), 'строка')
+
+            self.assertEqual(report.write_quarantine(), 2)
+            self.assertEqual(report.write_quarantine(), 0)
+            with open(path, encoding='utf-8') as file:
+                entries = [json.loads(line) for line in file]
+            self.assertEqual(entries[0], {"error": "ValueError: URL не может быть пустым",
+                                          "item": {"name": "Python", "url": ""}})
+            self.assertEqual(entries[1]["item"], 'строка')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
 from unittest import mock
+from src.parse_report import ParseReport
 from src.parser_vacancy import ParserVacancy
 from src.vacancy import Vacancy
 from typing import Dict, Any, List
@@ -244,6 +247,141 @@ class TestParserVacancy(unittest.TestCase):
         self.assertIsNotNone(result[0].salary_to)
         self.assertLessEqual(result[0].salary_to, 150000)
 
+    def test_parse_vacancies_top_n_with_sort(self):
+        """
+        Тестирует выборку топ N с сортировкой: результат совпадает с полной сортировкой и срезом.
+        """
+        params = {"sorted_avg_salary_desc": True, "top_n": 2}
+        result = self.parser.parse_vacancies(params=params)
+        self.assertEqual([vac.salary_to for vac in result], [200000, 150000])
+
+    def test_parse_vacancies_top_n_from_stream(self):
+        """
+        Тестирует парсинг с фильтрами над потоком исходных данных (генератором).
+        """
+        parser = ParserVacancy(data=(item for item in self.sample_data))
+        params = {"name": "developer", "sorted_salary_from": True, "top_n": 1}
+        result = parser.parse_vacancies(params=params)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].salary_from, 150000)
+
+    def test_parse_vacancies_with_text_search(self):
+        """
+        Тестирует полнотекстовый поиск по названию и требованиям вакансий.
+        """
+        result = self.parser.parse_vacancies(params={"text": "python developers"})
+        self.assertEqual({vac.name for vac in result}, {"Python Developer", "Senior Python Developer"})
+        result = self.parser.parse_vacancies(params={"text": "java scientist", "text_mode": "or"})
+        self.assertEqual({vac.name for vac in result}, {"Java Developer", "Data Scientist"})
+        result = self.parser.parse_vacancies(params={"text": "experience", "salary_from": 120000})
+        self.assertEqual([vac.name for vac in result], ["Senior Python Developer"])
+
+    def test_parse_vacancies_with_fuzzy_name(self):
+        """
+        Тестирует нечеткий поиск по названию вакансии с опечаткой.
+        """
+        result = self.parser.parse_vacancies(params={"fuzzy_name": "Pyhton Developer"})
+        self.assertEqual(result[0].name, "Python Developer")
+        self.assertNotIn("Data Scientist", [vac.name for vac in result])
+        result = self.parser.parse_vacancies(params={"fuzzy_name": "Pyhton Developer", "salary_from": 120000})
+        self.assertEqual([vac.name for vac in result], ["Senior Python Developer"])
+
+    def test_parse_vacancies_with_salary_overlap(self):
+        """
+        Тестирует поиск вакансий, вилка зарплаты которых пересекается с диапазоном.
+        """
+        result = self.parser.parse_vacancies(params={"salary_overlap": (145000, 160000)})
+        self.assertEqual([vac.name for vac in result], ["Python Developer", "Senior Python Developer"])
+        result = self.parser.parse_vacancies(params={"salary_overlap": (None, 95000)})
+        self.assertEqual([vac.name for vac in result], ["Java Developer"])
+        result = self.parser.parse_vacancies(params={"salary_overlap": (120000, None), "text": "python"})
+        self.assertEqual({vac.name for vac in result}, {"Python Developer", "Senior Python Developer"})
+        result = self.parser.parse_vacancies(params={"salary_overlap": (None, 120000), "fuzzy_name": "Pyhton Developer"})
+        self.assertEqual([vac.name for vac in result], ["Python Developer", "Java Developer"])
+
+    @mock.patch('builtins.print')
+    def test_parse_vacancies_collapse_duplicates(self, mock_print):
+        """
+        Тестирует схлопывание почти дубликатов по названию и требованиям.
+        """
+        result = self.parser.parse_vacancies(params={"collapse_duplicates": True})
+        self.assertEqual(len(result), 4)
+        result = self.parser.parse_vacancies(params={"collapse_duplicates": 0.3})
+        self.assertEqual([vac.name for vac in result], ["Python Developer", "Java Developer", "Data Scientist"])
+        result = self.parser.parse_vacancies(params={"collapse_duplicates": 0.3, "sorted_salary_from": True})
+        self.assertEqual([vac.name for vac in result], ["Python Developer", "Java Developer", "Data Scientist"])
+
+    @mock.patch('builtins.print')
+    def test_parse_vacancies_with_params_skips_invalid(self, mock_print):
+        """
+        Тестирует, что с фильтрами возвращаются только проверенные экземпляры Vacancy.
+        """
+        result = self.parser.parse_vacancies(params={"sorted_avg_salary_asc": True})
+        self.assertEqual(len(result), 4)
+        self.assertTrue(all(isinstance(vac, Vacancy) for vac in result))
+        self.assertTrue(any("salary_from не может быть отрицательным" in str(call) for call in mock_print.call_args_list))
+
+    @mock.patch('builtins.print')
+    def test_parse_vacancies_order_by(self, mock_print):
+        """
+        Тестирует сортировку по спецификации order_by за один проход.
+        """
+        result = self.parser.parse_vacancies(params={"order_by": [("salary_to", "desc"), ("name", "asc")]})
+        self.assertEqual([vac.name for vac in result],
+                         ["Senior Python Developer", "Python Developer", "Java Developer", "Data Scientist"])
+        # Равные значения первого поля упорядочиваются по следующему
+        result = self.parser.parse_vacancies(params={"order_by": [("currency", "asc"), ("name", "desc")]})
+        self.assertEqual([vac.name for vac in result],
+                         ["Senior Python Developer", "Python Developer", "Java Developer", "Data Scientist"])
+        result = self.parser.parse_vacancies(params={"order_by": [("avg_salary", "asc", "first")], "top_n": 2})
+        self.assertEqual([vac.name for vac in result], ["Data Scientist", "Java Developer"])
+
+    @mock.patch('builtins.print')
+    def test_parse_vacancies_parallel(self, mock_print):
+        """
+        Тестирует, что параллельная фильтрация по столбцам дает тот же результат.
+        """
+        parallel = ParserVacancy(data=self.sample_data, workers=2)
+        for params in ({"name": "python", "salary_from": 120000},
+                       {"salary_to": 150000, "sorted_avg_salary_desc": True},
+                       {"name": "developer", "top_n": 1, "sorted_salary_from": True}):
+            self.assertEqual([vac.url for vac in parallel.parse_vacancies(params=params)],
+                             [vac.url for vac in self.parser.parse_vacancies(params=params)], params)
+
+    @mock.patch('builtins.print')
+    def test_parse_schema_fields(self, mock_print):
+        """
+        Тестирует извлечение дополнительных полей схемы при парсинге.
+        """
+        item = dict(self.sample_data[0], id="123456", employer={"name": "Яндекс"},
+                    schedule={"id": "remote", "name": "Удаленная работа"})
+        vacancy = ParserVacancy(data=[item]).parse_vacancies()[0]
+        self.assertEqual((vacancy.id, vacancy.employer, vacancy.schedule), ("123456", "Яндекс", "Удаленная работа"))
+        self.assertIsNone(vacancy.published_at)
+
+    @mock.patch('builtins.print')
+    def test_parse_errors_collected_in_report(self, mock_print):
+        """
+        Тестирует, что ошибки элементов собираются в отчет и выводятся одной сводкой.
+        """
+        data = self.sample_data + ["не вакансия"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'rejected.jsonl')
+            parser = ParserVacancy(data=data, report=ParseReport(quarantine_path=path))
+            result = parser.parse_vacancies()
+            self.assertEqual(len(result), 4)
+
+            report = parser.get_report()
+            self.assertEqual((report.total, report.rejected), (6, 2))
+            self.assertEqual(report.errors["TypeError: элемент не является словарем"], 1)
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(len(file.readlines()), 2)
+
+        # Сводка выводится один раз, перед итогом парсинга
+        self.assertEqual(mock_print.call_count, 2)
+        self.assertIn('Пропущено некорректных элементов: 2 из 6', mock_print.call_args_list[0].args[0])
+        mock_print.assert_called_with('Всего вакансий после парсинга: 4')
+
     @mock.patch('builtins.print')
     def test_creating_vacancy_list_with_errors(self, mock_print):
         """
@@ -0,0 +1,96 @@
+import unittest
+from src.query import compile_order_by, normalize_order_by, parse_order_by, select_top_n
+
+
+class TestSelectTopN(unittest.TestCase):
+    def test_select_top_n_matches_sorted_slice(self):
+        """
+        Тестирует, что выборка совпадает с полной сортировкой и срезом, включая равные элементы.
+        """
+        items = [(5, 'a'), (3, 'b'), (5, 'c'), (1, 'd'), (4, 'e'), (5, 'f')]
+        key = lambda x: x[0]
+        self.assertEqual(select_top_n(items, 3, key=key), sorted(items, key=key)[:3])
+        self.assertEqual(select_top_n(items, 4, key=key, reverse=True),
+                         sorted(items, key=key, reverse=True)[:4])
+
+    def test_select_top_n_from_generator(self):
+        """
+        Тестирует выборку из генератора без материализации потока.
+        """
+        stream = (x for x in range(1_000_000))
+        self.assertEqual(select_top_n(stream, 3, key=lambda x: x, reverse=True), [999999, 999998, 999997])
+
+    def test_select_top_n_without_key(self):
+        """
+        Тестирует выборку первых N элементов потока, если ключ сортировки не задан.
+        """
+        stream = iter([3, 1, 2, 5])
+        self.assertEqual(select_top_n(stream, 2), [3, 1])
+        self.assertEqual(list(stream), [2, 5])
+
+    def test_select_top_n_non_positive(self):
+        """
+        Тестирует, что при N <= 0 возвращается пустой список.
+        """
+        self.assertEqual(select_top_n([1, 2, 3], 0, key=lambda x: x), [])
+
+
+
+class TestOrderBy(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            {"name": "b", "salary": None},
+            {"name": "a", "salary": 300},
+            {"name": "c", "salary": 300},
+            {"name": "d", "salary": 100},
+            {"name": None, "salary": 100},
+        ]
+        self.accessor = lambda field: (lambda row: row.get(field))
+
+    def order(self, order_by, numeric=()):
+        """
+        Возвращает названия строк в порядке сортировки по спецификации.
+        """
+        key = compile_order_by(order_by, self.accessor, numeric=numeric)
+        return [row["name"] for row in sorted(self.rows, key=key)]
+
+    def test_normalize_order_by(self):
+        """
+        Тестирует нормализацию спецификации и значения по умолчанию.
+        """
+        self.assertEqual(normalize_order_by(["name", ("salary", "DESC"), ("id", "asc", "first")]),
+                         [("name", "asc", "last"), ("salary", "desc", "last"), ("id", "asc", "first")])
+        with self.assertRaises(ValueError):
+            normalize_order_by([("name", "up")])
+        with self.assertRaises(ValueError):
+            normalize_order_by([("name", "asc", "middle")])
+
+    def test_parse_order_by(self):
+        """
+        Тестирует разбор спецификации сортировки из строки.
+        """
+        self.assertEqual(parse_order_by("salary_from desc, name asc nulls first, id"),
+                         [("salary_from", "desc", "last"), ("name", "asc", "first"), ("id", "asc", "last")])
+        with self.assertRaises(ValueError):
+            parse_order_by("salary_from desc nulls")
+
+    def test_compile_order_by_tie_breaking(self):
+        """
+        Тестирует сортировку по нескольким полям за один проход с разрешением равенства.
+        """
+        for numeric in ((), ("salary",)):
+            self.assertEqual(self.order([("salary", "desc"), ("name", "asc")], numeric), ["a", "c", "d", None, "b"])
+            self.assertEqual(self.order([("salary", "desc"), ("name", "desc")], numeric), ["c", "a", "d", None, "b"])
+            self.assertEqual(self.order([("salary", "asc", "first"), ("name", "asc", "first")], numeric),
+                             ["b", None, "d", "a", "c"])
+
+    def test_compile_order_by_matches_top_n(self):
+        """
+        Тестирует, что ключ подходит для выборки топ N ограниченной кучей.
+        """
+        key = compile_order_by([("salary", "desc"), "name"], self.accessor, numeric=("salary",))
+        self.assertEqual(select_top_n(self.rows, 2, key=key), sorted(self.rows, key=key)[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,22 @@ import unittest
 import tempfile
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from unittest import mock
+from src.fingerprint import FingerprintIndex, record_fingerprint
+from src.records import UpsertResult
 from src.saver import JSONSaver
+from src.text_index import InvertedIndex
+from src.vacancy import Vacancy
+
+
+def save_in_process(path, writer, count, wal):
+    """
+    Сохраняет вакансии по одной из отдельного процесса.
+    """
+    saver = JSONSaver(path=path, wal=wal, fsync='never')
+    for number in range(count):
+        saver.save({"items": [{"id": f"{writer}-{number}", "name": f"Developer {number}"}]})
 
 
 class TestJSONSaver(unittest.TestCase):
@@ -87,6 +101,29 @@ class TestJSONSaver(unittest.TestCase):
             data = json.load(file)
             self.assertEqual(len(data["items"]), 1)
 
+    def test_save_dedup_by_fingerprint(self):
+        # Повторные сохранения пересекающихся выборок не добавляют дубликаты, в том числе
+        # в новом экземпляре хранилища и внутри одной выборки
+        first = {"id": "1", "name": "Python Developer", "desc": "Москва", "salary_from": 100000,
+                 "salary_to": None, "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Django"}
+        second = dict(first, id="2", url="https://hh.ru/vacancy/2")
+        third = dict(first, id="3", url="https://hh.ru/vacancy/3")
+        self.saver.save({"items": [first, second, dict(first)]})
+        JSONSaver(path=self.temp_file).save({"items": [dict(second, name=" python developer"), third]})
+        with open(self.temp_file, 'r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file)["items"], [first, second, third])
+        with open(os.path.splitext(self.temp_file)[0] + '.fingerprints', 'r', encoding='utf-8') as file:
+            lines = file.read().split()
+        # Первая строка — версия данных, которым соответствует индекс
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].startswith('#'))
+        # Измененная вакансия заменяет сохраненную с тем же идентификатором
+        self.saver.save({"items": [dict(first, salary_from=120000)]})
+        with mock.patch('builtins.print'):
+            result = self.saver.get_vacancies()
+        self.assertEqual([vacancy["id"] for vacancy in result], ["1", "2", "3"])
+        self.assertEqual(result[0]["salary_from"], 120000)
+
     def test_get_vacancies_no_criteria(self):
         # Сохраняем несколько вакансий
         vacancies = [
@@ -204,6 +241,421 @@ class TestJSONSaver(unittest.TestCase):
         self.assertIn(vacancies[0], result)
         self.assertIn(vacancies[1], result)
 
+    def test_get_vacancies_order_by(self):
+        # Сортировка результата по нескольким полям и выборка топ N
+        vacancies = [
+            {"name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Django"},
+            {"name": "Java Developer", "desc": "Москва", "salary_from": None, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring"},
+            {"name": "Go Developer", "desc": "Казань", "salary_from": 200000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/3", "requirement": "Go"},
+        ]
+        self.saver.save({"items": vacancies})
+        with mock.patch('builtins.print'):
+            result = self.saver.get_vacancies({"order_by": [("salary_to", "desc"), ("name", "asc")]})
+            self.assertEqual([item["name"] for item in result], ["Java Developer", "Python Developer", "Go Developer"])
+            result = self.saver.get_vacancies({"order_by": [("avg_salary", "desc")], "top_n": 2})
+            self.assertEqual([item["name"] for item in result], ["Go Developer", "Java Developer"])
+            result = self.saver.get_vacancies({"name": "developer", "top_n": 1})
+            self.assertEqual(result, vacancies[:1])
+
+    def test_get_vacancies_salary_overlap(self):
+        # Поиск по пересечению вилки зарплаты с диапазоном, в том числе с открытыми границами
+        vacancies = [
+            {"name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Django"},
+            {"name": "Java Developer", "desc": "Москва", "salary_from": None, "salary_to": 90000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring"},
+            {"name": "Go Developer", "desc": "Казань", "salary_from": 200000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/3", "requirement": "Go"},
+            {"name": "Intern", "desc": "Казань", "salary_from": None, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/4", "requirement": "Python"},
+        ]
+        self.saver.save({"items": vacancies})
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (140000, 250000)}),
+                             [vacancies[0], vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (None, 95000)}), [vacancies[1]])
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (300000, None)}), [vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (50000, 120000), "name": "python"}),
+                             [vacancies[0]])
+            # Индекс перестраивается после добавления записей
+            extra = {"name": "Rust Developer", "desc": "Москва", "salary_from": 80000, "salary_to": 100000,
+                     "currency": "RUB", "url": "https://hh.ru/vacancy/5", "requirement": "Rust"}
+            self.saver.save({"items": [extra]})
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (None, 95000)}), [vacancies[1], extra])
+
+    def test_get_vacancies_collapse_duplicates(self):
+        # Перепубликованная вакансия в другом городе схлопывается с исходной
+        vacancies = [
+            {"name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Опыт работы с Django от 3 лет"},
+            {"name": "Java Developer", "desc": "Москва", "salary_from": 150000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring Boot и Kafka"},
+            {"name": "Python-разработчик", "desc": "Казань", "salary_from": 120000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/3", "requirement": "Опыт работы с Django от 3 лет"},
+        ]
+        self.saver.save({"items": vacancies})
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"collapse_duplicates": True}), vacancies)
+            self.assertEqual(self.saver.get_vacancies({"collapse_duplicates": 0.6}), vacancies[:2])
+            self.assertEqual(self.saver.get_vacancies({"collapse_duplicates": 0.6, "salary_from": 110000}),
+                             vacancies[1:])
+
+    def test_iter_sorted_external(self):
+        # Потоковая внешняя сортировка совпадает с сортировкой в памяти
+        vacancies = [
+            {"name": f"Developer {number}", "desc": "Москва", "salary_from": (number * 7919) % 50 * 1000 or None,
+             "salary_to": None, "currency": "RUB", "url": f"https://hh.ru/vacancy/{number}", "requirement": "Python"}
+            for number in range(60)
+        ]
+        self.saver.save({"items": vacancies})
+        order_by = [("salary_from", "desc"), ("name", "asc")]
+        with mock.patch('builtins.print'):
+            expected = self.saver.get_vacancies({"order_by": order_by, "salary_from": 10000})
+        result = list(self.saver.iter_sorted(order_by, criteria={"salary_from": 10000}, run_bytes=1200))
+        self.assertEqual(result, expected)
+        self.assertEqual(list(JSONSaver(path=os.path.join(self.temp_dir.name, 'missing.json')).iter_sorted(order_by)), [])
+
+    def test_compressed_storage(self):
+        # Сжатое хранилище читается потоком и дает те же результаты, что и несжатое
+        vacancies = [
+            {"id": str(number), "name": f"Developer {number}", "desc": "Москва", "salary_from": number * 1000,
+             "salary_to": None, "currency": "RUB", "url": f"https://hh.ru/vacancy/{number}", "requirement": "Python"}
+            for number in range(50)
+        ]
+        self.saver.save({"items": vacancies})
+        for extension in ('.gz', '.xz'):
+            path = self.temp_file + extension
+            saver = JSONSaver(path=path)
+            saver.save({"items": vacancies})
+            saver.save({"items": vacancies[:10]})
+            self.assertLess(os.path.getsize(path), os.path.getsize(self.temp_file))
+            with mock.patch('builtins.print'):
+                self.assertEqual(saver.get_vacancies(), vacancies)
+                self.assertEqual(saver.get_vacancies({"salary_from": 40000}),
+                                 self.saver.get_vacancies({"salary_from": 40000}))
+                self.assertEqual(list(saver.iter_sorted([("salary_from", "desc")]))[0], vacancies[-1])
+                saver.delete("3")
+                self.assertEqual(len(JSONSaver(path=path).get_vacancies()), 49)
+
+    def test_load_cache(self):
+        # Последовательные операции не разбирают файл заново, изменение файла обнаруживается
+        vacancies = [
+            {"id": str(number), "name": f"Developer {number}", "desc": "Москва", "salary_from": number * 1000,
+             "salary_to": None, "currency": "RUB", "url": f"https://hh.ru/vacancy/{number}", "requirement": "Python"}
+            for number in range(5)
+        ]
+        self.saver.save({"items": vacancies[:3]})
+        with mock.patch('src.saver.json.load', wraps=json.load) as mock_load, mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies(), vacancies[:3])
+            self.saver.get_vacancies({"salary_from": 1000})
+            self.saver.save({"items": vacancies[3:4]})
+            self.saver.delete("0")
+            self.assertEqual(self.saver.get_vacancies(), vacancies[1:4])
+            self.assertEqual(mock_load.call_count, 0)
+
+            # Возвращаемый список и записи не связаны с кэшем, как и сохраненные записи
+            self.saver.get_vacancies().clear()
+            self.assertEqual(len(self.saver.get_vacancies()), 3)
+            self.saver.get_vacancies()[0]["name"] = "Changed"
+            self.saver.get_vacancies({"salary_from": 1000})[0]["salary_from"] = 0
+            vacancies[3]["name"] = "Changed"
+            self.assertEqual(self.saver.get_vacancies()[0]["name"], "Developer 1")
+            self.assertEqual(self.saver.get_vacancies()[2]["name"], "Developer 3")
+            self.assertEqual(len(self.saver.get_vacancies({"salary_from": 1000})), 3)
+            vacancies[3]["name"] = "Developer 3"
+
+            # Запись другим экземпляром меняет подпись файла
+            JSONSaver(path=self.temp_file).save({"items": vacancies[4:]})
+            self.assertEqual(self.saver.get_vacancies(), vacancies[1:])
+            # Файл прочитан новым экземпляром и затем один раз этим
+            self.assertEqual(mock_load.call_count, 2)
+
+        # Удаление файла другим экземпляром сбрасывает кэш и индексы позиций
+        self.assertEqual(self.saver.upsert(vacancies[1:2]), UpsertResult(unchanged=1))
+        os.remove(self.temp_file)
+        self.assertEqual(self.saver.get_vacancies(), [])
+        self.assertEqual(self.saver.upsert(vacancies[2:3]), UpsertResult(inserted=1))
+        self.assertEqual(JSONSaver(path=self.temp_file).get_vacancies(), vacancies[2:3])
+
+    def test_upsert_edited_record(self):
+        # Прочитанная и измененная запись обновляется, хотя хранит прежний отпечаток
+        vacancy = Vacancy(name="Python Developer", desc="Москва", salary_from=100000,
+                          url="https://hh.ru/vacancy/1", id="1")
+        self.saver.upsert([vacancy.to_dict()])
+        record = JSONSaver(path=self.temp_file).get_vacancies()[0]
+        record["salary_from"] = 120000
+        self.assertEqual(self.saver.upsert([record]).updated, 1)
+        with open(self.temp_file, 'r', encoding='utf-8') as f:
+            stored = json.load(f)["items"][0]
+        self.assertEqual(stored["salary_from"], 120000)
+        self.assertEqual(stored["fingerprint"], record_fingerprint(stored))
+        self.assertEqual(self.saver.upsert([stored]).unchanged, 1)
+
+    def test_upsert(self):
+        # Новые вакансии добавляются, изменившиеся обновляются, неизменные не записываются
+        vacancies = [
+            {"id": str(number), "name": f"Developer {number}", "desc": "Москва", "salary_from": number * 1000,
+             "salary_to": None, "currency": "RUB", "url": f"https://hh.ru/vacancy/{number}", "requirement": "Python"}
+            for number in range(4)
+        ]
+        self.assertEqual(self.saver.upsert(vacancies[:3]), UpsertResult(inserted=3))
+        updated = dict(vacancies[1], salary_from=90000, requirement="Django")
+        with mock.patch.object(JSONSaver, '_JSONSaver__dump', autospec=True) as mock_dump:
+            self.assertEqual(self.saver.upsert(vacancies[:3]), UpsertResult(unchanged=3))
+            mock_dump.assert_not_called()
+        result = JSONSaver(path=self.temp_file).upsert([vacancies[0], updated, vacancies[3]])
+        self.assertEqual(result, UpsertResult(inserted=1, updated=1, unchanged=1))
+
+        saver = JSONSaver(path=self.temp_file)
+        self.assertEqual(saver.get_vacancies(), [vacancies[0], updated, vacancies[2], vacancies[3]])
+        with mock.patch('builtins.print'):
+            self.assertEqual(saver.get_vacancies({"text": "django"}), [updated])
+            self.assertEqual(saver.get_vacancies({"text": "python"}), [vacancies[0], vacancies[2], vacancies[3]])
+            self.assertEqual(saver.get_vacancies({"salary_from": 50000}), [updated])
+        # Прежняя версия не считается дубликатом после обновления
+        self.assertEqual(saver.upsert([vacancies[1]]), UpsertResult(updated=1))
+        # Отпечаток замененной версии удаляется, индекс не перестраивается при следующих сохранениях
+        with mock.patch('src.saver.FingerprintIndex', wraps=FingerprintIndex) as mock_index:
+            saver = JSONSaver(path=self.temp_file)
+            self.assertEqual(saver.upsert([updated]), UpsertResult(updated=1))
+            self.assertEqual(saver.upsert([vacancies[2]]), UpsertResult(unchanged=1))
+            mock_index.assert_not_called()
+        fingerprints = FingerprintIndex.load(os.path.splitext(self.temp_file)[0] + '.fingerprints')
+        self.assertEqual(len(fingerprints), 4)
+        self.assertIn(record_fingerprint(updated), fingerprints)
+
+    def test_interrupted_dump(self):
+        # Сбой во время записи не повреждает сохраненный файл
+        vacancies = [{"id": str(number), "name": f"Developer {number}"} for number in range(3)]
+        self.saver.save({"items": vacancies[:2]})
+        with mock.patch('src.saver.json.dump', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                self.saver.save({"items": vacancies[2:]})
+        self.assertEqual(JSONSaver(path=self.temp_file).get_vacancies(), vacancies[:2])
+
+    def test_write_ahead_log(self):
+        # Сохранения дописываются в журнал и восстанавливаются без контрольной точки
+        vacancies = [
+            {"id": str(number), "name": f"Developer {number}", "desc": "Москва", "salary_from": number * 1000,
+             "salary_to": None, "currency": "RUB", "url": f"https://hh.ru/vacancy/{number}", "requirement": "Python"}
+            for number in range(5)
+        ]
+        wal_path = os.path.join(self.temp_dir.name, 'vacancies.wal')
+        saver = JSONSaver(path=self.temp_file, wal=True, group_size=2)
+        with mock.patch.object(JSONSaver, '_JSONSaver__dump', autospec=True) as mock_dump:
+            saver.save({"items": vacancies[:1]})
+            saver.save({"items": vacancies[1:3]})
+            saver.upsert([dict(vacancies[0], requirement="Django")])
+            mock_dump.assert_not_called()
+        self.assertFalse(os.path.exists(self.temp_file))
+        expected = [dict(vacancies[0], requirement="Django")] + vacancies[1:3]
+        self.assertEqual(saver.get_vacancies(), expected)
+        saver.commit()
+        recovered = JSONSaver(path=self.temp_file, wal=True)
+        self.assertEqual(recovered.get_vacancies(), expected)
+        with mock.patch('builtins.print'):
+            self.assertEqual(recovered.get_vacancies({"text": "django"}), expected[:1])
+
+        # Контрольная точка переносит журнал в файл
+        recovered.checkpoint()
+        self.assertFalse(os.path.exists(wal_path))
+        self.assertEqual(JSONSaver(path=self.temp_file).get_vacancies(), expected)
+
+        # Журнал, превысивший checkpoint_size, переносится в файл автоматически
+        saver = JSONSaver(path=self.temp_file, wal=True, fsync='never', group_size=1, checkpoint_size=1)
+        saver.save({"items": vacancies[3:]})
+        self.assertFalse(os.path.exists(wal_path))
+        self.assertEqual(JSONSaver(path=self.temp_file).get_vacancies(), expected + vacancies[3:])
+        with self.assertRaises(ValueError):
+            JSONSaver(path=self.temp_file, fsync='sometimes')
+
+    def test_crash_before_log_reset(self):
+        # Сбой между заменой файла и очисткой журнала не возвращает удаленные вакансии
+        vacancies = [{"id": str(number), "name": f"Developer {number}"} for number in range(3)]
+        saver = JSONSaver(path=self.temp_file, wal=True, fsync='never')
+        saver.save({"items": vacancies})
+        with mock.patch('src.saver.WriteAheadLog.reset', side_effect=OSError('сбой')), \
+                mock.patch('builtins.print'):
+            with self.assertRaises(IOError):
+                saver.delete("0")
+            self.assertEqual(JSONSaver(path=self.temp_file, wal=True).get_vacancies(), vacancies[1:])
+            with self.assertRaises(IOError):
+                JSONSaver(path=self.temp_file, wal=True).delete()
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir.name, 'vacancies.wal')))
+        saver = JSONSaver(path=self.temp_file, wal=True)
+        self.assertEqual(saver.get_vacancies(), [])
+        # Новые сохранения после сбоя применяются к последней контрольной точке
+        saver.save({"items": vacancies[:1]})
+        self.assertEqual(JSONSaver(path=self.temp_file, wal=True).get_vacancies(), vacancies[:1])
+
+    def test_crash_before_sidecar_write(self):
+        # Индекс отпечатков, не записанный из-за сбоя после записи данных, строится заново
+        unnamed = {"name": "Вакансия без идентификатора"}
+        fingerprint_path = os.path.splitext(self.temp_file)[0] + '.fingerprints'
+        self.saver.save({"items": [unnamed]})
+        with open(fingerprint_path, 'r', encoding='utf-8') as file:
+            stale = file.read()
+        with mock.patch('builtins.print'):
+            self.saver.delete()
+        # Сбой до удаления индекса: файл вакансий пуст, индекс содержит удаленную вакансию
+        with open(fingerprint_path, 'w', encoding='utf-8') as file:
+            file.write(stale)
+        self.assertEqual(JSONSaver(path=self.temp_file).upsert([unnamed]), UpsertResult(inserted=1))
+
+        # Сбой после записи в журнал до дописывания индекса: индекс отстает от данных той же версии
+        path = os.path.join(self.temp_dir.name, 'journal.json')
+        fingerprint_path = os.path.splitext(path)[0] + '.fingerprints'
+        saver = JSONSaver(path=path, wal=True, fsync='never')
+        saver.save({"items": [{"id": "1", "name": "Developer"}]})
+        with open(fingerprint_path, 'r', encoding='utf-8') as file:
+            lagging = file.read()
+        saver.save({"items": [unnamed]})
+        with open(fingerprint_path, 'w', encoding='utf-8') as file:
+            file.write(lagging)
+        saver = JSONSaver(path=path, wal=True, fsync='never')
+        self.assertEqual(saver.upsert([unnamed]), UpsertResult(unchanged=1))
+        self.assertEqual(len(saver.get_vacancies()), 2)
+
+    def test_concurrent_writers(self):
+        # Одновременные сохранения из нескольких процессов не теряют изменений
+        writers, count = 3, 10
+        for wal in (False, True):
+            path = os.path.join(self.temp_dir.name, f'vacancies_{wal}.json')
+            with ProcessPoolExecutor(max_workers=writers) as executor:
+                for future in [executor.submit(save_in_process, path, writer, count, wal)
+                               for writer in range(writers)]:
+                    future.result()
+            ids = [vacancy["id"] for vacancy in JSONSaver(path=path, wal=wal).get_vacancies()]
+            self.assertEqual(sorted(ids), sorted(f"{writer}-{number}" for writer in range(writers)
+                                                 for number in range(count)))
+
+    def test_get_vacancies_parallel(self):
+        # Параллельная фильтрация по столбцам дает тот же результат
+        vacancies = [
+            {"name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Django"},
+            {"name": "Java Developer", "desc": "Москва", "salary_from": None, "salary_to": 200000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring"},
+            {"name": "Senior Python Developer", "desc": "Казань", "salary_from": 200000, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/3", "requirement": "Python"},
+        ]
+        self.saver.save({"items": vacancies})
+        parallel = JSONSaver(path=self.temp_file, workers=2)
+        with mock.patch('builtins.print'):
+            for criteria in ({"name": "python"}, {"salary_from": 150000}, {"salary_to": 180000},
+                             {"name": "developer", "salary_from": 0}, {"text": "django", "salary_to": 150000}):
+                self.assertEqual(parallel.get_vacancies(criteria), self.saver.get_vacancies(criteria), criteria)
+
+    def test_get_vacancies_interns_repeated_fields(self):
+        # Повторяющиеся строки загруженных записей хранятся в одном экземпляре
+        vacancies = [
+            {
+                "name": "Python Developer",
+                "desc": "Москва",
+                "salary_from": 100000,
+                "salary_to": 150000,
+                "currency": "RUB",
+                "url": f"https://hh.ru/vacancy/{number}",
+                "requirement": "Опыт работы с Django"
+            }
+            for number in range(3)
+        ]
+        self.saver.save({"items": vacancies})
+
+        result = self.saver.get_vacancies()
+        self.assertEqual(result, vacancies)
+        for field in ("name", "desc", "currency"):
+            self.assertEqual(len({id(item[field]) for item in result}), 1)
+
+    def test_get_vacancies_with_text_search(self):
+        # Сохраняем вакансии и ищем по словам из названия и требований
+        vacancies = [
+            {
+                "name": "Python Developer",
+                "desc": "Москва",
+                "salary_from": 100000,
+                "salary_to": 150000,
+                "currency": "RUB",
+                "url": "https://hh.ru/vacancy/123456",
+                "requirement": "Опыт работы с Django"
+            },
+            {
+                "name": "Java Developer",
+                "desc": "Москва",
+                "salary_from": 150000,
+                "salary_to": 200000,
+                "currency": "RUB",
+                "url": "https://hh.ru/vacancy/654321",
+                "requirement": "Опыт работы со Spring"
+            }
+        ]
+        index_path = os.path.join(self.temp_dir.name, 'vacancies.index.json')
+        self.saver.save({"items": vacancies[:1]})
+        self.saver.save({"items": vacancies[1:]})
+        # Индекс строится при первом поиске по тексту и сохраняется рядом с файлом вакансий
+        self.assertFalse(os.path.exists(index_path))
+
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"text": "django"}), [vacancies[0]])
+            self.assertTrue(os.path.exists(index_path))
+            self.assertEqual(len(self.saver.get_vacancies({"text": "опытом"})), 2)
+            self.assertEqual(self.saver.get_vacancies({"text": "опыт", "salary_from": 120000}), [vacancies[1]])
+
+        # Новый экземпляр использует сохраненный индекс
+        with mock.patch('builtins.print'), mock.patch.object(InvertedIndex, 'add') as mock_add:
+            saver = JSONSaver(path=self.temp_file)
+            self.assertEqual(saver.get_vacancies({"text": "spring"}), [vacancies[1]])
+            mock_add.assert_not_called()
+
+        # Перезапись файла без изменения количества записей и размера делает сохраненный индекс устаревшим
+        with open(self.temp_file, 'r', encoding='utf-8') as file:
+            content = file.read()
+        with open(self.temp_file, 'w', encoding='utf-8') as file:
+            file.write(content.replace("Spring", "Kotlin"))
+        kotlin = dict(vacancies[1], requirement="Опыт работы со Kotlin")
+        with mock.patch('builtins.print'):
+            saver = JSONSaver(path=self.temp_file)
+            self.assertEqual(saver.get_vacancies({"text": "kotlin"}), [kotlin])
+            self.assertEqual(saver.get_vacancies({"text": "spring"}), [])
+        # Поврежденный индекс строится заново
+        with open(index_path, 'w', encoding='utf-8') as file:
+            file.write('{"docs": [')
+        with mock.patch('builtins.print'):
+            self.assertEqual(JSONSaver(path=self.temp_file).get_vacancies({"text": "kotlin"}), [kotlin])
+
+    def test_get_vacancies_with_fuzzy_name(self):
+        # Сохраняем вакансии и ищем по названию с опечаткой
+        vacancies = [
+            {
+                "name": "Python разработчик",
+                "desc": "Москва",
+                "salary_from": 100000,
+                "salary_to": 150000,
+                "currency": "RUB",
+                "url": "https://hh.ru/vacancy/123456",
+                "requirement": "Опыт работы с Django"
+            },
+            {
+                "name": "Аналитик данных",
+                "desc": "Москва",
+                "salary_from": 150000,
+                "salary_to": 200000,
+                "currency": "RUB",
+                "url": "https://hh.ru/vacancy/654321",
+                "requirement": "Знание SQL"
+            }
+        ]
+        self.saver.save({"items": vacancies})
+
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"name": "pyhton разработчик"}), [])
+            self.assertEqual(self.saver.get_vacancies({"fuzzy_name": "pyhton разработчик"}), [vacancies[0]])
+            self.assertEqual(self.saver.get_vacancies({"fuzzy_name": "аналитек", "fuzzy_threshold": 0.5}),
+                             [vacancies[1]])
+
     def test_delete_specific_vacancy(self):
         # Сохраняем несколько вакансий
         vacancies = [
@@ -0,0 +1,72 @@
+import unittest
+from src.schema import FieldSpec, VACANCY_SCHEMA, compile_extractor, compile_field, compile_fields
+
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.specs = (
+            FieldSpec('name', ('name',), 'Без названия'),
+            FieldSpec('city', ('area', 'name'), 'Без описания'),
+            FieldSpec('salary_from', ('salary', 'from')),
+            FieldSpec('currency', ('salary', 'currency'), 'RUB'),
+            FieldSpec('metro', ('address', 'metro', 'station_name'), 'Нет'),
+        )
+
+    def test_compile_extractor_nested_paths_and_defaults(self):
+        """
+        Тестирует извлечение вложенных полей и значения по умолчанию.
+        """
+        extract = compile_extractor(self.specs)
+        raw = {
+            "name": "Python Developer",
+            "area": {"name": "Москва"},
+            "salary": {"from": 100000},
+            "address": {"metro": {"station_name": "Арбатская"}},
+        }
+        self.assertEqual(extract(raw), {"name": "Python Developer", "city": "Москва", "salary_from": 100000,
+                                        "currency": "RUB", "metro": "Арбатская"})
+        # Отсутствующие и пустые промежуточные объекты дают значение по умолчанию
+        self.assertEqual(extract({"salary": None, "address": {}}),
+                         {"name": "Без названия", "city": "Без описания", "salary_from": None,
+                          "currency": "RUB", "metro": "Нет"})
+        # Явное значение None сохраняется
+        self.assertIsNone(extract({"name": None})["name"])
+
+    def test_compile_extractor_with_factory(self):
+        """
+        Тестирует передачу полей в конструктор без промежуточного словаря.
+        """
+        extract = compile_extractor(self.specs[:2], factory=lambda **fields: tuple(sorted(fields.items())))
+        self.assertEqual(extract({"name": "Java"}), (("city", "Без описания"), ("name", "Java")))
+
+    def test_compile_field(self):
+        """
+        Тестирует извлечение отдельного поля и ошибку для промежуточного объекта, не являющегося словарем.
+        """
+        fields = compile_fields(self.specs)
+        self.assertEqual(fields['city']({"area": {"name": "Казань"}}), "Казань")
+        self.assertEqual(compile_field(self.specs[3])({}), "RUB")
+        with self.assertRaises(AttributeError):
+            fields['salary_from']({"salary": "100000"})
+        with self.assertRaises(ValueError):
+            compile_field(FieldSpec('empty', ()))
+
+    def test_interned_fields(self):
+        """
+        Тестирует интернирование строковых значений полей с флагом intern.
+        """
+        extract = compile_field(FieldSpec('employer', ('employer', 'name'), intern=True))
+        first = extract({"employer": {"name": "".join(["Ян", "декс"])}})
+        second = extract({"employer": {"name": "".join(["Янд", "екс"])}})
+        self.assertIs(first, second)
+
+    def test_vacancy_schema_field_names_unique(self):
+        """
+        Тестирует, что поля схемы вакансии не повторяются.
+        """
+        names = [spec.name for spec in VACANCY_SCHEMA]
+        self.assertEqual(len(names), len(set(names)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import tempfile
+import threading
+import os
+from unittest import mock
+from src.jsonl_saver import JSONLSaver
+from src.sharded_saver import ShardedSaver, shard_directory
+
+
+class TestShardedSaver(unittest.TestCase):
+    def setUp(self):
+        # Создаем временную директорию для хранилища
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'shards')
+        self.saver = ShardedSaver(path=self.path)
+        self.python = [
+            {"id": "1", "name": "Python Developer", "salary_from": 100000, "salary_to": 150000,
+             "published_at": "2024-05-01T10:00:00+0300"},
+            {"id": "2", "name": "Senior Python Developer", "salary_from": 250000, "salary_to": None,
+             "published_at": "2024-05-02T09:00:00+0300"},
+        ]
+        self.java = [{"id": "3", "name": "Java Developer", "salary_from": 120000, "salary_to": 180000,
+                      "published_at": "2024-06-01T12:00:00+0300"}]
+        self.saver.save({"items": self.python, "keyword": "python", "crawl_date": "2024-05-02"})
+        self.saver.save({"items": self.java, "keyword": "java", "crawl_date": "2024-06-01"})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_partitions(self):
+        # Вакансии сохраняются в сегменты по ключевому слову и дате сбора, манифест хранит диапазоны
+        shards = self.saver.shards()
+        self.assertEqual([(shard["keyword"], shard["date"], shard["count"]) for shard in shards],
+                         [("java", "2024-06-01", 1), ("python", "2024-05-02", 2)])
+        self.assertEqual(shards[1]["path"], "python/2024-05-02.jsonl")
+        self.assertEqual(shards[1]["stats"]["salary_from"], [100000, 250000])
+        self.assertEqual(shards[1]["stats"]["salary_to"], [150000, 150000])
+        self.assertEqual(ShardedSaver(path=self.path).get_vacancies(), self.java + self.python)
+        # Повторное сохранение не добавляет дубликаты
+        result = self.saver.upsert(self.python, keyword="python", crawl_date="2024-05-02")
+        self.assertEqual(result.unchanged, 2)
+        self.assertEqual(self.saver.shards({"keyword": "python"})[0]["count"], 2)
+        with self.assertRaises(ValueError):
+            self.saver.save({"items": self.python, "crawl_date": "02.05.2024"})
+
+    def test_shard_directory(self):
+        # Ключевые слова с недопустимыми символами не совпадают после замены
+        self.assertEqual(shard_directory("Python"), "python")
+        self.assertNotEqual(shard_directory("c++"), shard_directory("c"))
+        self.assertNotIn("/", shard_directory("../etc"))
+
+    def test_pruning(self):
+        # Сегменты, которые по диапазонам манифеста не содержат подходящих вакансий, не читаются
+        criteria_list = [
+            ({"salary_from": 200000}, ["python"], self.python[1:]),
+            ({"salary_to": 160000}, ["python"], self.python[:1]),
+            ({"crawled_from": "2024-06-01"}, ["java"], self.java),
+            ({"published_to": "2024-05-01"}, ["python"], self.python[:1]),
+            ({"keyword": ["java"], "name": "python"}, ["java"], []),
+            ({"salary_from": 300000}, [], []),
+        ]
+        with mock.patch('builtins.print'):
+            for criteria, keywords, expected in criteria_list:
+                self.assertEqual([shard["keyword"] for shard in self.saver.shards(criteria)], keywords, criteria)
+                with mock.patch.object(JSONLSaver, 'iter_vacancies', autospec=True,
+                                       side_effect=JSONLSaver.iter_vacancies) as mock_iter:
+                    self.assertEqual(self.saver.get_vacancies(criteria), expected, criteria)
+                    self.assertEqual(mock_iter.call_count, len(keywords))
+
+    def test_duplicates_across_shards(self):
+        # Вакансия из нескольких сегментов возвращается один раз, из самого нового
+        updated = dict(self.python[0], salary_from=110000)
+        self.saver.save({"items": [updated], "keyword": "developer", "crawl_date": "2024-05-03"})
+        with mock.patch('builtins.print'):
+            result = self.saver.get_vacancies({"order_by": [("salary_from", "asc")]})
+        self.assertEqual(result, [updated, self.java[0], self.python[1]])
+
+    def test_pruned_newer_copy(self):
+        # Копия из старого сегмента не возвращается, если новая версия отсечена по диапазонам
+        saver = ShardedSaver(path=os.path.join(self.temp_dir.name, 'versions'))
+        saver.save({"items": [{"id": "X", "name": "Developer", "salary_from": 200000}, self.java[0]],
+                    "crawl_date": "2024-01-01"})
+        saver.save({"items": [{"id": "X", "name": "Developer", "salary_from": 50000}], "crawl_date": "2024-01-02"})
+        with mock.patch('builtins.print'):
+            self.assertEqual(saver.get_vacancies({"salary_from": 100000}), self.java)
+            self.assertEqual(saver.get_vacancies({"salary_from": 100000, "crawled_to": "2024-01-01"}),
+                             [{"id": "X", "name": "Developer", "salary_from": 200000}, self.java[0]])
+
+    def test_delete(self):
+        # Удаление по идентификатору затрагивает сегменты с вакансией, удаление всех — все сегменты
+        with mock.patch('builtins.print'):
+            self.saver.delete("2")
+            self.saver.delete("404")
+        self.assertEqual(self.saver.get_vacancies(), self.java + self.python[:1])
+        self.assertEqual(self.saver.shards({"keyword": "python"})[0]["count"], 1)
+        with mock.patch('builtins.print'):
+            self.saver.delete()
+        self.assertEqual(self.saver.shards(), [])
+        self.assertEqual(self.saver.get_vacancies(), [])
+
+    def test_drop_and_archive(self):
+        # Старые сегменты удаляются или переносятся в архив целиком
+        archive_path = os.path.join(self.temp_dir.name, 'archive')
+        self.assertEqual(self.saver.archive(archive_path, before="2024-06-01"), 1)
+        self.assertEqual(self.saver.get_vacancies(), self.java)
+        self.assertFalse(os.path.exists(os.path.join(self.path, 'python')))
+        archive = ShardedSaver(path=archive_path)
+        self.assertEqual(archive.get_vacancies(), self.python)
+        self.assertEqual(archive.shards()[0]["count"], 2)
+        self.assertEqual(self.saver.drop(keyword="python"), 0)
+        self.assertEqual(self.saver.drop(keyword="java"), 1)
+        self.assertEqual(self.saver.get_vacancies(), [])
+
+    def test_drop_waits_for_upsert(self):
+        # Удаление сегмента во время записи в него ждет ее завершения и не оставляет файлов без описания
+        started, release = threading.Event(), threading.Event()
+        upsert = JSONLSaver.upsert
+
+        def slow_upsert(saver, items):
+            started.set()
+            release.wait(5)
+            return upsert(saver, items)
+
+        go = [{"id": "4", "name": "Go Developer", "salary_from": 200000, "salary_to": None}]
+        with mock.patch.object(JSONLSaver, 'upsert', autospec=True, side_effect=slow_upsert):
+            writer = threading.Thread(target=self.saver.upsert, args=(go,), kwargs={"keyword": "go"})
+            writer.start()
+            self.assertTrue(started.wait(5))
+            dropped = []
+            dropper = threading.Thread(target=lambda: dropped.append(ShardedSaver(path=self.path).drop(keyword="go")))
+            dropper.start()
+            dropper.join(0.2)
+            self.assertTrue(dropper.is_alive())
+            release.set()
+            writer.join(5)
+            dropper.join(5)
+        self.assertEqual(dropped, [1])
+        self.assertEqual([shard["keyword"] for shard in self.saver.shards()], ["java", "python"])
+        self.assertFalse(os.path.exists(os.path.join(self.path, 'go')))
+
+    def test_failed_archive_keeps_shard(self):
+        # Если копирование в архив не удалось, сегмент остается в исходном хранилище
+        archive_path = os.path.join(self.temp_dir.name, 'archive')
+        with mock.patch('src.sharded_saver.shutil.copyfile', side_effect=OSError('нет места')):
+            with self.assertRaises(IOError):
+                self.saver.archive(archive_path, keyword="python")
+        self.assertEqual([shard["keyword"] for shard in self.saver.shards()], ["java", "python"])
+        self.assertEqual(ShardedSaver(path=self.path).get_vacancies(), self.java + self.python)
+        self.assertEqual(ShardedSaver(path=archive_path).shards(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import tempfile
+import os
+from unittest import mock
+from src.saver import JSONSaver
+from src.sqlite_saver import SQLiteSaver, fts_query
+
+
+class TestSQLiteSaver(unittest.TestCase):
+    def setUp(self):
+        # Создаем временную директорию и базу данных для тестов
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.saver = SQLiteSaver(path=os.path.join(self.temp_dir.name, 'vacancies.db'))
+        self.vacancies = [
+            {"id": "1", "name": "Python Developer", "desc": "Москва", "salary_from": 100000, "salary_to": 150000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/1", "requirement": "Опыт разработки на Django"},
+            {"id": "2", "name": "Java Developer", "desc": "Москва", "salary_from": None, "salary_to": 200000,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/2", "requirement": "Spring и Kafka"},
+            {"id": "3", "name": "Старший Python-разработчик", "desc": "Казань", "salary_from": 2000,
+             "salary_to": None, "currency": "USD", "url": "https://hh.ru/vacancy/3",
+             "requirement": "Разработчики Python с опытом", "norm_salary_from": 180000, "norm_salary_to": None},
+            {"id": "4", "name": "Аналитик", "desc": "Казань", "salary_from": None, "salary_to": None,
+             "currency": "RUB", "url": "https://hh.ru/vacancy/4", "requirement": "SQL"},
+        ]
+        self.saver.save({"items": self.vacancies})
+
+    def tearDown(self):
+        # Закрываем базу данных и временную директорию
+        self.saver.close()
+        self.temp_dir.cleanup()
+
+    def test_save_without_duplicates(self):
+        # Повторное сохранение не добавляет дубликаты
+        self.saver.save({"items": self.vacancies + [dict(self.vacancies[0])]})
+        self.assertEqual(self.saver.get_vacancies(), self.vacancies)
+        # Измененная вакансия заменяет сохраненную с тем же идентификатором на прежнем месте
+        changed = dict(self.vacancies[1], salary_to=250000, requirement="Spring и Kotlin")
+        self.saver.save({"items": [changed]})
+        self.assertEqual(self.saver.get_vacancies(), [self.vacancies[0], changed] + self.vacancies[2:])
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"text": "kotlin"}), [changed])
+            self.assertEqual(self.saver.get_vacancies({"text": "kafka"}), [])
+
+    def test_save_same_id_twice_in_batch(self):
+        # Из двух версий новой вакансии в одном пакете сохраняется последняя, индекс FTS не повреждается
+        first = {"id": "5", "name": "Go Developer", "requirement": "Docker"}
+        second = dict(first, requirement="Kubernetes")
+        saver = SQLiteSaver(path=os.path.join(self.temp_dir.name, 'batch.db'))
+        try:
+            saver.save({"items": [first, second]})
+            saver.save({"items": [self.vacancies[0], first, self.vacancies[0], second]})
+            self.assertEqual(saver.get_vacancies(), [second, self.vacancies[0]])
+            with mock.patch('builtins.print'):
+                self.assertEqual(saver.get_vacancies({"text": "kubernetes"}), [second])
+                self.assertEqual(saver.get_vacancies({"text": "docker"}), [])
+                saver.delete("5")
+                self.assertEqual(saver.get_vacancies({"text": "developer"}), [self.vacancies[0]])
+        finally:
+            saver.close()
+
+    def test_fts_query(self):
+        # Слова запроса приводятся к основе и ищутся как префиксы
+        self.assertEqual(fts_query("python developers"), '"python"* AND "develop"*')
+        self.assertEqual(fts_query("python java", mode="or"), '"python"* OR "java"*')
+        self.assertIsNone(fts_query("!!!"))
+        with self.assertRaises(ValueError):
+            fts_query("python", mode="xor")
+
+    def test_get_vacancies_filters(self):
+        # Фильтры вычисляются в SQL, зарплата — в базовой валюте
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"name": "python"}), [self.vacancies[0], self.vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"name": "РАЗРАБОТЧИК"}), [self.vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"salary_from": 150000}), [self.vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"salary_to": 180000}), [self.vacancies[0]])
+            self.assertEqual(self.saver.get_vacancies({"salary_overlap": (160000, None)}), self.vacancies[1:3])
+            self.assertEqual(self.saver.get_vacancies({"currency": "USD"}), [self.vacancies[2]])
+            self.assertEqual(self.saver.get_vacancies({"area": "Казань", "salary_from": 0}), [self.vacancies[2]])
+
+    def test_get_vacancies_text_search(self):
+        # Полнотекстовый поиск FTS5 по названию и требованиям с учетом словоформ
+        with mock.patch('builtins.print'):
+            self.assertEqual(self.saver.get_vacancies({"text": "разработчика python"}), [self.vacancies[2]])
+            self.assertEqual(len(self.saver.get_vacancies({"text": "python", "salary_to": 150000})), 1)
+            self.assertEqual(self.saver.get_vacancies({"text": "kafka sql", "text_mode": "or", "top_n": 5,
+                                                       "order_by": [("id", "desc")]}),
+                             [self.vacancies[3], self.vacancies[1]])
+            self.assertEqual(self.saver.get_vacancies({"text": "!!!"}), [])
+
+    def test_get_vacancies_order_and_top_n(self):
+        # Сортировка и ограничение выполняются в SQL и совпадают с JSONSaver
+        json_saver = JSONSaver(path=os.path.join(self.temp_dir.name, 'vacancies.json'))
+        json_saver.save({"items": self.vacancies})
+        with mock.patch('builtins.print'):
+            for criteria in ({"order_by": [("salary_to", "desc")]},
+                             {"order_by": [("avg_salary", "asc", "first"), ("name", "desc")], "top_n": 3},
+                             {"order_by": [("published_at", "asc")], "top_n": 2},
+                             {"top_n": 2},
+                             {"collapse_duplicates": True, "order_by": [("salary_from", "desc")]}):
+                self.assertEqual(self.saver.get_vacancies(criteria), json_saver.get_vacancies(criteria), criteria)
+
+    def test_delete(self):
+        # Удаление по идентификатору и удаление всех вакансий
+        with mock.patch('builtins.print'):
+            self.saver.delete("2")
+            self.assertEqual(self.saver.get_vacancies({"text": "kafka"}), [])
+            self.assertEqual(len(self.saver.get_vacancies()), 3)
+            self.saver.delete()
+        self.assertEqual(self.saver.get_vacancies(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import unittest
+import tempfile
+import os
+from src.text_index import InvertedIndex, TrigramIndex, analyze, stem, tokenize, trigrams, vacancy_text
+
+
+class TestTextAnalysis(unittest.TestCase):
+    def test_tokenize(self):
+        """
+        Тестирует разбиение текста на слова в нижнем регистре.
+        """
+        self.assertEqual(tokenize("Python-разработчик (Senior), C++ и Ёлка"),
+                         ["python", "разработчик", "senior", "c++", "и", "елка"])
+        self.assertEqual(tokenize(""), [])
+
+    def test_stem_russian(self):
+        """
+        Тестирует приведение русских словоформ к общей основе.
+        """
+        self.assertEqual(stem("разработчика"), stem("разработчики"))
+        self.assertEqual(stem("опыт"), stem("опытом"))
+        self.assertEqual(stem("программирования"), stem("программирование"))
+
+    def test_stem_english(self):
+        """
+        Тестирует приведение английских словоформ к общей основе.
+        """
+        self.assertEqual(stem("developers"), "develop")
+        self.assertEqual(stem("developing"), "develop")
+        self.assertEqual(stem("years"), "year")
+        self.assertEqual(stem("class"), "class")
+
+    def test_analyze(self):
+        """
+        Тестирует получение термов из текста.
+        """
+        self.assertEqual(analyze("Python Developers"), ["python", "develop"])
+
+    def test_vacancy_text(self):
+        """
+        Тестирует получение индексируемого текста из записи вакансии.
+        """
+        self.assertEqual(vacancy_text({"name": "Python Developer", "requirement": None}), "Python Developer ")
+
+
+class TestInvertedIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(0, "Python разработчик. Опыт работы с Django")
+        self.index.add(1, "Java разработчик. Опыт работы с Spring")
+        self.index.add(2, "Python Developer. Experience with FastAPI and Python testing")
+        self.index.add(3, "Аналитик данных. Знание SQL")
+
+    def test_search_and(self):
+        """
+        Тестирует поиск документов, содержащих все термы запроса.
+        """
+        result = self.index.search("python разработчики")
+        self.assertEqual([doc_id for doc_id, _ in result], [0])
+
+    def test_search_or_ranked(self):
+        """
+        Тестирует поиск документов, содержащих любой терм запроса, с ранжированием BM25.
+        """
+        result = self.index.search("python django", mode="or")
+        self.assertEqual({doc_id for doc_id, _ in result}, {0, 2})
+        self.assertEqual(result[0][0], 0)
+        self.assertGreater(result[0][1], result[1][1])
+
+    def test_search_limit_and_empty(self):
+        """
+        Тестирует ограничение количества результатов и пустые запросы.
+        """
+        self.assertEqual(len(self.index.search("опыт", limit=1)), 1)
+        self.assertEqual(self.index.search(""), [])
+        self.assertEqual(self.index.search("kotlin"), [])
+
+    def test_search_invalid_mode(self):
+        """
+        Тестирует ошибку при неизвестном режиме поиска.
+        """
+        with self.assertRaises(ValueError):
+            self.index.search("python", mode="not")
+
+    def test_add_is_idempotent(self):
+        """
+        Тестирует, что повторное добавление документа не меняет индекс.
+        """
+        self.index.add(0, "Другой текст")
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.search("другой"), [])
+
+    def test_remove(self):
+        """
+        Тестирует удаление документа и повторное добавление с новым текстом.
+        """
+        self.index.remove(0, "Python разработчик. Опыт работы с Django")
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.search("django"), [])
+        self.index.add(0, "Go разработчик")
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("go")], [0])
+        self.index.remove(9, "Нет такого документа")
+        self.assertEqual(len(self.index), 4)
+
+    def test_save_and_load(self):
+        """
+        Тестирует сохранение индекса в файл и загрузку.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'vacancies.index.json')
+            self.index.save(path)
+            loaded = InvertedIndex.load(path)
+            self.assertEqual(len(loaded), 4)
+            self.assertEqual(loaded.search("python", mode="or"), self.index.search("python", mode="or"))
+            self.assertEqual(len(InvertedIndex.load(os.path.join(temp_dir, 'missing.json'))), 0)
+            # Версия данных сохраняется вместе с индексом, поврежденный файл считается отсутствующим
+            self.index.version = [3, [1, 2]]
+            self.index.save(path)
+            self.assertEqual(InvertedIndex.load(path).version, [3, [1, 2]])
+            self.assertEqual(os.listdir(temp_dir), ['vacancies.index.json'])
+            with open(path, 'r+', encoding='utf-8') as file:
+                file.truncate(10)
+            loaded = InvertedIndex.load(path)
+            self.assertEqual(len(loaded), 0)
+            self.assertIsNone(loaded.version)
+
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TrigramIndex()
+        self.names = ["Python разработчик", "Senior Python Developer", "Java разработчик",
+                      "Тестировщик", "Аналитик данных"]
+        for position, name in enumerate(self.names):
+            self.index.add(position, name)
+
+    def test_trigrams(self):
+        """
+        Тестирует получение триграмм слова с дополнением пробелами.
+        """
+        self.assertEqual(trigrams("Go"), {"  g", " go", "go "})
+        self.assertEqual(trigrams(""), set())
+
+    def test_search_with_typo(self):
+        """
+        Тестирует поиск с опечаткой: точное совпадение по остальным словам ранжируется выше.
+        """
+        result = self.index.search("pyhton разработчик")
+        self.assertEqual(result[0][0], 0)
+        self.assertIn(2, [doc_id for doc_id, _ in result])
+        self.assertNotIn(4, [doc_id for doc_id, _ in result])
+
+    def test_search_threshold_and_limit(self):
+        """
+        Тестирует порог сходства и ограничение количества результатов.
+        """
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("тестировшик", threshold=0.5)], [3])
+        self.assertEqual(self.index.search("тестировшик", threshold=0.95), [])
+        self.assertEqual(len(self.index.search("разработчик", limit=1)), 1)
+        with self.assertRaises(ValueError):
+            self.index.search("python", threshold=0)
+
+    def test_search_matches_brute_force(self):
+        """
+        Тестирует, что отбор кандидатов по спискам вхождений не теряет результатов.
+        """
+        query = "pyhton develper"
+        grams = trigrams(query)
+        expected = {position for position, name in enumerate(self.names)
+                    if len(grams & trigrams(name)) / len(grams) >= 0.3}
+        self.assertEqual({doc_id for doc_id, _ in self.index.search(query, threshold=0.3)}, expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 # tests/vacancy_test.py
 
 import unittest
-from src.vacancy import Vacancy
+from src.fingerprint import record_fingerprint
+from src.vacancy import LazyVacancy, Vacancy
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -225,6 +226,7 @@ class TestVacancy(unittest.TestCase):
             "url": "https://hh.ru/vacancy/123456",
             "requirement": "3+ years of experience"
         }
+        expected_dict["fingerprint"] = record_fingerprint(expected_dict)
         self.assertEqual(vacancy.to_dict(), expected_dict)
 
     def test_vacancy_ordering(self):
@@ -409,6 +411,7 @@ class TestVacancy(unittest.TestCase):
             "url": "https://hh.ru/vacancy/123456",
             "requirement": "3+ years of experience"
         }
+        expected_dict["fingerprint"] = record_fingerprint(expected_dict)
         self.assertEqual(vacancy.to_dict(), expected_dict)
 
     def test_vacancy_ordering(self):
@@ -639,6 +642,7 @@ class TestVacancy(unittest.TestCase):
             "url": "https://hh.ru/vacancy/789012",
             "requirement": "Информация отсутствует"
         }
+        expected_dict["fingerprint"] = record_fingerprint(expected_dict)
         self.assertEqual(vacancy.to_dict(), expected_dict)
 
     def test_vacancy_str_representation(self):
@@ -711,5 +715,164 @@ class TestVacancy(unittest.TestCase):
         self.assertNotEqual(vacancy1, vacancy2)
 
 
+    def test_vacancy_sort_key(self):
+        """
+        Тестирует предвычисленный ключ сортировки и его пересчет при изменении зарплаты.
+        """
+        vacancy = Vacancy(
+            name="Python Developer",
+            desc="Develop Python applications",
+            salary_from=100000,
+            salary_to=150000,
+            url="https://hh.ru/vacancy/123456"
+        )
+        self.assertEqual(vacancy.sort_key, 125000)
+        vacancy.salary_to = 200000
+        self.assertEqual(vacancy.sort_key, 150000)
+        vacancy.salary_rate = 2.0
+        self.assertEqual(vacancy.sort_key, 300000)
+        fingerprint = vacancy.get_fingerprint()
+        vacancy.salary_from = 120000
+        self.assertIsNone(vacancy.fingerprint)
+        self.assertNotEqual(vacancy.get_fingerprint(), fingerprint)
+        no_salary = Vacancy(name="Intern", desc="Internship", url="https://hh.ru/vacancy/1")
+        self.assertEqual(no_salary.sort_key, 0)
+
+    def test_vacancy_sort_by_key_matches_comparisons(self):
+        """
+        Тестирует, что сортировка по sort_key совпадает с сортировкой через сравнение объектов.
+        """
+        from operator import attrgetter
+        vacancies = [
+            Vacancy(name="A", desc="a", salary_from=100000, salary_to=150000),
+            Vacancy(name="B", desc="b"),
+            Vacancy(name="C", desc="c", salary_to=90000),
+            Vacancy(name="D", desc="d", salary_from=200000),
+        ]
+        by_key = sorted(vacancies, key=attrgetter('sort_key'))
+        self.assertEqual([v.name for v in by_key], [v.name for v in sorted(vacancies)])
+        self.assertEqual([v.name for v in by_key], ["B", "C", "A", "D"])
+
+    def test_vacancy_equality_matches_ordering(self):
+        """
+        Тестирует, что равенство согласовано со сравнениями по sort_key.
+        """
+        usd = Vacancy(name="A", desc="a", salary_from=1000, currency="USD")
+        rub = Vacancy(name="B", desc="b", salary_from=90000)
+        usd.salary_rate = 90.0
+        self.assertEqual(usd, rub)
+        self.assertTrue(usd <= rub and usd >= rub)
+        rub.salary_from = 100000
+        self.assertNotEqual(usd, rub)
+        self.assertLess(usd, rub)
+
+
+class TestLazyVacancy(unittest.TestCase):
+    def setUp(self):
+        self.raw = {
+            "name": "Python Developer",
+            "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+            "snippet": {"requirement": "3+ years of experience"},
+            "area": {"name": "Москва"},
+            "url": "https://hh.ru/vacancy/123456"
+        }
+
+    def test_lazy_fields(self):
+        """
+        Тестирует извлечение полей при первом обращении и значения по умолчанию.
+        """
+        view = LazyVacancy(self.raw)
+        self.assertNotIn("name", view.__dict__)
+        self.assertEqual(view.name, "Python Developer")
+        self.assertIn("name", view.__dict__)
+        self.assertEqual(view.desc, "Москва")
+        self.assertEqual(view.sort_key, 125000)
+        empty = LazyVacancy({"name": "Intern"})
+        self.assertEqual(empty.desc, "Без описания")
+        self.assertEqual(empty.currency, "RUB")
+        self.assertIsNone(empty.norm_salary_from)
+        self.assertEqual(empty.requirement, "Информация отсутствует")
+
+    def test_lazy_salary_rate(self):
+        """
+        Тестирует пересчет нормализованной зарплаты после изменения множителя.
+        """
+        view = LazyVacancy(self.raw)
+        self.assertEqual(view.sort_key, 125000)
+        view.salary_rate = 2.0
+        self.assertEqual(view.norm_salary_to, 300000)
+        self.assertEqual(view.sort_key, 250000)
+        vacancy = view.materialize()
+        self.assertEqual(vacancy.sort_key, 250000)
+
+    def test_materialize(self):
+        """
+        Тестирует создание проверенного экземпляра Vacancy из представления.
+        """
+        vacancy = LazyVacancy(self.raw).materialize()
+        self.assertIsInstance(vacancy, Vacancy)
+        expected_dict = {
+            "name": "Python Developer",
+            "desc": "Москва",
+            "salary_from": 100000,
+            "salary_to": 150000,
+            "currency": "RUR",
+            "url": "https://hh.ru/vacancy/123456",
+            "requirement": "3+ years of experience"
+        }
+        expected_dict["fingerprint"] = record_fingerprint(expected_dict)
+        self.assertEqual(vacancy.to_dict(), expected_dict)
+
+    def test_is_valid(self):
+        """
+        Тестирует проверку полей без создания Vacancy.
+        """
+        self.assertTrue(LazyVacancy(self.raw).is_valid())
+        invalid = LazyVacancy({"name": "Developer", "salary": {"from": -1}})
+        self.assertFalse(invalid.is_valid())
+        self.assertIn("salary_from не может быть отрицательным", str(invalid.error))
+        with self.assertRaises(ValueError):
+            invalid.materialize()
+
+    def test_fingerprint(self):
+        """
+        Тестирует отпечаток содержимого: различает вакансии с равной средней зарплатой
+        и не зависит от регистра и пробелов.
+        """
+        first = LazyVacancy(self.raw).materialize()
+        second = LazyVacancy(dict(self.raw, name="Java Developer")).materialize()
+        self.assertEqual(first, second)
+        self.assertNotEqual(first.get_fingerprint(), second.get_fingerprint())
+        same = LazyVacancy(dict(self.raw, name="  python   developer ")).materialize()
+        self.assertEqual(first.get_fingerprint(), same.get_fingerprint())
+        self.assertEqual(len({vac.get_fingerprint() for vac in (first, second, same)}), 2)
+        self.assertTrue(LazyVacancy(dict(self.raw, id="1")).materialize().get_fingerprint().startswith("1:"))
+        # Изменение любого поля содержимого сбрасывает вычисленный отпечаток
+        same.requirement = "Django"
+        self.assertIsNone(same.fingerprint)
+        self.assertNotEqual(same.get_fingerprint(), first.get_fingerprint())
+        self.assertEqual(same.to_dict()["fingerprint"], record_fingerprint(same.to_dict()))
+
+    def test_schema_fields(self):
+        """
+        Тестирует дополнительные поля схемы: извлечение из API и сохранение в словарь.
+        """
+        raw = dict(self.raw, id="93353083", employer={"name": "Яндекс"},
+                   published_at="2024-05-01T10:00:00+0300",
+                   experience={"id": "between1And3", "name": "От 1 года до 3 лет"},
+                   schedule={"id": "fullDay", "name": "Полный день"},
+                   alternate_url="https://hh.ru/vacancy/93353083")
+        view = LazyVacancy(raw)
+        self.assertEqual(view.employer, "Яндекс")
+        vacancy = view.materialize()
+        self.assertEqual(vacancy.experience, "От 1 года до 3 лет")
+        data = vacancy.to_dict()
+        self.assertEqual(data["id"], "93353083")
+        self.assertEqual(data["schedule"], "Полный день")
+        self.assertEqual(data["published_at"], "2024-05-01T10:00:00+0300")
+        self.assertEqual(data["alternate_url"], "https://hh.ru/vacancy/93353083")
+        # Неизвестные поля в словарь не попадают
+        self.assertNotIn("employer", LazyVacancy(self.raw).materialize().to_dict())
+
 if __name__ == '__main__':
     unittest.main()